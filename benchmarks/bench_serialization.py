@@ -0,0 +1,172 @@
+"""Encode-time and bytes-on-wire comparison for a full GET /businesses page.
+
+Run from the repo root:
+
+    python benchmarks/bench_serialization.py [rows]
+
+Compares the encoders a list response can go through and the size of the
+result under the compression middleware's gzip and brotli settings.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("SYNC_JOB_WORKER", "0")
+
+import orjson  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import main  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FIELDS = list(main.BusinessOut.model_fields)
+WORDS = (
+    "owner site mobile booking reviews follow up spring rush quote budget call "
+    "voicemail referral maps photos menu hours checkout slow broken outdated "
+    "template hosting domain renewal competitor ranking google listing payment "
+    "schedule demo meeting partner manager interested pricing tuesday friday"
+).split()
+
+
+def prose(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_rows(n: int) -> list[SimpleNamespace]:
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = []
+    for i in range(n):
+        rows.append(SimpleNamespace(
+            id=i + 1,
+            name=f"Business {i}",
+            slug=f"business-{i}",
+            category=["dental", "bakery", "auto repair", "salon"][i % 4],
+            demo_url=f"https://demo.example.com/business-{i}",
+            existing_website=f"https://business-{i}.example.com",
+            website_quality=i % 10,
+            priority=["hot", "warm", "cold"][i % 3],
+            status=["prospect", "contacted", "responded"][i % 3],
+            contact_name="Jordan Smith",
+            contact_email=f"owner{i}@example.com",
+            contact_phone="555-0100",
+            contact_role="Owner",
+            contact_linkedin="https://linkedin.com/in/example",
+            address=f"{i} Main St, Louisville, KY",
+            platform="WordPress",
+            demo_value_prop=prose(rng, 80),
+            notes=prose(rng, 300),
+            portfolio_card_id="",
+            created_at=now - timedelta(days=i),
+            updated_at=now - timedelta(hours=i),
+        ))
+    return rows
+
+
+def bench(fn, repeat: int = 20) -> tuple[float, bytes]:
+    fn()  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, out
+
+
+def run() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else main.MAX_PAGE_SIZE
+    rows = make_rows(n)
+    tuples = [tuple(getattr(r, f) for f in FIELDS) for r in rows]
+    adapter = TypeAdapter(list[main.BusinessOut])
+
+    def classic():
+        # response_model validation + jsonable_encoder + json.dumps (JSONResponse)
+        models = adapter.validate_python(rows, from_attributes=True)
+        return json.dumps(jsonable_encoder(models), separators=(",", ":")).encode()
+
+    def pydantic_json():
+        # FastAPI's current response_model path: validate, then Rust dump_json
+        return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+    def model_then_orjson():
+        # response_model + ORJSONResponse: validate, dump to Python, orjson
+        models = adapter.validate_python(rows, from_attributes=True)
+        return orjson.dumps(adapter.dump_python(models))
+
+    def tuples_orjson():
+        # Column tuples straight to dicts to orjson, no model instances
+        return orjson.dumps([dict(zip(FIELDS, t)) for t in tuples])
+
+    print(f"{n} rows, ~{len(rows[0].notes) + len(rows[0].demo_value_prop)} chars of free text each\n")
+    print(f"{'encoder':<28}{'ms':>9}{'bytes':>12}")
+    results = {}
+    for name, fn in [
+        ("jsonable_encoder+json", classic),
+        ("pydantic dump_json", pydantic_json),
+        ("pydantic+orjson", model_then_orjson),
+        ("tuples->dicts->orjson", tuples_orjson),
+    ]:
+        ms, body = bench(fn)
+        results[name] = body
+        print(f"{name:<28}{ms:>9.2f}{len(body):>12,}")
+
+    body = results["pydantic dump_json"]
+    print(f"\n{'encoding':<28}{'ms':>9}{'bytes':>12}{'ratio':>8}")
+    codecs = [
+        ("identity", lambda: body),
+        (f"gzip -{main.GZIP_LEVEL}", lambda: main._StreamCompressor("gzip").compress(body, final=True)),
+    ]
+    if brotli:
+        codecs.append(
+            (f"br q{main.BROTLI_QUALITY}", lambda: main._StreamCompressor("br").compress(body, final=True))
+        )
+    for name, fn in codecs:
+        ms, out = bench(fn, repeat=10)
+        print(f"{name:<28}{ms:>9.2f}{len(out):>12,}{len(body) / len(out):>7.1f}x")
+    assert zlib.decompress(codecs[1][1](), 31) == body
+
+    # End to end against in-memory SQLite, fetch included
+    engine = create_engine("sqlite://")
+    main.BusinessDB.__table__.create(engine)
+    with Session(engine) as db:
+        db.execute(
+            main.BusinessDB.__table__.insert(),
+            [{f: getattr(r, f) for f in FIELDS if f != "id"} | {"row_version": 1} for r in rows],
+        )
+        db.commit()
+
+        def orm_rows():
+            # Old list path: hydrate BusinessDB objects, validate, dump_json
+            db.expunge_all()
+            return adapter.dump_json(
+                adapter.validate_python(db.query(main.BusinessDB).all(), from_attributes=True)
+            )
+
+        columns = [getattr(main.BusinessDB, f) for f in FIELDS]
+
+        def column_rows():
+            # Fast path: column SELECT, result tuples, orjson
+            return orjson.dumps(main._row_dicts(FIELDS, db.execute(select(*columns))))
+
+        print(f"\n{'end to end (sqlite)':<28}{'ms':>9}")
+        for name, fn in [("ORM + response_model", orm_rows), ("columns + orjson", column_rows)]:
+            ms, _ = bench(fn, repeat=10)
+            print(f"{name:<28}{ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    run()
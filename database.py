@@ -1,14 +1,127 @@
 """
 Database configuration for Outreach API
-Neon PostgreSQL + pg8000 driver
+Neon PostgreSQL + pg8000 driver, with an asyncpg/aiosqlite engine for async endpoints
 """
+import asyncio
+import contextlib
 import os
 import re
-from sqlalchemy import create_engine
+import sqlite3
+import threading
+import time
+from collections import deque
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects.sqlite.aiosqlite import AsyncAdapt_aiosqlite_connection
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 DATABASE_URL = os.getenv("DATABASE_URL", "")
 
+# Pool settings, applied to the sync and the async engine alike. Neon suspends
+# idle computes and drops their connections, so connections are pinged before
+# use and recycled well before a suspend; LIFO reuses the most recently
+# returned connection and lets the rest idle out.
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+POOL_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "240"))
+POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+POOL_USE_LIFO = os.getenv("DB_POOL_USE_LIFO", "1") == "1"
+# Connections each engine opens at startup, so the first requests skip connect and TLS
+POOL_WARM = int(os.getenv("DB_POOL_WARM", str(POOL_SIZE)))
+
+# Serve the hot read endpoints from the async engine. Off, they run on the
+# threadpool with a sync session, as before the async port: with /sync writers
+# running, async reads measured slower on a single core.
+ASYNC_READS = os.getenv("ASYNC_READS", "0") == "1"
+
+# Checkout waits kept for the percentiles on /admin/pool
+CHECKOUT_SAMPLE_SIZE = 1000
+
+
+class CheckoutStats:
+    """Running totals and recent samples of how long pool checkouts waited."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=CHECKOUT_SAMPLE_SIZE)
+        self.count = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self.count += 1
+            self.timeouts += timed_out
+            self.total += seconds
+            self.max = max(self.max, seconds)
+            self._recent.append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            count, timeouts, total, longest = self.count, self.timeouts, self.total, self.max
+
+        def percentile(p):
+            return round(recent[int(len(recent) * p / 100)] * 1000, 3) if recent else 0.0
+
+        return {
+            "count": count,
+            "timeouts": timeouts,
+            "mean_ms": round(total / count * 1000, 3) if count else 0.0,
+            "p50_ms": percentile(50),
+            "p95_ms": percentile(95),
+            "p99_ms": percentile(99),
+            "max_ms": round(longest * 1000, 3),
+        }
+
+
+class _TimedCheckout:
+    """Times QueuePool._do_get: waiting for a free connection, or opening a new one."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = CheckoutStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self.checkouts.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.checkouts.record(time.perf_counter() - start)
+        return record
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_options(poolclass) -> dict:
+    return {
+        "poolclass": poolclass,
+        "pool_size": POOL_SIZE,
+        "max_overflow": POOL_MAX_OVERFLOW,
+        "pool_timeout": POOL_TIMEOUT,
+        "pool_recycle": POOL_RECYCLE,
+        "pool_pre_ping": POOL_PRE_PING,
+        "pool_use_lifo": POOL_USE_LIFO,
+    }
+
+
+POOL_OPTIONS = _pool_options(InstrumentedQueuePool)
+ASYNC_POOL_OPTIONS = _pool_options(InstrumentedAsyncQueuePool)
+
 # Handle postgres:// vs postgresql:// URL format
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql+pg8000://", 1)
@@ -23,15 +136,38 @@ if "sslmode=" in DATABASE_URL:
 # For local development without database
 if not DATABASE_URL:
     DATABASE_URL = "sqlite:///./outreach.db"
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./outreach.db"
+    engine = create_engine(
+        DATABASE_URL, connect_args={"check_same_thread": False}, **POOL_OPTIONS
+    )
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **ASYNC_POOL_OPTIONS)
 else:
     import ssl
+    # One context for both engines: every connection reuses its settings and
+    # TLS session cache instead of building its own
     ssl_context = ssl.create_default_context()
     ssl_context.check_hostname = False
     ssl_context.verify_mode = ssl.CERT_NONE
-    engine = create_engine(DATABASE_URL, connect_args={"ssl_context": ssl_context})
+    ASYNC_DATABASE_URL = DATABASE_URL.replace("+pg8000", "+asyncpg", 1)
+    engine = create_engine(
+        DATABASE_URL, connect_args={"ssl_context": ssl_context}, **POOL_OPTIONS
+    )
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL, connect_args={"ssl": ssl_context}, **ASYNC_POOL_OPTIONS
+    )
+
+
+@event.listens_for(Engine, "connect")
+def _sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite leaves foreign keys (and so ON DELETE CASCADE) off per connection."""
+    if isinstance(dbapi_connection, (sqlite3.Connection, AsyncAdapt_aiosqlite_connection)):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
 Base = declarative_base()
 
 
@@ -41,3 +177,108 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async requests queue here, in arrival order, for one of the pool's connections.
+# The pool's own wait queue lets a new arrival take a just-returned connection
+# ahead of requests already waiting, so under saturation some of them starve
+# until they hit the pool timeout. Made by open_async_session_gate() in the
+# app's lifespan, so it belongs to the event loop that serves requests.
+_async_session_gate: asyncio.Semaphore | None = None
+
+
+def open_async_session_gate():
+    global _async_session_gate
+    _async_session_gate = asyncio.Semaphore(POOL_SIZE + POOL_MAX_OVERFLOW)
+
+
+class ThreadedSession:
+    """AsyncSession's read calls on a sync Session, for endpoints run whole in
+    a worker thread; every await completes without suspending."""
+
+    def __init__(self, sync_session):
+        self.sync_session = sync_session
+
+    def get_bind(self):
+        return self.sync_session.get_bind()
+
+    async def execute(self, statement, params=None):
+        return self.sync_session.execute(statement, params)
+
+    async def get(self, entity, ident):
+        return self.sync_session.get(entity, ident)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+
+def get_threaded_db():
+    """Session for async read endpoints served on the threadpool (ASYNC_READS off)."""
+    db = SessionLocal()
+    try:
+        yield ThreadedSession(db)
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    """Session for async endpoints; queries await the driver instead of holding a thread.
+
+    Declare it with Depends(get_async_db, scope="function"), so the session
+    and its gate slot are released when the endpoint returns, not once a
+    slow client has read the whole response.
+    """
+    async with _async_session_gate or contextlib.nullcontext():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+
+def _warm_count(pool, connections: int) -> int:
+    """Capped at the pool size: overflow connections are closed again on return,
+    and asking for more than size + overflow would time out at startup."""
+    return min(connections, pool.size()) if isinstance(pool, QueuePool) else 0
+
+
+def warm_pool(engine, connections: int = POOL_WARM):
+    """Open connections up front; on Neon the first one also wakes the compute."""
+    opened = []
+    try:
+        for _ in range(_warm_count(engine.pool, connections)):
+            conn = engine.connect()
+            opened.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in opened:
+            conn.close()
+
+
+async def warm_async_pool(async_engine, connections: int = POOL_WARM):
+    opened = []
+    try:
+        for _ in range(_warm_count(async_engine.pool, connections)):
+            conn = await async_engine.connect()
+            opened.append(conn)
+            await conn.execute(text("SELECT 1"))
+    finally:
+        for conn in opened:
+            await conn.close()
+
+
+def pool_status(engine) -> dict:
+    """Occupancy, settings and checkout waits of an engine's pool."""
+    pool = engine.pool
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        # overflow() counts up from -size as connections are opened
+        status.update(
+            size=pool.size(),
+            max_overflow=POOL_MAX_OVERFLOW,  # as configured; QueuePool has no public getter
+            timeout=pool.timeout(),
+            open=pool.size() + pool.overflow(),
+            in_use=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, _TimedCheckout):
+        status["checkout_wait"] = pool.checkouts.snapshot()
+    return status
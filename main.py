@@ -2,34 +2,93 @@
 Outreach CRM API
 Hidden dashboard backend for projectlavos.com client outreach tracking
 """
+import asyncio
+import base64
 import csv
+import hashlib
 import io
+import json
+import logging
 import os
 import re
+import secrets
+import threading
+import time
+import zlib
+from collections import Counter, deque
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from inspect import signature as _signature
+from typing import Literal
 
 import bcrypt as _bcrypt
 import jwt
-from fastapi import Depends, FastAPI, Header, HTTPException, Request
+import orjson
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError, model_validator
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from sqlalchemy import (
+    DDL,
     Column,
+    Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    and_,
+    case,
+    cast,
+    column,
+    delete,
+    event,
+    false,
     func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    update,
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, relationship
+from starlette.datastructures import Headers, MutableHeaders
+
+from database import (
+    ASYNC_READS,
+    Base,
+    SessionLocal,
+    async_engine,
+    engine,
+    get_async_db,
+    get_db,
+    get_threaded_db,
+    open_async_session_gate,
+    pool_status,
+    warm_async_pool,
+    warm_pool,
+)
+
+try:
+    import brotli
+except ImportError:  # optional: responses fall back to gzip
+    brotli = None
 
-from database import Base, engine, get_db
+logger = logging.getLogger("outreach-api")
 
 # --- Config ---
 
@@ -37,6 +96,40 @@ JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret-change-in-production")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRY_DAYS = 7
 
+# --- Caching ---
+METRICS_CACHE_TTL = float(os.getenv("METRICS_CACHE_TTL", "30"))
+
+# --- Events ---
+EVENT_BATCH_CHUNK = 1000  # rows per multi-row INSERT in POST /events/batch
+
+# --- Sync ---
+SYNC_CHUNK_SIZE = int(os.getenv("SYNC_CHUNK_SIZE", "500"))
+SYNC_MAX_REPORTED_ERRORS = 1000
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl")
+SYNC_JOB_WORKER = os.getenv("SYNC_JOB_WORKER", "1") == "1"
+SYNC_JOB_POLL_SECONDS = float(os.getenv("SYNC_JOB_POLL_SECONDS", "2"))
+SYNC_JOB_STALE_SECONDS = 300  # a running job with no progress this long is reclaimed
+
+# --- Change Feed ---
+CHANGE_REPLAY_SIZE = int(os.getenv("CHANGE_REPLAY_SIZE", "1000"))
+CHANGE_QUEUE_SIZE = int(os.getenv("CHANGE_QUEUE_SIZE", "256"))
+CHANGE_HEARTBEAT_SECONDS = float(os.getenv("CHANGE_HEARTBEAT_SECONDS", "15"))
+
+# --- Export ---
+EXPORT_BATCH_ROWS = 500  # rows fetched per server-side cursor round trip
+EXPORT_FLUSH_BYTES = 64 * 1024  # streamed chunk size
+
+# --- Compression ---
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+# Level 5 gets within ~15% of level 6's size at half the CPU (see benchmarks/)
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "5"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "5"))
+
+# --- Pagination ---
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+DETAIL_EVENTS = 20  # latest events embedded in GET /businesses/{id}
+
 # --- Rate Limiter ---
 limiter = Limiter(key_func=get_remote_address)
 
@@ -88,9 +181,23 @@ class BusinessDB(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    row_version = Column(Integer, nullable=False, default=0, server_default="0")
 
+    # Events go with their business via ON DELETE CASCADE; passive_deletes
+    # keeps the ORM from loading them just to delete them one by one
     events = relationship(
-        "OutreachEventDB", back_populates="business", cascade="all, delete-orphan"
+        "OutreachEventDB",
+        back_populates="business",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index("ix_businesses_status_updated_at", "status", "updated_at"),
+        Index("ix_businesses_updated_at_id", "updated_at", "id"),
+        Index("ix_businesses_priority", "priority"),
+        Index("ix_businesses_category", "category"),
+        Index("ix_businesses_row_version_id", "row_version", "id"),
     )
 
 
@@ -98,13 +205,214 @@ class OutreachEventDB(Base):
     __tablename__ = "outreach_events"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    business_id = Column(Integer, ForeignKey("businesses.id"), nullable=False)
+    business_id = Column(
+        Integer, ForeignKey("businesses.id", ondelete="CASCADE"), nullable=False
+    )
     event_type = Column(String(50), nullable=False)
     details = Column(Text, default="")
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    row_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     business = relationship("BusinessDB", back_populates="events")
 
+    __table_args__ = (
+        Index("ix_outreach_events_business_id_created_at", "business_id", "created_at"),
+        Index("ix_outreach_events_created_at", "created_at"),
+        Index("ix_outreach_events_row_version_id", "row_version", "id"),
+    )
+
+
+# --- Full-Text Search Index ---
+
+# Column -> relevance weight. Postgres maps weights onto tsvector labels A-C.
+SEARCH_COLUMNS = {
+    "name": 10.0,
+    "category": 4.0,
+    "contact_name": 4.0,
+    "contact_email": 4.0,
+    "contact_role": 2.0,
+    "demo_value_prop": 1.0,
+    "notes": 1.0,
+}
+_PG_WEIGHT_LABELS = {10.0: "A", 4.0: "B", 2.0: "C", 1.0: "D"}
+
+
+def _sqlite_fts_ddl() -> list[str]:
+    """FTS5 external-content table over businesses, kept in sync by triggers."""
+    cols = ", ".join(SEARCH_COLUMNS)
+    new_vals = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+    old_vals = ", ".join(f"old.{c}" for c in SEARCH_COLUMNS)
+    weights = ", ".join(str(w) for w in SEARCH_COLUMNS.values())
+    insert_new = f"INSERT INTO businesses_fts(rowid, {cols}) VALUES (new.id, {new_vals});"
+    delete_old = (
+        f"INSERT INTO businesses_fts(businesses_fts, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_vals});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS businesses_fts USING fts5("
+        f"{cols}, content='businesses', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')",
+        f"INSERT INTO businesses_fts(businesses_fts, rank) VALUES ('rank', 'bm25({weights})')",
+        f"CREATE TRIGGER IF NOT EXISTS businesses_fts_ai AFTER INSERT ON businesses "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS businesses_fts_ad AFTER DELETE ON businesses "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS businesses_fts_au AFTER UPDATE OF {cols} ON businesses "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def _postgres_fts_ddl() -> list[str]:
+    """Generated tsvector column plus GIN index; Postgres keeps it current."""
+    parts = " || ".join(
+        f"setweight(to_tsvector('simple'::regconfig, coalesce({c}, '')), "
+        f"'{_PG_WEIGHT_LABELS[w]}')"
+        for c, w in SEARCH_COLUMNS.items()
+    )
+    return [
+        f"ALTER TABLE businesses ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({parts}) STORED",
+        "CREATE INDEX IF NOT EXISTS ix_businesses_search_vector "
+        "ON businesses USING GIN (search_vector)",
+    ]
+
+
+def _postgres_trgm_ddl() -> list[str]:
+    """pg_trgm GIN index backing /businesses/suggest."""
+    return [
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_businesses_name_trgm "
+        "ON businesses USING GIN (name gin_trgm_ops)",
+    ]
+
+
+for _stmt in _sqlite_fts_ddl():
+    event.listen(BusinessDB.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+for _stmt in _postgres_fts_ddl() + _postgres_trgm_ddl():
+    event.listen(BusinessDB.__table__, "after_create", DDL(_stmt).execute_if(dialect="postgresql"))
+event.listen(
+    BusinessDB.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS businesses_fts").execute_if(dialect="sqlite"),
+)
+
+_fts = table("businesses_fts", column("rowid"), column("rank"))
+_search_vector = literal_column("businesses.search_vector")
+_SEARCH_TOKEN = re.compile(r"[^\W_]+")
+
+
+def _search_terms(search: str | None) -> list[str]:
+    return _SEARCH_TOKEN.findall((search or "").lower())
+
+
+def _fts_match(terms: list[str]):
+    return literal_column("businesses_fts").op("MATCH")(
+        " ".join(f'"{t}"*' for t in terms)
+    )
+
+
+def _ts_query(terms: list[str]):
+    return func.to_tsquery("simple", " & ".join(f"{t}:*" for t in terms))
+
+
+def _search_condition(dialect: str, terms: list[str]):
+    """WHERE clause matching every term as a prefix, usable in any statement."""
+    if not terms:  # a search of only punctuation, e.g. "!!!", matches nothing
+        return false()
+    if dialect == "sqlite":
+        return BusinessDB.id.in_(select(_fts.c.rowid).where(_fts_match(terms)))
+    if dialect == "postgresql":
+        return _search_vector.op("@@")(_ts_query(terms))
+    return and_(*[
+        or_(*[getattr(BusinessDB, c).ilike(f"%{t}%") for c in SEARCH_COLUMNS])
+        for t in terms
+    ])
+
+
+def _apply_search(query, dialect: str, terms: list[str]):
+    """Filter a BusinessDB query by full-text match, best matches first."""
+    if dialect == "sqlite":
+        return (
+            query.join(_fts, _fts.c.rowid == BusinessDB.id)
+            .filter(_fts_match(terms))
+            .order_by(_fts.c.rank, BusinessDB.id)
+        )
+    if dialect == "postgresql":
+        tsq = _ts_query(terms)
+        return query.filter(_search_vector.op("@@")(tsq)).order_by(
+            func.ts_rank(_search_vector, tsq).desc(), BusinessDB.id
+        )
+    return query.filter(_search_condition(dialect, terms)).order_by(
+        BusinessDB.updated_at.desc(), BusinessDB.id.desc()
+    )
+
+
+class MetricCounterDB(Base):
+    """Rollup: businesses per status, priority and category value."""
+    __tablename__ = "metric_counters"
+
+    dimension = Column(String(20), primary_key=True)  # status/priority/category
+    value = Column(String(200), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class EventDailyCountDB(Base):
+    """Rollup: outreach events per UTC day and event_type."""
+    __tablename__ = "event_daily_counts"
+
+    day = Column(Date, primary_key=True)
+    event_type = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class SyncJobDB(Base):
+    """A queued POST /sync?async=true payload, processed by the job worker."""
+    __tablename__ = "sync_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    status = Column(String(20), default="pending")  # pending/running/done/failed
+    payload = Column(Text, default="")  # JSON list of SyncItem fields; cleared when done
+    total = Column(Integer, default=0)
+    processed = Column(Integer, default=0)
+    created = Column(Integer, default=0)
+    updated = Column(Integer, default=0)
+    error_count = Column(Integer, default=0)
+    errors = Column(Text, default="[]")
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (Index("ix_sync_jobs_status_updated_at", "status", "updated_at"),)
+
+
+class RowVersionCounterDB(Base):
+    """Single-row counter that hands out row_version values."""
+    __tablename__ = "row_version_counter"
+
+    id = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+class TombstoneDB(Base):
+    """A deleted row, kept so /sync/pull can tell replicas to drop it."""
+    __tablename__ = "tombstones"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    entity = Column(String(20), nullable=False)  # business
+    entity_id = Column(Integer, nullable=False)
+    row_version = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (Index("ix_tombstones_row_version_id", "row_version", "id"),)
+
+
+class SchemaVersionDB(Base):
+    __tablename__ = "schema_version"
+
+    version = Column(Integer, primary_key=True)
+    description = Column(String(200), default="")
+    applied_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
 
 # --- Pydantic Models ---
 
@@ -181,6 +489,68 @@ class BusinessOut(BaseModel):
         from_attributes = True
 
 
+class BusinessListItem(BaseModel):
+    """A GET /businesses row; only the selected ?fields= are present."""
+    id: int | None = None
+    name: str | None = None
+    slug: str | None = None
+    category: str | None = None
+    demo_url: str | None = None
+    existing_website: str | None = None
+    website_quality: int | None = None
+    priority: str | None = None
+    status: str | None = None
+    contact_name: str | None = None
+    contact_email: str | None = None
+    contact_phone: str | None = None
+    contact_role: str | None = None
+    contact_linkedin: str | None = None
+    address: str | None = None
+    platform: str | None = None
+    demo_value_prop: str | None = None
+    notes: str | None = None
+    portfolio_card_id: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class SyncJobOut(BaseModel):
+    id: int
+    status: str
+    total: int
+    processed: int
+    created: int
+    updated: int
+    error_count: int
+    errors: list[dict]
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None
+
+
+class BusinessFilter(BaseModel):
+    """Row filters shared by listing, export and bulk endpoints."""
+    status: str | None = None
+    category: str | None = None  # case-insensitive substring
+    priority: str | None = None
+    search: str | None = None  # full-text, every term as a prefix
+    updated_since: datetime | None = None
+
+
+class BusinessBulkUpdate(BaseModel):
+    """PATCH /businesses body: which rows (ids and/or filter) and what to set."""
+    ids: list[int] | None = None
+    filter: BusinessFilter | None = None
+    update: BusinessUpdate
+
+
+class BusinessSuggestion(BaseModel):
+    id: int
+    name: str
+    slug: str
+    status: str
+
+
 class SendEmailRequest(BaseModel):
     subject: str
     body: str
@@ -192,6 +562,21 @@ class EventCreate(BaseModel):
     details: str = ""
 
 
+class EventBatchItem(BaseModel):
+    """One POST /events/batch record; identifies its business by id or slug."""
+    business_id: int | None = None
+    slug: str | None = None
+    event_type: str
+    details: str = ""
+    created_at: datetime | None = None  # defaults to now; set it when replaying history
+
+    @model_validator(mode="after")
+    def _one_reference(self):
+        if (self.business_id is None) == (self.slug is None):
+            raise ValueError("Give exactly one of business_id or slug")
+        return self
+
+
 class EventOut(BaseModel):
     id: int
     business_id: int
@@ -204,7 +589,42 @@ class EventOut(BaseModel):
 
 
 class BusinessDetail(BusinessOut):
-    events: list[EventOut] = []
+    events: list[EventOut] = []  # newest first, at most ?events= of them
+    event_count: int = 0
+
+
+class BusinessVersionOut(BusinessOut):
+    row_version: int
+
+
+class EventVersionOut(EventOut):
+    row_version: int
+
+
+class TombstoneOut(BaseModel):
+    id: int
+    entity: str
+    entity_id: int
+    row_version: int
+    deleted_at: datetime
+
+
+class SyncPullOut(BaseModel):
+    version: int  # pass as ?since= once next_cursor is null
+    businesses: list[BusinessVersionOut]
+    events: list[EventVersionOut]
+    tombstones: list[TombstoneOut]
+    next_cursor: str | None
+
+
+class BusinessPage(BaseModel):
+    items: list[BusinessListItem]
+    next_cursor: str | None  # null on the last page
+
+
+class EventPage(BaseModel):
+    items: list[EventOut]
+    next_cursor: str | None  # null on the last page
 
 
 class SyncItem(BaseModel):
@@ -246,7 +666,9 @@ def verify_token(token: str) -> dict:
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
-def require_auth(authorization: str = Header(None)) -> dict:
+# Dependencies shared with async endpoints are async def themselves: a sync
+# dependency would still cost each request a threadpool hop.
+async def require_auth(authorization: str = Header(None)) -> dict:
     if not authorization:
         raise HTTPException(status_code=401, detail="Missing authorization header")
     token = authorization.replace("Bearer ", "")
@@ -261,33 +683,727 @@ def slugify(name: str) -> str:
     return slug.strip('-')
 
 
+# --- Write Generation ---
+
+# Bumped after every committed business/event write. In-process caches
+# compare against it to know when they are stale.
+_write_generation = 0
+_generation_lock = threading.Lock()
+
+
+def _bump_generation() -> int:
+    global _write_generation
+    with _generation_lock:
+        _write_generation += 1
+        return _write_generation
+
+
+# --- Row Versions ---
+
+
+def _next_version(db: Session) -> int:
+    """Allocate the next row_version inside the caller's transaction.
+
+    The counter row stays locked until commit, so versions become visible in
+    the order they were handed out and /sync/pull never skips past a write
+    that commits late.
+    """
+    table = RowVersionCounterDB.__table__
+    stmt = _upsert(db, table).values(id=1, value=1)
+    stmt = stmt.on_conflict_do_update(index_elements=["id"], set_={"value": table.c.value + 1})
+    return db.execute(stmt.returning(table.c.value)).scalar_one()
+
+
+def _current_version(db: Session) -> int:
+    """Highest committed row_version."""
+    return db.execute(select(RowVersionCounterDB.value)).scalar() or 0
+
+
+# --- Change Feed ---
+
+
+class _Subscriber:
+    """One /changes/stream connection: a bounded queue drained on its own loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, size: int):
+        self.loop = loop
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=size)
+        self.overflowed = False
+
+    def push(self, messages: list[str]):
+        for message in messages:
+            if self.overflowed:
+                return
+            try:
+                self.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.overflowed = True
+
+
+class ChangeBroker:
+    """In-process fan-out of committed writes to SSE subscribers.
+
+    Every record gets a sequence number and stays in a ring buffer so
+    reconnecting clients can replay what they missed. SSE ids are
+    "<epoch>-<seq>": the epoch is random per broker, so an id from before a
+    restart (when seq starts over) is never mistaken for one of ours. Publishing
+    never blocks the writer: a subscriber whose queue fills up is marked
+    overflowed and its stream ends, and the client resumes via Last-Event-ID.
+    """
+
+    def __init__(self, replay_size: int = CHANGE_REPLAY_SIZE, queue_size: int = CHANGE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._history: deque[tuple[int, str]] = deque(maxlen=replay_size)
+        self._subscribers: set[_Subscriber] = set()
+        self._seq = 0
+        self._lock = threading.Lock()
+        self.epoch = secrets.token_hex(4)
+
+    @property
+    def last_id(self) -> int:
+        return self._seq
+
+    def clear(self):
+        """Forget the replay window; sequence numbers keep counting."""
+        with self._lock:
+            self._history.clear()
+
+    def publish(self, records: list[dict]):
+        """Fan records out to every subscriber. Safe to call from any thread."""
+        with self._lock:
+            messages = []
+            for record in records:
+                self._seq += 1
+                data = json.dumps(record, separators=(",", ":"))
+                message = f"id: {self.epoch}-{self._seq}\nevent: change\ndata: {data}\n\n"
+                self._history.append((self._seq, message))
+                messages.append(message)
+            # Scheduled under the lock so every subscriber sees one global order
+            for sub in list(self._subscribers):
+                try:
+                    sub.loop.call_soon_threadsafe(sub.push, messages)
+                except RuntimeError:  # event loop already closed
+                    self._subscribers.discard(sub)
+
+    def since(self, last_id: int) -> list[str] | None:
+        """Messages after last_id, or None if the replay window no longer covers it."""
+        with self._lock:
+            return self._since(last_id)
+
+    def _since(self, last_id: int) -> list[str] | None:
+        oldest = self._history[0][0] if self._history else self._seq + 1
+        if last_id > self._seq or last_id < oldest - 1:
+            return None
+        return [message for seq, message in self._history if seq > last_id]
+
+    def subscribe(self, last_event_id: str | None = None) -> tuple[_Subscriber, list[str]]:
+        """Register a subscriber; returns it with the messages to send first.
+
+        When last_event_id has fallen out of the replay window, or comes from
+        another epoch (an earlier process), the backlog is a single reset
+        event telling the client to refetch its state.
+        """
+        sub = _Subscriber(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers.add(sub)
+            if last_event_id is None:
+                return sub, []
+            epoch, _, seq = last_event_id.partition("-")
+            backlog = self._since(int(seq)) if epoch == self.epoch and seq.isdigit() else None
+            if backlog is None:
+                backlog = [f"id: {self.epoch}-{self._seq}\nevent: reset\ndata: {{}}\n\n"]
+            return sub, backlog
+
+    def unsubscribe(self, sub: _Subscriber):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+
+_change_broker = ChangeBroker()
+
+
+def _change(entity: str, id: int, op: str, version: int, fields=None) -> dict:
+    record = {"entity": entity, "id": id, "op": op, "version": version}
+    if fields:
+        record["fields"] = sorted(fields)
+    return record
+
+
+def _record_change(changes: list[dict]):
+    """Call after committing a write: invalidates caches and feeds /changes/stream."""
+    _bump_generation()
+    if changes:
+        _change_broker.publish(changes)
+
+
+# --- Metric Rollups ---
+
+# Write endpoints accumulate signed deltas in Counters and apply them in the
+# same transaction as the write, so /metrics never has to scan the tables.
+ROLLUP_DIMENSIONS = ("status", "priority", "category")
+
+
+def _upsert(db, table):
+    """Dialect-specific INSERT that supports on_conflict_do_update()."""
+    if db.get_bind().dialect.name == "postgresql":
+        return pg_insert(table)
+    return sqlite_insert(table)
+
+
+def _count_business(deltas: Counter, status, priority, category, n: int = 1):
+    for dim, val in zip(ROLLUP_DIMENSIONS, (status, priority, category)):
+        deltas[(dim, val or "")] += n
+
+
+def _count_event(deltas: Counter, created_at: datetime, event_type: str, n: int = 1):
+    deltas[(created_at.date(), event_type)] += n
+
+
+def _apply_business_rollups(db: Session, deltas: Counter):
+    rows = [
+        {"dimension": dim, "value": val, "count": n}
+        for (dim, val), n in deltas.items() if n
+    ]
+    if not rows:
+        return
+    stmt = _upsert(db, MetricCounterDB.__table__).values(rows)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["dimension", "value"],
+        set_={"count": MetricCounterDB.__table__.c.count + stmt.excluded.count},
+    ))
+
+
+def _apply_event_rollups(db: Session, deltas: Counter):
+    rows = [
+        {"day": day, "event_type": event_type, "count": n}
+        for (day, event_type), n in deltas.items() if n
+    ]
+    if not rows:
+        return
+    stmt = _upsert(db, EventDailyCountDB.__table__).values(rows)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=["day", "event_type"],
+        set_={"count": EventDailyCountDB.__table__.c.count + stmt.excluded.count},
+    ))
+
+
+def _event_day():
+    return func.date(OutreachEventDB.created_at, type_=Date)
+
+
+def _rebuild_rollups(db):
+    """Recompute every rollup row from the base tables (Session or Connection)."""
+    business_deltas = Counter()
+    rows = db.execute(
+        select(BusinessDB.status, BusinessDB.priority, BusinessDB.category, func.count())
+        .group_by(BusinessDB.status, BusinessDB.priority, BusinessDB.category)
+    )
+    for status, priority, category, n in rows:
+        _count_business(business_deltas, status, priority, category, n)
+
+    day = _event_day()
+    event_rows = db.execute(
+        select(day, OutreachEventDB.event_type, func.count())
+        .where(OutreachEventDB.created_at.is_not(None))
+        .group_by(day, OutreachEventDB.event_type)
+    ).all()
+
+    db.execute(delete(MetricCounterDB))
+    db.execute(delete(EventDailyCountDB))
+    counters = [
+        {"dimension": dim, "value": val, "count": n}
+        for (dim, val), n in business_deltas.items()
+    ]
+    if counters:
+        db.execute(MetricCounterDB.__table__.insert(), counters)
+    daily = [
+        {"day": d, "event_type": event_type, "count": n}
+        for d, event_type, n in event_rows
+    ]
+    if daily:
+        db.execute(EventDailyCountDB.__table__.insert(), daily)
+    return {"counters": len(counters), "event_days": len(daily)}
+
+
+# --- Conditional Requests ---
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag."""
+    if not if_none_match:
+        return False
+    bare = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == bare:
+            return True
+    return False
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Stored timestamps come back naive; they are UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _modified_since(if_modified_since: str | None, last_modified: datetime | None) -> bool:
+    """False only when If-Modified-Since is valid and covers last_modified.
+
+    HTTP dates have second precision, so last_modified is truncated to match.
+    """
+    if not if_modified_since or last_modified is None:
+        return True
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return True
+    if since.tzinfo is None:
+        return True
+    return _as_utc(last_modified).replace(microsecond=0) > since
+
+
+def _not_modified(
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> bool:
+    """RFC 9110 precedence: If-Modified-Since only counts without If-None-Match."""
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    return not _modified_since(if_modified_since, last_modified)
+
+
+# --- Filters ---
+
+
+def _as_utc_naive(value: datetime) -> datetime:
+    """Timestamps are stored as naive UTC; normalize aware inputs to match."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def business_filter(
+    status: str | None = None,
+    category: str | None = None,
+    priority: str | None = None,
+    search: str | None = None,
+    updated_since: datetime | None = None,
+) -> BusinessFilter:
+    """Query-string form of BusinessFilter, for use with Depends()."""
+    return BusinessFilter(
+        status=status,
+        category=category,
+        priority=priority,
+        search=search,
+        updated_since=updated_since,
+    )
+
+
+# Large Text columns the list leaves out unless asked for by name
+LIST_DEFERRED_FIELDS = ("demo_value_prop", "notes")
+LIST_DEFAULT_FIELDS = [f for f in BusinessOut.model_fields if f not in LIST_DEFERRED_FIELDS]
+
+
+async def business_fields(fields: str | None = None) -> list[str]:
+    """Parse ?fields=a,b,c (or * for every field) into BusinessOut field names."""
+    if fields is None:
+        return LIST_DEFAULT_FIELDS
+    if fields.strip() == "*":
+        return list(BusinessOut.model_fields)
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = sorted(requested - BusinessOut.model_fields.keys())
+    if unknown or not requested:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return [f for f in BusinessOut.model_fields if f in requested]
+
+
+def _business_conditions(
+    dialect: str, filters: BusinessFilter, include_search: bool = True
+) -> list:
+    """WHERE clauses for a BusinessFilter; usable in SELECT, UPDATE and DELETE."""
+    conditions = []
+    if filters.status:
+        conditions.append(BusinessDB.status == filters.status)
+    if filters.category:
+        conditions.append(BusinessDB.category.ilike(f"%{filters.category}%"))
+    if filters.priority:
+        conditions.append(BusinessDB.priority == filters.priority)
+    if filters.updated_since:
+        conditions.append(BusinessDB.updated_at >= _as_utc_naive(filters.updated_since))
+    if include_search and filters.search and filters.search.strip():
+        conditions.append(_search_condition(dialect, _search_terms(filters.search)))
+    return conditions
+
+
+# --- Cursor Helpers ---
+
+
+def _encode_cursor(payload: dict) -> str:
+    """Pack a keyset position into an opaque, URL-safe cursor string."""
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> dict:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return payload
+
+
+# --- Async Reads ---
+
+
+def _async_read(endpoint):
+    """Without ASYNC_READS, serve an async read endpoint as a sync one on the threadpool.
+
+    Its session becomes a ThreadedSession, whose awaits never suspend, so the
+    endpoint's coroutine runs to completion inside the worker thread.
+    """
+    if ASYNC_READS:
+        return endpoint
+
+    # No functools.wraps: FastAPI follows __wrapped__ and would await the result
+    def threaded(**kwargs):
+        coroutine = endpoint(**kwargs)
+        try:
+            coroutine.send(None)
+        except StopIteration as done:
+            return done.value
+        coroutine.close()
+        raise RuntimeError(f"{endpoint.__name__} suspended outside the event loop")
+
+    signature = _signature(endpoint)
+    threaded.__signature__ = signature.replace(parameters=[
+        p.replace(default=Depends(get_threaded_db, scope="function")) if p.name == "db" else p
+        for p in signature.parameters.values()
+    ])
+    threaded.__name__, threaded.__doc__ = endpoint.__name__, endpoint.__doc__
+    return threaded
+
+
+# --- Responses ---
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (fastapi's own is deprecated).
+
+    Returning one from a route skips response_model validation entirely,
+    which is where the per-row cost of large responses goes (see
+    benchmarks/bench_serialization.py). The route's response_model still
+    documents the schema in OpenAPI.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _row_dicts(fields: list[str], rows) -> list[dict]:
+    """Result tuples whose leading columns are `fields`, as plain dicts.
+
+    Only for trusted database rows selected to match the route's
+    response_model; nothing is validated on the way out.
+    """
+    return [dict(zip(fields, row)) for row in rows]
+
+
+BUSINESS_OUT_FIELDS = list(BusinessOut.model_fields)
+EVENT_OUT_FIELDS = list(EventOut.model_fields)
+
+
+# --- Compression ---
+
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+)
+
+
+def _compressible(content_type: str) -> bool:
+    media = content_type.split(";")[0].strip().lower()
+    if media == "text/event-stream":
+        return False  # per-event flushing matters more than size
+    return media.startswith("text/") or media.endswith("+json") or media in COMPRESSIBLE_TYPES
+
+
+def _negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick br or gzip from Accept-Encoding, honouring q-values."""
+    available = ("br", "gzip") if brotli else ("gzip",)
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name.strip()] = q
+    best = None
+    for encoding in available:  # preference order breaks ties
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > 0 and (best is None or q > best[1]):
+            best = (encoding, q)
+    return best[0] if best else None
+
+
+class _StreamCompressor:
+    """Incremental gzip/brotli; flushes per chunk so streamed bodies stay streamed."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._br = None
+            self._gz = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self._br:
+            out = self._br.process(data)
+            return out + (self._br.finish() if final else self._br.flush())
+        out = self._gz.compress(data)
+        return out + self._gz.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """Negotiated br/gzip for compressible responses of at least minimum_size.
+
+    Streamed responses are always compressed (their size isn't known up
+    front); event streams and bodies that already carry a Content-Encoding
+    pass through untouched. A strong ETag is weakened on compressed
+    responses, since the encoded bytes differ from the identity body's.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = _negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor = None
+
+        async def send_compressed(message):
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                start = message  # held back until the first body chunk decides
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                headers = MutableHeaders(raw=start["headers"])
+                eligible = "content-encoding" not in headers and _compressible(
+                    headers.get("content-type", "")
+                )
+                if eligible:
+                    headers.add_vary_header("Accept-Encoding")
+                if eligible and (more_body or len(body) >= self.minimum_size):
+                    compressor = _StreamCompressor(encoding)
+                    headers["Content-Encoding"] = encoding
+                    if "content-length" in headers:
+                        del headers["content-length"]
+                    etag = headers.get("etag")
+                    if etag and not etag.startswith("W/"):
+                        headers["ETag"] = f"W/{etag}"
+                await send(start)
+                start = None
+            if compressor:
+                message = {**message, "body": compressor.compress(body, final=not more_body)}
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
+
+
 # --- App Setup ---
 
 
-def _run_migrations():
+def _migrate_contact_columns(conn):
     """Add columns that create_all() won't add to existing tables."""
-    from sqlalchemy import inspect, text
+    existing = [c["name"] for c in inspect(conn).get_columns("businesses")]
+    migrations = [
+        ("contact_linkedin", "VARCHAR(500) DEFAULT ''"),
+        ("address", "VARCHAR(500) DEFAULT ''"),
+        ("platform", "VARCHAR(200) DEFAULT ''"),
+    ]
+    for col_name, col_type in migrations:
+        if col_name not in existing:
+            conn.execute(text(
+                f'ALTER TABLE businesses ADD COLUMN {col_name} {col_type}'
+            ))
+
+
+def _migrate_secondary_indexes(conn):
+    """Create the filter/sort indexes declared on the models.
+
+    Indexes on columns that a later migration adds are created by that migration.
+    """
+    for tbl in (BusinessDB.__table__, OutreachEventDB.__table__):
+        columns = {c["name"] for c in inspect(conn).get_columns(tbl.name)}
+        for index in tbl.indexes:
+            if {c.name for c in index.columns} <= columns:
+                index.create(conn, checkfirst=True)
+
+
+def _migrate_full_text_search(conn):
+    """Build the search index for rows that predate it."""
+    if conn.dialect.name == "sqlite":
+        for stmt in _sqlite_fts_ddl():
+            conn.execute(text(stmt))
+        conn.execute(text("INSERT INTO businesses_fts(businesses_fts) VALUES ('rebuild')"))
+    elif conn.dialect.name == "postgresql":
+        for stmt in _postgres_fts_ddl():
+            conn.execute(text(stmt))
+
+
+def _migrate_trigram_index(conn):
+    if conn.dialect.name == "postgresql":
+        for stmt in _postgres_trgm_ddl():
+            conn.execute(text(stmt))
+
+
+def _migrate_metric_rollups(conn):
+    """Seed the rollup tables from existing rows."""
+    MetricCounterDB.__table__.create(conn, checkfirst=True)
+    EventDailyCountDB.__table__.create(conn, checkfirst=True)
+    _rebuild_rollups(conn)
+
+
+def _migrate_row_versions(conn):
+    """Add row_version columns and tables; existing rows all become version 1."""
+    RowVersionCounterDB.__table__.create(conn, checkfirst=True)
+    TombstoneDB.__table__.create(conn, checkfirst=True)
+    if conn.execute(select(RowVersionCounterDB.value)).first() is None:
+        conn.execute(RowVersionCounterDB.__table__.insert().values(id=1, value=1))
+    for tbl in (BusinessDB.__table__, OutreachEventDB.__table__):
+        existing = [c["name"] for c in inspect(conn).get_columns(tbl.name)]
+        if "row_version" not in existing:
+            conn.execute(text(
+                f"ALTER TABLE {tbl.name} ADD COLUMN row_version INTEGER NOT NULL DEFAULT 0"
+            ))
+        conn.execute(tbl.update().where(tbl.c.row_version == 0).values(row_version=1))
+        for index in tbl.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def _migrate_event_cascade(conn):
+    """Recreate the outreach_events foreign key with ON DELETE CASCADE.
+
+    SQLite cannot alter a constraint, so the table is rebuilt; events whose
+    business no longer exists cannot satisfy the new constraint and are dropped.
+    """
+    if conn.dialect.name == "postgresql":
+        for fk in inspect(conn).get_foreign_keys("outreach_events"):
+            if fk["referred_table"] != "businesses":
+                continue
+            if fk["options"].get("ondelete", "").upper() == "CASCADE":
+                return
+            name = fk["name"]
+            conn.execute(text(
+                f'ALTER TABLE outreach_events DROP CONSTRAINT "{name}", '
+                f'ADD CONSTRAINT "{name}" FOREIGN KEY (business_id) '
+                "REFERENCES businesses (id) ON DELETE CASCADE"
+            ))
+    elif conn.dialect.name == "sqlite":
+        ddl = conn.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'outreach_events'"
+        )).scalar()
+        if "ON DELETE CASCADE" in ddl.upper():
+            return
+        events = OutreachEventDB.__table__
+        conn.execute(text("ALTER TABLE outreach_events RENAME TO outreach_events_old"))
+        for index in events.indexes:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+        events.create(conn)
+        columns = ", ".join(c.name for c in events.columns)
+        orphans = conn.execute(text(
+            "SELECT count(*) FROM outreach_events_old "
+            "WHERE business_id NOT IN (SELECT id FROM businesses)"
+        )).scalar()
+        conn.execute(text(
+            f"INSERT INTO outreach_events ({columns}) SELECT {columns} "
+            "FROM outreach_events_old WHERE business_id IN (SELECT id FROM businesses)"
+        ))
+        conn.execute(text("DROP TABLE outreach_events_old"))
+        if orphans:
+            _rebuild_rollups(conn)
+
+
+# Append-only: each entry runs once per database, in order, and is recorded
+# in schema_version. Migrations must be safe on a fresh create_all() schema.
+MIGRATIONS = [
+    (1, "contact_linkedin, address and platform columns", _migrate_contact_columns),
+    (2, "secondary indexes on businesses and outreach_events", _migrate_secondary_indexes),
+    (3, "full-text search index over businesses", _migrate_full_text_search),
+    (4, "pg_trgm index on business names", _migrate_trigram_index),
+    (5, "metric rollup tables", _migrate_metric_rollups),
+    (6, "row versions and tombstones for /sync/pull", _migrate_row_versions),
+    (7, "ON DELETE CASCADE from outreach_events to businesses", _migrate_event_cascade),
+]
+
+
+def _run_migrations():
+    """Apply pending MIGRATIONS and record each one in schema_version."""
     with engine.connect() as conn:
-        inspector = inspect(engine)
-        existing = [c["name"] for c in inspector.get_columns("businesses")]
-        migrations = [
-            ("contact_linkedin", "VARCHAR(500) DEFAULT ''"),
-            ("address", "VARCHAR(500) DEFAULT ''"),
-            ("platform", "VARCHAR(200) DEFAULT ''"),
-        ]
-        for col_name, col_type in migrations:
-            if col_name not in existing:
-                conn.execute(text(
-                    f'ALTER TABLE businesses ADD COLUMN {col_name} {col_type}'
-                ))
+        SchemaVersionDB.__table__.create(conn, checkfirst=True)
         conn.commit()
+        applied = set(conn.execute(select(SchemaVersionDB.version)).scalars())
+        for version, description, migrate in MIGRATIONS:
+            if version in applied:
+                continue
+            migrate(conn)
+            try:
+                conn.execute(
+                    SchemaVersionDB.__table__.insert().values(
+                        version=version,
+                        description=description,
+                        applied_at=datetime.now(timezone.utc),
+                    )
+                )
+                conn.commit()
+            except IntegrityError:
+                # Another instance applied this version concurrently
+                conn.rollback()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)
     _run_migrations()
+    warm_pool(engine)
+    if ASYNC_READS:
+        await warm_async_pool(async_engine)
+    open_async_session_gate()
+    _suggest_index.clear()
+    _metrics_cache.clear()
+    _change_broker.clear()
+    worker = asyncio.create_task(_sync_job_worker()) if SYNC_JOB_WORKER else None
     yield
+    if worker:
+        worker.cancel()
+    await async_engine.dispose()
 
 
 app = FastAPI(title="Outreach CRM API", version="1.0.0", lifespan=lifespan)
@@ -300,7 +1416,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
 )
+app.add_middleware(CompressionMiddleware)
 
 
 # --- Auth Endpoints ---
@@ -325,49 +1443,381 @@ def verify_auth(user: dict = Depends(require_auth)):
 # --- Business CRUD ---
 
 
-@app.get("/businesses", response_model=list[BusinessOut])
-def list_businesses(
-    status: str | None = None,
-    category: str | None = None,
-    priority: str | None = None,
-    search: str | None = None,
+@app.get(
+    "/businesses", response_model=BusinessPage, response_model_exclude_unset=True
+)
+@_async_read
+async def list_businesses(
+    filters: BusinessFilter = Depends(business_filter),
+    fields: list[str] = Depends(business_fields),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
+    user: dict = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
+    """List businesses newest-first, one page at a time.
+
+    With ``search``, results are ranked by full-text relevance instead.
+    The body is ``{items, next_cursor}``; while ``next_cursor`` is not null,
+    pass it back as ``?cursor=`` for the next page.
+
+    Rows carry every field except ``notes`` and ``demo_value_prop`` unless
+    ``?fields=`` names the columns to select (``*`` for all).
+    """
+    # Any write to businesses allocates a new row_version, so the counter
+    # plus the normalized query identifies the page without reading it.
+    version, *written = (await db.execute(_list_stamp())).one()
+    last_modified = max(filter(None, written), default=None)
+    etag = _list_etag(version or 0, filters, fields, limit, cursor)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    if _not_modified(if_none_match, if_modified_since, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    dialect = db.get_bind().dialect.name
+    # updated_at and id are always selected: the next cursor is built from them
+    columns = dict.fromkeys([*fields, "updated_at", "id"])
+    terms = _search_terms(filters.search)
+    query = select(*[getattr(BusinessDB, c) for c in columns]).where(
+        *_business_conditions(dialect, filters, include_search=not terms)
+    )
+    after = _decode_cursor(cursor) if cursor else {}
+
+    if terms:
+        # Relevance order can't be seeked on, so ranked pages use offsets
+        query = _apply_search(query, dialect, terms)
+        try:
+            offset = max(int(after.get("o", 0)), 0)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        rows = (await db.execute(query.offset(offset).limit(limit + 1))).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor({"o": offset + limit})
+        return ORJSONResponse(
+            {"items": _row_dicts(fields, rows), "next_cursor": next_cursor}, headers=headers
+        )
+
+    if after:
+        try:
+            after_ts = datetime.fromisoformat(after["u"])
+            after_id = int(after["i"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.where(
+            or_(
+                BusinessDB.updated_at < after_ts,
+                and_(BusinessDB.updated_at == after_ts, BusinessDB.id < after_id),
+            )
+        )
+    rows = (await db.execute(
+        query.order_by(BusinessDB.updated_at.desc(), BusinessDB.id.desc()).limit(limit + 1)
+    )).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor({"u": last.updated_at.isoformat(), "i": last.id})
+    return ORJSONResponse(
+        {"items": _row_dicts(fields, rows), "next_cursor": next_cursor}, headers=headers
+    )
+
+
+def _list_stamp():
+    """One statement: the row_version counter and the latest business update and delete.
+
+    Both are table-wide, not max(updated_at) of the filtered rows: a row
+    updated out of the filter, or deleted, changes the page without
+    raising that. Deletes are dated by their tombstone.
+    """
+    last_update = select(func.max(BusinessDB.updated_at)).scalar_subquery()
+    last_delete = (
+        select(TombstoneDB.deleted_at)
+        .where(TombstoneDB.entity == "business")
+        .order_by(TombstoneDB.row_version.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return select(select(RowVersionCounterDB.value).scalar_subquery(), last_update, last_delete)
+
+
+def _list_etag(
+    version: int, filters: BusinessFilter, fields: list[str], limit: int, cursor: str | None
+) -> str:
+    params = filters.model_dump()
+    params["fields"] = fields
+    params["search"] = " ".join(_search_terms(filters.search)) or (filters.search or "").strip()
+    if filters.updated_since:
+        params["updated_since"] = _as_utc_naive(filters.updated_since)
+    key = json.dumps(
+        {**params, "limit": limit, "cursor": cursor}, sort_keys=True, default=_json_default
+    )
+    # "p" since the {items, next_cursor} body; bare-list ETags ("l") no longer match
+    return f'W/"p{version}-{hashlib.sha1(key.encode()).hexdigest()[:16]}"'
+
+
+# --- Typeahead ---
+
+SUGGEST_MIN_SCORE = 0.5
+
+
+def _trigrams(value: str) -> set[str]:
+    """pg_trgm-style trigrams: each word padded with two leading spaces and one trailing."""
+    grams = set()
+    for word in _SEARCH_TOKEN.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TrigramIndex:
+    """In-process trigram index over business names.
+
+    Fallback for databases without pg_trgm (local SQLite). Refreshed lazily
+    when the write generation moves: rows touched since the last refresh are
+    re-indexed, and a row-count mismatch (deletes) triggers a full rebuild.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._postings: dict[str, set[int]] = {}
+        self._entries: dict[int, tuple[str, str, str, frozenset]] = {}
+        self._generation = None
+        self._high_water = None
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def _remove(self, biz_id: int):
+        entry = self._entries.pop(biz_id, None)
+        if entry:
+            for gram in entry[3]:
+                self._postings[gram].discard(biz_id)
+
+    def _add(self, biz_id: int, name: str, slug: str, status: str):
+        grams = frozenset(_trigrams(name))
+        self._entries[biz_id] = (name, slug, status, grams)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(biz_id)
+
+    def _load(self, db: Session):
+        query = db.query(
+            BusinessDB.id, BusinessDB.name, BusinessDB.slug,
+            BusinessDB.status, BusinessDB.updated_at,
+        )
+        if self._high_water is not None:
+            query = query.filter(BusinessDB.updated_at >= self._high_water)
+        for biz_id, name, slug, status, updated_at in query:
+            self._remove(biz_id)
+            self._add(biz_id, name, slug, status or "")
+            if updated_at and (self._high_water is None or updated_at > self._high_water):
+                self._high_water = updated_at
+
+    def refresh(self, db: Session):
+        with self._lock:
+            generation = _write_generation
+            if generation == self._generation:
+                return
+            self._load(db)
+            if db.query(func.count(BusinessDB.id)).scalar() != len(self._entries):
+                self._reset()
+                self._load(db)
+            self._generation = generation
+
+    def search(self, q: str, limit: int) -> list[dict]:
+        query_grams = _trigrams(q)
+        if not query_grams:
+            return []
+        with self._lock:
+            hits = Counter()
+            for gram in query_grams:
+                hits.update(self._postings.get(gram, ()))
+            scored = []
+            for biz_id, shared in hits.items():
+                score = shared / len(query_grams)
+                if score < SUGGEST_MIN_SCORE:
+                    continue
+                name, slug, status, grams = self._entries[biz_id]
+                similarity = shared / len(query_grams | grams)
+                scored.append((-score, -similarity, name, biz_id, slug, status))
+        scored.sort()
+        return [
+            {"id": biz_id, "name": name, "slug": slug, "status": status}
+            for _, _, name, biz_id, slug, status in scored[:limit]
+        ]
+
+
+_suggest_index = TrigramIndex()
+
+
+@app.get("/businesses/suggest", response_model=list[BusinessSuggestion])
+def suggest_businesses(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(8, ge=1, le=25),
     user: dict = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
-    query = db.query(BusinessDB)
-    if status:
-        query = query.filter(BusinessDB.status == status)
-    if category:
-        query = query.filter(BusinessDB.category.ilike(f"%{category}%"))
-    if priority:
-        query = query.filter(BusinessDB.priority == priority)
-    if search:
-        query = query.filter(
-            BusinessDB.name.ilike(f"%{search}%")
-            | BusinessDB.notes.ilike(f"%{search}%")
+    """Fuzzy name lookup for the dashboard quick-jump box."""
+    if db.get_bind().dialect.name == "postgresql":
+        rows = (
+            db.query(BusinessDB.id, BusinessDB.name, BusinessDB.slug, BusinessDB.status)
+            .filter(literal(q).op("<%")(BusinessDB.name))
+            .order_by(func.word_similarity(q, BusinessDB.name).desc(), BusinessDB.name)
+            .limit(limit)
+            .all()
         )
-    return query.order_by(BusinessDB.updated_at.desc()).all()
+        return [row._asdict() for row in rows]
+    _suggest_index.refresh(db)
+    return _suggest_index.search(q, limit)
+
+
+def _detail_headers(business_id: int, row_version: int, updated_at: datetime | None) -> dict:
+    # Adding an event bumps the business's updated_at and row_version too
+    updated = int(_as_utc(updated_at).timestamp() * 1_000_000) if updated_at else 0
+    headers = {
+        "ETag": f'W/"b{business_id}-{row_version}-{updated}"',
+        "Cache-Control": "private, no-cache",
+    }
+    if updated_at:
+        headers["Last-Modified"] = format_datetime(_as_utc(updated_at), usegmt=True)
+    return headers
+
+
+# Newest first; events synced without a created_at sort after all dated ones
+EVENT_TIMELINE_ORDER = (OutreachEventDB.created_at.desc().nulls_last(), OutreachEventDB.id.desc())
+
+
+def _detail_statement(business_id: int, events: int):
+    """One statement: the business (repeated per event row), its event count,
+    and its latest events via a LIMITed IN subquery on the timeline index."""
+    latest = (
+        select(OutreachEventDB.id)
+        .where(OutreachEventDB.business_id == business_id)
+        .order_by(*EVENT_TIMELINE_ORDER)
+        .limit(events)
+        .correlate(None)
+    )
+    event_count = (
+        select(func.count())
+        .select_from(OutreachEventDB)
+        .where(OutreachEventDB.business_id == business_id)
+        .correlate(None)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            *[getattr(BusinessDB, f) for f in BUSINESS_OUT_FIELDS],
+            BusinessDB.row_version,
+            event_count,
+            *[getattr(OutreachEventDB, f).label(f"event_{f}") for f in EVENT_OUT_FIELDS],
+        )
+        .select_from(BusinessDB)
+        .outerjoin(
+            OutreachEventDB,
+            and_(OutreachEventDB.business_id == BusinessDB.id, OutreachEventDB.id.in_(latest)),
+        )
+        .where(BusinessDB.id == business_id)
+        .order_by(*EVENT_TIMELINE_ORDER)
+    )
+
+
+def _detail_response(business_id: int, rows) -> ORJSONResponse:
+    n = len(BUSINESS_OUT_FIELDS)
+    first = rows[0]
+    body = dict(zip(BUSINESS_OUT_FIELDS, first))
+    body["events"] = [
+        dict(zip(EVENT_OUT_FIELDS, row[n + 2:])) for row in rows if row[n + 2] is not None
+    ]
+    body["event_count"] = first[n + 1]
+    headers = _detail_headers(business_id, first[n], body["updated_at"])
+    return ORJSONResponse(body, headers=headers)
 
 
 @app.get("/businesses/{business_id}", response_model=BusinessDetail)
-def get_business(
+@_async_read
+async def get_business(
     business_id: int,
+    events: int = Query(DETAIL_EVENTS, ge=0, le=MAX_PAGE_SIZE),
+    if_none_match: str | None = Header(None),
+    if_modified_since: str | None = Header(None),
     user: dict = Depends(require_auth),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
 ):
-    biz = db.query(BusinessDB).filter(BusinessDB.id == business_id).first()
-    if not biz:
+    """A business with its latest events and total event count.
+
+    Page through the full timeline with GET /businesses/{id}/events.
+    """
+    if if_none_match is not None or if_modified_since is not None:
+        # Index-only probe first; a 304 never loads the row or its events
+        stamp = (await db.execute(
+            select(BusinessDB.row_version, BusinessDB.updated_at).where(BusinessDB.id == business_id)
+        )).first()
+        if not stamp:
+            raise HTTPException(status_code=404, detail="Business not found")
+        headers = _detail_headers(business_id, stamp.row_version, stamp.updated_at)
+        if _not_modified(if_none_match, if_modified_since, headers["ETag"], stamp.updated_at):
+            return Response(status_code=304, headers=headers)
+
+    rows = (await db.execute(_detail_statement(business_id, events))).all()
+    if not rows:
         raise HTTPException(status_code=404, detail="Business not found")
-    events = (
-        db.query(OutreachEventDB)
-        .filter(OutreachEventDB.business_id == business_id)
-        .order_by(OutreachEventDB.created_at.desc())
-        .all()
-    )
-    return BusinessDetail(
-        **{c.name: getattr(biz, c.name) for c in biz.__table__.columns},
-        events=[EventOut.model_validate(e) for e in events],
+    return _detail_response(business_id, rows)
+
+
+@app.get("/businesses/{business_id}/events", response_model=EventPage)
+@_async_read
+async def list_business_events(
+    business_id: int,
+    event_type: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    user: dict = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
+    """A business's events newest-first, one page at a time.
+
+    The body is ``{items, next_cursor}``; pass a non-null ``next_cursor``
+    back as ``?cursor=`` for the next page.
+    """
+    stmt = select(*[getattr(OutreachEventDB, f) for f in EVENT_OUT_FIELDS]).where(
+        OutreachEventDB.business_id == business_id
     )
+    if event_type:
+        stmt = stmt.where(OutreachEventDB.event_type == event_type)
+    if cursor:
+        after = _decode_cursor(cursor)
+        try:
+            after_ts = None if after["c"] is None else datetime.fromisoformat(after["c"])
+            after_id = int(after["i"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        if after_ts is None:
+            stmt = stmt.where(OutreachEventDB.created_at.is_(None), OutreachEventDB.id < after_id)
+        else:
+            stmt = stmt.where(or_(
+                OutreachEventDB.created_at < after_ts,
+                and_(OutreachEventDB.created_at == after_ts, OutreachEventDB.id < after_id),
+                OutreachEventDB.created_at.is_(None),
+            ))
+    rows = (await db.execute(stmt.order_by(*EVENT_TIMELINE_ORDER).limit(limit + 1))).all()
+    if not rows and not await db.get(BusinessDB, business_id):
+        raise HTTPException(status_code=404, detail="Business not found")
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        created_at = last.created_at.isoformat() if last.created_at else None
+        next_cursor = _encode_cursor({"c": created_at, "i": last.id})
+    return ORJSONResponse({"items": _row_dicts(EVENT_OUT_FIELDS, rows), "next_cursor": next_cursor})
 
 
 @app.post("/businesses", response_model=BusinessOut)
@@ -380,10 +1830,15 @@ def create_business(
     existing = db.query(BusinessDB).filter(BusinessDB.slug == slug).first()
     if existing:
         raise HTTPException(status_code=400, detail="Business with this slug exists")
-    biz = BusinessDB(slug=slug, **data.model_dump(exclude={"slug"}))
+    version = _next_version(db)
+    biz = BusinessDB(slug=slug, row_version=version, **data.model_dump(exclude={"slug"}))
     db.add(biz)
+    deltas = Counter()
+    _count_business(deltas, biz.status, biz.priority, biz.category)
+    _apply_business_rollups(db, deltas)
     db.commit()
     db.refresh(biz)
+    _record_change([_change("business", biz.id, "create", version)])
     return biz
 
 
@@ -394,32 +1849,169 @@ def update_business(
     user: dict = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
+    # Taken first: the counter row lock keeps other writers out until commit,
+    # so the old values the rollups subtract are the ones being replaced
+    version = _next_version(db)
     biz = db.query(BusinessDB).filter(BusinessDB.id == business_id).first()
     if not biz:
         raise HTTPException(status_code=404, detail="Business not found")
+    deltas = Counter()
+    _count_business(deltas, biz.status, biz.priority, biz.category, -1)
     update_data = data.model_dump(exclude_none=True)
+    changed = [key for key, val in update_data.items() if getattr(biz, key) != val]
     for key, val in update_data.items():
         setattr(biz, key, val)
     biz.updated_at = datetime.now(timezone.utc)
+    biz.row_version = version
+    _count_business(deltas, biz.status, biz.priority, biz.category)
+    _apply_business_rollups(db, deltas)
     db.commit()
+    _record_change([
+        _change("business", business_id, "update", biz.row_version, changed + ["updated_at"])
+    ])
     db.refresh(biz)
     return biz
 
 
+def _delete_businesses(db: Session, conditions: list) -> tuple[list[int], int]:
+    """Delete every business matching conditions in one DELETE.
+
+    Rollup deltas and tombstones are computed set-based beforehand; the
+    events go with their businesses through ON DELETE CASCADE.
+    Returns the deleted ids and the row version of the tombstones.
+    """
+    # Taken first so the pre-queries see exactly the rows the DELETE removes
+    version = _next_version(db)
+
+    business_deltas = Counter()
+    dims = [getattr(BusinessDB, d) for d in ROLLUP_DIMENSIONS]
+    for status, priority, category, n in db.execute(
+        select(*dims, func.count()).where(*conditions).group_by(*dims)
+    ):
+        _count_business(business_deltas, status, priority, category, -n)
+    day = _event_day()
+    matched = select(BusinessDB.id).where(*conditions)
+    event_deltas = Counter({
+        (d, event_type): -n
+        for d, event_type, n in db.execute(
+            select(day, OutreachEventDB.event_type, func.count())
+            .where(OutreachEventDB.business_id.in_(matched))
+            .where(OutreachEventDB.created_at.is_not(None))
+            .group_by(day, OutreachEventDB.event_type)
+        )
+    })
+
+    db.execute(
+        insert(TombstoneDB).from_select(
+            ["entity", "entity_id", "row_version", "deleted_at"],
+            select(
+                literal("business"),
+                BusinessDB.id,
+                literal(version),
+                literal(datetime.now(timezone.utc), DateTime),
+            ).where(*conditions),
+        )
+    )
+    deleted_ids = db.execute(
+        delete(BusinessDB.__table__).where(*conditions).returning(BusinessDB.id)
+    ).scalars().all()
+    _apply_business_rollups(db, business_deltas)
+    _apply_event_rollups(db, event_deltas)
+    return deleted_ids, version
+
+
 @app.delete("/businesses/{business_id}")
 def delete_business(
     business_id: int,
     user: dict = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
-    biz = db.query(BusinessDB).filter(BusinessDB.id == business_id).first()
-    if not biz:
+    deleted_ids, version = _delete_businesses(db, [BusinessDB.id == business_id])
+    if not deleted_ids:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Business not found")
-    db.delete(biz)
     db.commit()
+    _record_change([_change("business", business_id, "delete", version)])
     return {"status": "deleted", "id": business_id}
 
 
+def _bulk_conditions(db: Session, ids: list[int] | None, filters: BusinessFilter | None) -> list:
+    """WHERE clauses for bulk endpoints; refuses to match the whole table by accident."""
+    conditions = []
+    if ids is not None:
+        conditions.append(BusinessDB.id.in_(ids))
+    if filters is not None:
+        conditions += _business_conditions(db.get_bind().dialect.name, filters)
+    if not conditions:
+        raise HTTPException(status_code=422, detail="Provide ids or at least one filter")
+    return conditions
+
+
+@app.patch("/businesses")
+def bulk_update_businesses(
+    data: BusinessBulkUpdate,
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Apply one partial update to every business matching ids and/or filter.
+
+    Runs as a single UPDATE; returns how many rows it changed.
+    """
+    values = data.update.model_dump(exclude_none=True)
+    if not values:
+        raise HTTPException(status_code=422, detail="Nothing to update")
+    conditions = _bulk_conditions(db, data.ids, data.filter)
+    # Taken first: the counter row lock keeps other writers out until commit,
+    # so the rollup pre-query below sees exactly the rows the UPDATE changes
+    version = _next_version(db)
+
+    deltas = Counter()
+    if values.keys() & set(ROLLUP_DIMENSIONS):
+        dims = [getattr(BusinessDB, d) for d in ROLLUP_DIMENSIONS]
+        for status, priority, category, n in db.execute(
+            select(*dims, func.count()).where(*conditions).group_by(*dims)
+        ):
+            _count_business(deltas, status, priority, category, -n)
+            _count_business(
+                deltas,
+                values.get("status", status),
+                values.get("priority", priority),
+                values.get("category", category),
+                n,
+            )
+
+    now = datetime.now(timezone.utc)
+    updated_ids = db.execute(
+        update(BusinessDB.__table__)
+        .where(*conditions)
+        .values(**values, updated_at=now, row_version=version)
+        .returning(BusinessDB.id)
+    ).scalars().all()
+    _apply_business_rollups(db, deltas)
+    db.commit()
+    fields = [*values, "updated_at"]
+    _record_change([_change("business", i, "update", version, fields) for i in updated_ids])
+    return {"updated": len(updated_ids)}
+
+
+@app.delete("/businesses")
+def bulk_delete_businesses(
+    ids: list[int] | None = Query(None),
+    filters: BusinessFilter = Depends(business_filter),
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Delete every business matching ?ids= and/or the list filters, with their events.
+
+    Runs as a single DELETE; returns how many businesses it removed.
+    """
+    conditions = _bulk_conditions(db, ids, filters)
+    deleted_ids, version = _delete_businesses(db, conditions)
+    db.commit()
+    _record_change([_change("business", i, "delete", version) for i in deleted_ids])
+    return {"deleted": len(deleted_ids)}
+
+
 # --- Events ---
 
 
@@ -433,14 +2025,97 @@ def create_event(
     biz = db.query(BusinessDB).filter(BusinessDB.id == business_id).first()
     if not biz:
         raise HTTPException(status_code=404, detail="Business not found")
-    event = OutreachEventDB(business_id=business_id, **data.model_dump())
+    now = datetime.now(timezone.utc)
+    version = _next_version(db)
+    event = OutreachEventDB(
+        business_id=business_id, created_at=now, row_version=version, **data.model_dump()
+    )
     db.add(event)
-    biz.updated_at = datetime.now(timezone.utc)
+    biz.updated_at = now
+    biz.row_version = version
+    deltas = Counter()
+    _count_event(deltas, now, event.event_type)
+    _apply_event_rollups(db, deltas)
     db.commit()
     db.refresh(event)
+    _record_change([
+        _change("event", event.id, "create", version),
+        _change("business", business_id, "update", version, ["updated_at"]),
+    ])
     return event
 
 
+@app.post("/events/batch")
+def create_events_batch(
+    items: list[EventBatchItem],
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Log many events at once, all or nothing.
+
+    Business references are resolved in one query; if any is unknown
+    nothing is written and the response lists the offending items.
+    """
+    ids = {item.business_id for item in items if item.business_id is not None}
+    slugs = {item.slug for item in items if item.slug is not None}
+    by_id, by_slug = set(), {}
+    if items:
+        for biz_id, slug in db.execute(
+            select(BusinessDB.id, BusinessDB.slug).where(
+                or_(BusinessDB.id.in_(sorted(ids)), BusinessDB.slug.in_(sorted(slugs)))
+            )
+        ):
+            by_id.add(biz_id)
+            by_slug[slug] = biz_id
+
+    errors = []
+    for index, item in enumerate(items):
+        if item.slug is not None and item.slug not in by_slug:
+            errors.append({"index": index, "error": f"Unknown slug {item.slug!r}"})
+        elif item.business_id is not None and item.business_id not in by_id:
+            errors.append({"index": index, "error": f"Unknown business_id {item.business_id}"})
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+    if not items:
+        return {"created": 0, "businesses": 0}
+
+    now = datetime.now(timezone.utc)
+    version = _next_version(db)
+    deltas = Counter()
+    rows = []
+    for item in items:
+        created_at = _as_utc_naive(item.created_at) if item.created_at else now
+        rows.append({
+            "business_id": item.business_id if item.slug is None else by_slug[item.slug],
+            "event_type": item.event_type,
+            "details": item.details,
+            "created_at": created_at,
+            "row_version": version,
+        })
+        _count_event(deltas, created_at, item.event_type)
+
+    event_ids = []
+    for start in range(0, len(rows), EVENT_BATCH_CHUNK):
+        event_ids += db.execute(
+            insert(OutreachEventDB)
+            .values(rows[start:start + EVENT_BATCH_CHUNK])
+            .returning(OutreachEventDB.id)
+        ).scalars().all()
+    touched = sorted({row["business_id"] for row in rows})
+    db.execute(
+        update(BusinessDB)
+        .where(BusinessDB.id.in_(touched))
+        .values(updated_at=now, row_version=version)
+    )
+    _apply_event_rollups(db, deltas)
+    db.commit()
+    _record_change(
+        [_change("event", event_id, "create", version) for event_id in event_ids]
+        + [_change("business", biz_id, "update", version, ["updated_at"]) for biz_id in touched]
+    )
+    return {"created": len(event_ids), "businesses": len(touched)}
+
+
 # --- Send Email ---
 
 SMTP_EMAIL = os.getenv("SMTP_EMAIL", "")
@@ -487,19 +2162,42 @@ def send_email(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to send: {e}")
 
+    # Re-read under the version lock: the row may have changed during the send
+    version = _next_version(db)
+    biz = db.get(BusinessDB, business_id, populate_existing=True)
+    if not biz:
+        raise HTTPException(status_code=404, detail="Business not found")
+
     # Log outreach event
+    now = datetime.now(timezone.utc)
     event = OutreachEventDB(
         business_id=business_id,
         event_type="email_sent",
         details=f"To: {data.to_email} | Subject: {data.subject}",
+        created_at=now,
+        row_version=version,
     )
     db.add(event)
+    event_deltas = Counter()
+    _count_event(event_deltas, now, event.event_type)
+    _apply_event_rollups(db, event_deltas)
 
     # Auto-update status from prospect to contacted
+    changed = ["updated_at"]
     if biz.status == "prospect":
+        changed.append("status")
+        business_deltas = Counter()
+        _count_business(business_deltas, biz.status, biz.priority, biz.category, -1)
         biz.status = "contacted"
-    biz.updated_at = datetime.now(timezone.utc)
+        _count_business(business_deltas, biz.status, biz.priority, biz.category)
+        _apply_business_rollups(db, business_deltas)
+    biz.updated_at = now
+    biz.row_version = version
     db.commit()
+    _record_change([
+        _change("event", event.id, "create", version),
+        _change("business", business_id, "update", version, changed),
+    ])
 
     return {"status": "sent", "to": data.to_email, "business_id": business_id}
 
@@ -507,50 +2205,124 @@ def send_email(
 # --- Metrics ---
 
 
-@app.get("/metrics")
-def get_metrics(
-    user: dict = Depends(require_auth),
-    db: Session = Depends(get_db),
-):
-    total = db.query(BusinessDB).count()
+METRIC_STATUSES = ["prospect", "contacted", "responded", "meeting", "closed", "lost"]
+METRIC_PRIORITIES = ["hot", "warm", "cold"]
 
-    # Status breakdown
-    status_counts = {}
-    for s in ["prospect", "contacted", "responded", "meeting", "closed", "lost"]:
-        status_counts[s] = (
-            db.query(BusinessDB).filter(BusinessDB.status == s).count()
-        )
 
-    # Priority breakdown
-    priority_counts = {}
-    for p in ["hot", "warm", "cold"]:
-        priority_counts[p] = (
-            db.query(BusinessDB).filter(BusinessDB.priority == p).count()
+def _week_bucket(dialect: str, col):
+    """SQL equivalent of Python's ``strftime('%Y-W%W')`` (Monday-start weeks)."""
+    if dialect == "postgresql":
+        # %W = (day_of_year_0 + 7 - weekday_mon0) // 7. Constants are inlined
+        # so the SELECT and GROUP BY render identically under positional
+        # paramstyles.
+        week = func.floor(
+            (func.extract("doy", col) + literal_column("7") - func.extract("isodow", col))
+            / literal_column("7")
+        )
+        return func.concat(
+            func.to_char(col, literal_column("'YYYY'")), literal_column("'-W'"),
+            func.lpad(cast(cast(week, Integer), String), literal_column("2"), literal_column("'0'")),
+        )
+    return func.strftime("%Y-W%W", col)
+
+
+def _activity_cutoff() -> datetime:
+    """Start of the weekly_activity window: midnight UTC eight weeks ago."""
+    cutoff = datetime.now(timezone.utc) - timedelta(weeks=8)
+    return cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _compute_metrics(db: Session) -> dict:
+    """Dashboard metrics straight from the base tables, one GROUP BY per table.
+
+    Used to audit the rollups; /metrics itself reads _metrics_from_rollups().
+    """
+    status_cols = [
+        func.sum(case((BusinessDB.status == s, 1), else_=0)) for s in METRIC_STATUSES
+    ]
+    priority_cols = [
+        func.sum(case((BusinessDB.priority == p, 1), else_=0)) for p in METRIC_PRIORITIES
+    ]
+    total_events_col = select(func.count(OutreachEventDB.id)).scalar_subquery()
+    rows = (
+        db.query(
+            BusinessDB.category,
+            func.count(BusinessDB.id),
+            total_events_col,
+            *status_cols,
+            *priority_cols,
         )
-
-    # Category breakdown
-    cat_rows = (
-        db.query(BusinessDB.category, func.count(BusinessDB.id))
         .group_by(BusinessDB.category)
         .all()
     )
-    category_counts = {row[0] or "Uncategorized": row[1] for row in cat_rows}
+
+    total = 0
+    total_events = 0
+    status_counts = dict.fromkeys(METRIC_STATUSES, 0)
+    priority_counts = dict.fromkeys(METRIC_PRIORITIES, 0)
+    category_counts = {}
+    for category, count, total_events, *breakdown in rows:
+        total += count
+        label = category or "Uncategorized"
+        category_counts[label] = category_counts.get(label, 0) + count
+        for s, n in zip(METRIC_STATUSES, breakdown[:len(METRIC_STATUSES)]):
+            status_counts[s] += n or 0
+        for p, n in zip(METRIC_PRIORITIES, breakdown[len(METRIC_STATUSES):]):
+            priority_counts[p] += n or 0
 
     # Activity timeline (events per week, last 8 weeks)
-    eight_weeks_ago = datetime.now(timezone.utc) - timedelta(weeks=8)
-    recent_events = (
-        db.query(OutreachEventDB)
-        .filter(OutreachEventDB.created_at >= eight_weeks_ago)
+    week = _week_bucket(db.get_bind().dialect.name, OutreachEventDB.created_at)
+    weekly_activity = dict(
+        db.query(week, func.count(OutreachEventDB.id))
+        .filter(OutreachEventDB.created_at >= _activity_cutoff())
+        .group_by(week)
         .all()
     )
+
+    return _metrics_response(
+        total, status_counts, priority_counts, category_counts,
+        weekly_activity, total_events,
+    )
+
+
+def _metrics_from_rollups(db: Session) -> dict:
+    """Dashboard metrics from the rollup tables; cost is independent of row counts."""
+    status_counts = dict.fromkeys(METRIC_STATUSES, 0)
+    priority_counts = dict.fromkeys(METRIC_PRIORITIES, 0)
+    category_counts = {}
+    total = 0
+    for dim, value, count in db.query(
+        MetricCounterDB.dimension, MetricCounterDB.value, MetricCounterDB.count
+    ).filter(MetricCounterDB.count != 0):
+        if dim == "status" and value in status_counts:
+            status_counts[value] = count
+        elif dim == "priority" and value in priority_counts:
+            priority_counts[value] = count
+        elif dim == "category":
+            total += count
+            label = value or "Uncategorized"
+            category_counts[label] = category_counts.get(label, 0) + count
+
+    cutoff_day = _activity_cutoff().date()
+    total_events = 0
     weekly_activity = {}
-    for event in recent_events:
-        week = event.created_at.strftime("%Y-W%W")
-        weekly_activity[week] = weekly_activity.get(week, 0) + 1
+    for day, count in db.query(
+        EventDailyCountDB.day, func.sum(EventDailyCountDB.count)
+    ).group_by(EventDailyCountDB.day):
+        total_events += count
+        if count and day >= cutoff_day:
+            week = day.strftime("%Y-W%W")
+            weekly_activity[week] = weekly_activity.get(week, 0) + count
+
+    return _metrics_response(
+        total, status_counts, priority_counts, category_counts,
+        weekly_activity, total_events,
+    )
 
-    # Total events
-    total_events = db.query(OutreachEventDB).count()
 
+def _metrics_response(
+    total, status_counts, priority_counts, category_counts, weekly_activity, total_events
+) -> dict:
     # Response rate
     contacted = status_counts.get("contacted", 0)
     responded = status_counts.get("responded", 0)
@@ -574,67 +2346,732 @@ def get_metrics(
     }
 
 
-# --- Sync ---
+# Serialized /metrics body, reused until the TTL lapses or a write bumps the
+# generation. Per process: other workers' writes surface within the TTL.
+_metrics_cache: dict = {}
 
 
-@app.post("/sync")
-def sync_businesses(
-    items: list[SyncItem],
+@app.get("/metrics")
+@_async_read
+async def get_metrics(
+    if_none_match: str | None = Header(None),
+    user: dict = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
+    generation = _write_generation
+    now = time.monotonic()
+    entry = _metrics_cache.get("entry")
+    if not entry or entry["generation"] != generation or entry["expires"] <= now:
+        metrics = await db.run_sync(_metrics_from_rollups)
+        body = orjson.dumps(metrics, option=orjson.OPT_NON_STR_KEYS)
+        entry = {
+            "generation": generation,
+            "expires": now + METRICS_CACHE_TTL,
+            "body": body,
+            "etag": f'"{hashlib.sha1(body).hexdigest()[:20]}"',
+        }
+        _metrics_cache["entry"] = entry
+
+    headers = {"ETag": entry["etag"], "Cache-Control": "private, no-cache"}
+    if _etag_matches(if_none_match, entry["etag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(entry["body"], media_type="application/json", headers=headers)
+
+
+@app.get("/admin/metrics/drift", response_class=ORJSONResponse)
+def check_metrics_drift(
     user: dict = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
+    """Compare the rollup-served metrics against a live aggregation."""
+    rollup = _metrics_from_rollups(db)
+    live = _compute_metrics(db)
+    differences = {
+        key: {"rollup": rollup[key], "live": live[key]}
+        for key in live
+        if rollup[key] != live[key]
+    }
+    return {"drifted": bool(differences), "differences": differences}
+
+
+@app.post("/admin/metrics/rebuild")
+def rebuild_metrics(
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Recompute the rollup tables from scratch."""
+    counts = _rebuild_rollups(db)
+    db.commit()
+    _bump_generation()
+    return {"status": "rebuilt", **counts}
+
+
+@app.get("/admin/pool", response_class=ORJSONResponse)
+async def get_pool_stats(user: dict = Depends(require_auth)):
+    """Connection pool occupancy and checkout waits, for sizing DB_POOL_* settings.
+
+    Per process: each worker has its own pools.
+    """
+    return {"sync": pool_status(engine), "async": pool_status(async_engine)}
+
+
+# --- Sync ---
+
+
+# Every businesses column an upsert writes (id is generated, never sent)
+_UPSERT_COLUMNS = [c.name for c in BusinessDB.__table__.columns if c.name != "id"]
+# Largest chunk whose multi-row INSERT stays under the drivers' 32767 bind parameters
+MAX_SYNC_CHUNK_SIZE = 32767 // len(_UPSERT_COLUMNS)
+
+
+def _sync_chunk(db: Session, items: list[SyncItem]) -> tuple[int, int, list[dict]]:
+    """Upsert one chunk of sync items by slug: one SELECT plus one INSERT.
+
+    Existing rows only take the non-empty fields the item explicitly set.
+    Returns (created, updated, change records); the caller owns the transaction.
+    """
+    table = BusinessDB.__table__
+    slugs = {item.slug or slugify(item.name) for item in items}
+    # Taken first: the counter row lock keeps other writers out until commit,
+    # so the snapshot below is what the upsert overwrites and the rollups subtract
+    version = _next_version(db)
+    existing = {
+        row.slug: dict(row._mapping)
+        for row in db.execute(
+            select(*[table.c[c] for c in _UPSERT_COLUMNS]).where(table.c.slug.in_(slugs))
+        )
+    }
+
+    now = datetime.now(timezone.utc)
+    pending: dict[str, dict] = {}
     created = 0
     updated = 0
     for item in items:
         slug = item.slug or slugify(item.name)
-        existing = db.query(BusinessDB).filter(BusinessDB.slug == slug).first()
-        if existing:
+        row = pending.get(slug)
+        if row is None and slug in existing:
+            row = dict(existing[slug])
+        if row is not None:
             data = item.model_dump(exclude={"slug"}, exclude_unset=True)
             for key, val in data.items():
                 if val:  # Only update non-empty fields
-                    setattr(existing, key, val)
-            existing.updated_at = datetime.now(timezone.utc)
+                    row[key] = val
             updated += 1
         else:
-            biz = BusinessDB(slug=slug, **item.model_dump(exclude={"slug"}))
-            db.add(biz)
+            row = {"slug": slug, "created_at": now, **item.model_dump(exclude={"slug"})}
             created += 1
+        row["updated_at"] = now
+        row["row_version"] = version
+        pending[slug] = row
+
+    if not pending:
+        return 0, 0, []
+    stmt = _upsert(db, table).values(list(pending.values()))
+    ids = dict(db.execute(stmt.on_conflict_do_update(
+        index_elements=["slug"],
+        set_={c: stmt.excluded[c] for c in _UPSERT_COLUMNS if c not in ("slug", "created_at")},
+    ).returning(table.c.slug, table.c.id)).all())
+
+    deltas = Counter()
+    for slug, old in existing.items():
+        _count_business(deltas, old["status"], old["priority"], old["category"], -1)
+    for row in pending.values():
+        _count_business(deltas, row["status"], row["priority"], row["category"])
+    _apply_business_rollups(db, deltas)
+
+    changes = []
+    for slug, row in pending.items():
+        old = existing.get(slug)
+        if old is None:
+            changes.append(_change("business", ids[slug], "create", version))
+        else:
+            fields = [
+                k for k in row
+                if k not in ("created_at", "updated_at", "row_version") and row[k] != old[k]
+            ]
+            changes.append(
+                _change("business", ids[slug], "update", version, fields + ["updated_at"])
+            )
+    return created, updated, changes
+
+
+@app.post("/sync", response_class=ORJSONResponse)
+def sync_businesses(
+    items: list[SyncItem],
+    run_async: bool = Query(False, alias="async"),
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    if run_async:
+        job = SyncJobDB(
+            payload=json.dumps([item.model_dump(exclude_unset=True) for item in items]),
+            total=len(items),
+        )
+        db.add(job)
+        db.commit()
+        return ORJSONResponse(
+            status_code=202,
+            content={"job_id": job.id, "status": job.status, "total": job.total},
+        )
+
+    created = 0
+    updated = 0
+    changes = []
+    for start in range(0, len(items), SYNC_CHUNK_SIZE):
+        chunk_created, chunk_updated, chunk_changes = _sync_chunk(
+            db, items[start:start + SYNC_CHUNK_SIZE]
+        )
+        created += chunk_created
+        updated += chunk_updated
+        changes += chunk_changes
     db.commit()
+    _record_change(changes)
     return {"created": created, "updated": updated, "total": created + updated}
 
 
+async def _iter_lines(chunks):
+    """Split an async byte stream into lines without buffering the whole body."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+def _commit_sync_chunk(db: Session, index: int, batch: list[tuple[int, SyncItem]], report: dict):
+    """Upsert and commit one NDJSON chunk, isolating bad rows if the chunk fails."""
+    result = {
+        "chunk": index,
+        "first_line": batch[0][0],
+        "last_line": batch[-1][0],
+        "created": 0,
+        "updated": 0,
+        "failed": 0,
+    }
+    changes = []
+    try:
+        result["created"], result["updated"], changes = _sync_chunk(
+            db, [item for _, item in batch]
+        )
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        changes = []
+        # Retry row by row so one bad row doesn't sink its neighbours
+        for line_no, item in batch:
+            try:
+                created, updated, row_changes = _sync_chunk(db, [item])
+                db.commit()
+            except SQLAlchemyError as e:
+                db.rollback()
+                result["failed"] += 1
+                _report_row_error(report, line_no, str(getattr(e, "orig", None) or e))
+                continue
+            result["created"] += created
+            result["updated"] += updated
+            changes += row_changes
+    report["chunks"].append(result)
+    report["created"] += result["created"]
+    report["updated"] += result["updated"]
+    _record_change(changes)
+
+
+def _report_row_error(report: dict, line_no: int, error: str):
+    report["error_count"] += 1
+    if len(report["errors"]) < SYNC_MAX_REPORTED_ERRORS:
+        report["errors"].append({"line": line_no, "error": error})
+
+
+@app.post("/sync/stream", response_class=ORJSONResponse)
+async def sync_stream(
+    request: Request,
+    chunk_size: int = Query(SYNC_CHUNK_SIZE, ge=1, le=MAX_SYNC_CHUNK_SIZE),
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Ingest newline-delimited SyncItem JSON, committing every chunk_size rows.
+
+    Each chunk commits independently: invalid lines and rows the database
+    rejects are reported per line while the rest of the stream is applied.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type not in NDJSON_TYPES:
+        raise HTTPException(status_code=415, detail="Expected application/x-ndjson body")
+
+    report = {"created": 0, "updated": 0, "chunks": [], "errors": [], "error_count": 0}
+    batch: list[tuple[int, SyncItem]] = []
+    line_no = 0
+    async for line in _iter_lines(request.stream()):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            batch.append((line_no, SyncItem.model_validate_json(line)))
+        except ValidationError as e:
+            err = e.errors()[0]
+            loc = ".".join(str(p) for p in err["loc"])
+            _report_row_error(report, line_no, f"{loc}: {err['msg']}" if loc else err["msg"])
+            continue
+        if len(batch) >= chunk_size:
+            await run_in_threadpool(_commit_sync_chunk, db, len(report["chunks"]), batch, report)
+            batch = []
+    if batch:
+        await run_in_threadpool(_commit_sync_chunk, db, len(report["chunks"]), batch, report)
+
+    report["total"] = report["created"] + report["updated"]
+    return report
+
+
+# --- Sync Jobs ---
+
+
+def _claimable_job():
+    stale = datetime.now(timezone.utc) - timedelta(seconds=SYNC_JOB_STALE_SECONDS)
+    return or_(
+        SyncJobDB.status == "pending",
+        and_(SyncJobDB.status == "running", SyncJobDB.updated_at < stale),
+    )
+
+
+def _claim_sync_job(db: Session) -> SyncJobDB | None:
+    """Atomically move one pending (or abandoned running) job to running."""
+    candidates = (
+        db.query(SyncJobDB.id).filter(_claimable_job()).order_by(SyncJobDB.id).limit(5).all()
+    )
+    for (job_id,) in candidates:
+        claimed = (
+            db.query(SyncJobDB)
+            .filter(SyncJobDB.id == job_id, _claimable_job())
+            .update(
+                {"status": "running", "updated_at": datetime.now(timezone.utc)},
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+        if claimed:
+            return db.get(SyncJobDB, job_id)
+    return None
+
+
+def _process_sync_job(db: Session, job: SyncJobDB):
+    """Apply a job's payload chunk by chunk, resuming from job.processed.
+
+    Chunks are upserts by slug, so a chunk replayed after a crash between
+    its commit and the progress commit is harmless.
+    """
+    items = json.loads(job.payload or "[]")
+    errors = json.loads(job.errors or "[]")
+    while job.processed < job.total:
+        start = job.processed
+        chunk = items[start:start + SYNC_CHUNK_SIZE]
+        report = {"created": 0, "updated": 0, "chunks": [], "errors": [], "error_count": 0}
+        batch = [(start + i + 1, SyncItem.model_validate(raw)) for i, raw in enumerate(chunk)]
+        _commit_sync_chunk(db, start // SYNC_CHUNK_SIZE, batch, report)
+
+        job.processed = start + len(chunk)
+        job.created += report["created"]
+        job.updated += report["updated"]
+        job.error_count += report["error_count"]
+        errors.extend(report["errors"][:SYNC_MAX_REPORTED_ERRORS - len(errors)])
+        job.errors = json.dumps(errors)
+        job.updated_at = datetime.now(timezone.utc)
+        db.commit()
+
+    job.status = "done"
+    job.payload = ""
+    job.finished_at = datetime.now(timezone.utc)
+    db.commit()
+
+
+def run_sync_jobs(db: Session | None = None, max_jobs: int | None = None) -> int:
+    """Drain queued sync jobs; returns how many were run.
+
+    The lifespan worker calls this on a timer. Tests and one-off scripts can
+    call it directly with their own session.
+    """
+    own_session = db is None
+    db = db or SessionLocal()
+    ran = 0
+    try:
+        while max_jobs is None or ran < max_jobs:
+            job = _claim_sync_job(db)
+            if job is None:
+                break
+            try:
+                _process_sync_job(db, job)
+            except Exception as e:
+                logger.exception("sync job %s failed", job.id)
+                db.rollback()
+                job.status = "failed"
+                # Keep the row errors from chunks committed before the failure
+                errors = json.loads(job.errors or "[]")
+                errors.append({"line": job.processed + 1, "error": str(e)})
+                job.errors = json.dumps(errors)
+                job.finished_at = datetime.now(timezone.utc)
+                db.commit()
+            ran += 1
+    finally:
+        if own_session:
+            db.close()
+    return ran
+
+
+async def _sync_job_worker():
+    while True:
+        try:
+            await run_in_threadpool(run_sync_jobs)
+        except Exception:
+            logger.exception("sync job worker iteration failed")
+        await asyncio.sleep(SYNC_JOB_POLL_SECONDS)
+
+
+@app.get("/sync/jobs/{job_id}", response_model=SyncJobOut)
+def get_sync_job(
+    job_id: int,
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    job = db.query(SyncJobDB).filter(SyncJobDB.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Sync job not found")
+    return SyncJobOut(
+        **{c: getattr(job, c) for c in SyncJobOut.model_fields if c != "errors"},
+        errors=json.loads(job.errors or "[]"),
+    )
+
+
+# --- Sync Pull ---
+
+
+# Replicas apply stages in this order: events after their business, deletes last
+PULL_STAGES = {
+    "businesses": (BusinessDB, BusinessVersionOut),
+    "events": (OutreachEventDB, EventVersionOut),
+    "tombstones": (TombstoneDB, TombstoneOut),
+}
+
+
+async def _pull_rows(
+    db: AsyncSession, stage: str, since: int, upto: int, after, limit: int
+) -> list[dict]:
+    model, schema = PULL_STAGES[stage]
+    stmt = select(*[getattr(model, f) for f in schema.model_fields]).where(
+        model.row_version > since, model.row_version <= upto
+    )
+    if after:
+        version, last_id = after
+        stmt = stmt.where(or_(
+            model.row_version > version,
+            and_(model.row_version == version, model.id > last_id),
+        ))
+    stmt = stmt.order_by(model.row_version, model.id).limit(limit)
+    return [dict(row._mapping) for row in await db.execute(stmt)]
+
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _pull_cursor(state: dict, stage_count: int) -> tuple[int, int, int, list[int] | None]:
+    """Unpack a next_cursor into (since, upto, stage index, [version, id] or None)."""
+    since, upto, start, after = (state.get(k) for k in ("f", "u", "s", "a"))
+    if not (
+        all(_is_int(v) for v in (since, upto, start))
+        and 0 <= since <= upto
+        and 0 <= start < stage_count
+        and (after is None or (isinstance(after, list) and len(after) == 2 and all(_is_int(v) for v in after)))
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return since, upto, start, after
+
+
+@app.get("/sync/pull", response_model=SyncPullOut)
+@_async_read
+async def sync_pull(
+    since: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    user: dict = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db, scope="function"),
+):
+    """Rows changed or deleted after row_version `since`, in pages.
+
+    The first page pins a snapshot version; follow next_cursor until it is
+    null, then pull again with since=version. A business tombstone also
+    means its events are gone.
+    """
+    stages = list(PULL_STAGES)
+    if cursor:
+        since, upto, start, after = _pull_cursor(_decode_cursor(cursor), len(stages))
+    else:
+        upto, start, after = await db.run_sync(_current_version), 0, None
+
+    page = {stage: [] for stage in stages}
+    next_cursor = None
+    remaining = limit
+    for index in range(start, len(stages)):
+        rows = await _pull_rows(db, stages[index], since, upto, after, remaining)
+        page[stages[index]] = rows
+        remaining -= len(rows)
+        if remaining == 0:
+            last = rows[-1]
+            next_cursor = _encode_cursor(
+                {"f": since, "u": upto, "s": index, "a": [last["row_version"], last["id"]]}
+            )
+            break
+        after = None
+    return ORJSONResponse({"version": upto, **page, "next_cursor": next_cursor})
+
+
+# --- Change Stream ---
+
+
+async def _stream_auth(authorization: str = Header(None), token: str | None = None) -> dict:
+    """Bearer header, or ?token= for EventSource clients that cannot set headers."""
+    if token:
+        return verify_token(token)
+    return await require_auth(authorization)
+
+
+async def _change_events(request: Request, sub: _Subscriber, backlog: list[str]):
+    try:
+        yield f"retry: {int(CHANGE_HEARTBEAT_SECONDS * 1000)}\n\n"
+        for message in backlog:
+            yield message
+        while not sub.overflowed:
+            try:
+                yield await asyncio.wait_for(sub.queue.get(), CHANGE_HEARTBEAT_SECONDS)
+            except TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keepalive\n\n"
+    finally:
+        _change_broker.unsubscribe(sub)
+
+
+@app.get("/changes/stream")
+async def change_stream(
+    request: Request,
+    last_event_id: str | None = Header(None),
+    user: dict = Depends(_stream_auth),
+):
+    """Server-Sent Events feed of committed business and event writes.
+
+    Each `change` event carries {entity, id, op, fields?, version}. Reconnect
+    with Last-Event-ID to replay missed changes; a `reset` event means the
+    gap was too large and the client should refetch.
+    """
+    sub, backlog = _change_broker.subscribe(last_event_id)
+    return StreamingResponse(
+        _change_events(request, sub, backlog),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # --- Export ---
 
 
+CSV_EXPORT_COLUMNS = [
+    ("Name", BusinessDB.name),
+    ("Slug", BusinessDB.slug),
+    ("Category", BusinessDB.category),
+    ("Demo URL", BusinessDB.demo_url),
+    ("Existing Website", BusinessDB.existing_website),
+    ("Website Quality", BusinessDB.website_quality),
+    ("Platform", BusinessDB.platform),
+    ("Priority", BusinessDB.priority),
+    ("Status", BusinessDB.status),
+    ("Contact Name", BusinessDB.contact_name),
+    ("Contact Email", BusinessDB.contact_email),
+    ("Contact Phone", BusinessDB.contact_phone),
+    ("Contact Role", BusinessDB.contact_role),
+    ("LinkedIn", BusinessDB.contact_linkedin),
+    ("Address", BusinessDB.address),
+    ("Demo Value Prop", BusinessDB.demo_value_prop),
+    ("Notes", BusinessDB.notes),
+    ("Created", BusinessDB.created_at),
+    ("Updated", BusinessDB.updated_at),
+]
+
+
+def _stream_rows(db: Session, stmt):
+    """Lazily iterate a SELECT through a server-side cursor, EXPORT_BATCH_ROWS at a time."""
+    yield from db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_ROWS))
+
+
+def _csv_chunks(header: list[str], rows, delimiter: str = ","):
+    """Render rows as CSV, yielding roughly EXPORT_FLUSH_BYTES at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=delimiter)
+    writer.writerow(header)
+    yield buffer.getvalue()  # header goes out before the first fetch
+    buffer.seek(0)
+    buffer.truncate()
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= EXPORT_FLUSH_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _ndjson_chunks(keys: list[str], rows):
+    """Render rows as one JSON object per line, flushed like _csv_chunks."""
+    parts = []
+    size = 0
+    for row in rows:
+        line = orjson.dumps(dict(zip(keys, row)), option=orjson.OPT_APPEND_NEWLINE)
+        parts.append(line)
+        size += len(line)
+        if size >= EXPORT_FLUSH_BYTES:
+            yield b"".join(parts)
+            parts = []
+            size = 0
+    if parts:
+        yield b"".join(parts)
+
+
+def _gzip_chunks(chunks):
+    """Gzip a text stream on the fly; the gzip header is flushed with the first chunk."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    first = True
+    for chunk in chunks:
+        data = compressor.compress(chunk if isinstance(chunk, bytes) else chunk.encode())
+        if first:
+            data += compressor.flush(zlib.Z_SYNC_FLUSH)
+            first = False
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "tsv": "text/tab-separated-values",
+    "ndjson": "application/x-ndjson",
+}
+NDJSON_EXPORT_COLUMNS = [getattr(BusinessDB, name) for name in BUSINESS_OUT_FIELDS]
+
+
+def _export_response(chunks, fmt: str, basename: str, compress: bool) -> StreamingResponse:
+    filename = f"{basename}.{fmt}"
+    media_type = EXPORT_FORMATS[fmt]
+    if compress:
+        chunks = _gzip_chunks(chunks)
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+def _business_export(db: Session, fmt: str, filters: BusinessFilter, compress: bool):
+    conditions = _business_conditions(db.get_bind().dialect.name, filters)
+    if fmt == "ndjson":
+        keys = [col.key for col in NDJSON_EXPORT_COLUMNS]
+        stmt = select(*NDJSON_EXPORT_COLUMNS)
+    else:
+        header = [label for label, _ in CSV_EXPORT_COLUMNS]
+        stmt = select(*[col for _, col in CSV_EXPORT_COLUMNS])
+    stmt = stmt.where(*conditions).order_by(BusinessDB.name)
+
+    def generate():
+        rows = _stream_rows(db, stmt)
+        if fmt == "ndjson":
+            yield from _ndjson_chunks(keys, rows)
+        else:
+            yield from _csv_chunks(header, rows, delimiter="\t" if fmt == "tsv" else ",")
+
+    return _export_response(generate(), fmt, "outreach_export", compress)
+
+
+@app.get("/export")
+def export_businesses(
+    filters: BusinessFilter = Depends(business_filter),
+    fmt: Literal["csv", "tsv", "ndjson"] = Query("csv", alias="format"),
+    gzip: bool = False,
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Stream businesses matching the list filters as CSV, TSV or NDJSON."""
+    return _business_export(db, fmt, filters, gzip)
+
+
 @app.get("/export/csv")
 def export_csv(
+    filters: BusinessFilter = Depends(business_filter),
+    gzip: bool = False,
     user: dict = Depends(require_auth),
     db: Session = Depends(get_db),
 ):
-    businesses = db.query(BusinessDB).order_by(BusinessDB.name).all()
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "Name", "Slug", "Category", "Demo URL", "Existing Website",
-        "Website Quality", "Platform", "Priority", "Status", "Contact Name",
-        "Contact Email", "Contact Phone", "Contact Role", "LinkedIn",
-        "Address", "Demo Value Prop", "Notes", "Created", "Updated",
-    ])
-    for biz in businesses:
-        writer.writerow([
-            biz.name, biz.slug, biz.category, biz.demo_url,
-            biz.existing_website, biz.website_quality, biz.platform,
-            biz.priority, biz.status, biz.contact_name, biz.contact_email,
-            biz.contact_phone, biz.contact_role, biz.contact_linkedin,
-            biz.address, biz.demo_value_prop,
-            biz.notes, biz.created_at, biz.updated_at,
-        ])
-    output.seek(0)
-    return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=outreach_export.csv"},
+    return _business_export(db, "csv", filters, gzip)
+
+
+EVENT_EXPORT_COLUMNS = [
+    ("Event ID", OutreachEventDB.id),
+    ("Created", OutreachEventDB.created_at),
+    ("Event Type", OutreachEventDB.event_type),
+    ("Details", OutreachEventDB.details),
+    ("Business ID", OutreachEventDB.business_id),
+    ("Business Slug", BusinessDB.slug),
+    ("Business Name", BusinessDB.name),
+    ("Business Status", BusinessDB.status),
+    ("Business Category", BusinessDB.category),
+]
+EVENT_EXPORT_KEYS = [
+    "id", "created_at", "event_type", "details", "business_id",
+    "business_slug", "business_name", "business_status", "business_category",
+]
+
+
+@app.get("/export/events")
+def export_events(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    event_type: str | None = None,
+    fmt: Literal["csv", "tsv", "ndjson"] = Query("csv", alias="format"),
+    gzip: bool = False,
+    user: dict = Depends(require_auth),
+    db: Session = Depends(get_db),
+):
+    """Stream outreach events joined with their business, oldest first.
+
+    since is inclusive and until exclusive, so consecutive windows don't overlap.
+    """
+    stmt = select(*[col for _, col in EVENT_EXPORT_COLUMNS]).join(
+        BusinessDB, BusinessDB.id == OutreachEventDB.business_id
     )
+    if since:
+        stmt = stmt.where(OutreachEventDB.created_at >= _as_utc_naive(since))
+    if until:
+        stmt = stmt.where(OutreachEventDB.created_at < _as_utc_naive(until))
+    if event_type:
+        stmt = stmt.where(OutreachEventDB.event_type == event_type)
+    stmt = stmt.order_by(OutreachEventDB.created_at, OutreachEventDB.id)
+
+    def generate():
+        rows = _stream_rows(db, stmt)
+        if fmt == "ndjson":
+            yield from _ndjson_chunks(EVENT_EXPORT_KEYS, rows)
+        else:
+            header = [label for label, _ in EVENT_EXPORT_COLUMNS]
+            yield from _csv_chunks(header, rows, delimiter="\t" if fmt == "tsv" else ",")
+
+    return _export_response(generate(), fmt, "outreach_events", gzip)
 
 
 # --- Health ---
@@ -11,14 +11,17 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 # Ensure the project root and tests dir are on sys.path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 os.environ.pop("DATABASE_URL", None)  # noqa: E402
+os.environ["SYNC_JOB_WORKER"] = "0"  # tests drive jobs with main.run_sync_jobs()
+os.environ["ASYNC_READS"] = "1"  # the threadpool fallback is built per test in test_async_endpoints
 
 # Set a known passphrase hash for tests (bcrypt hash of "charioteer")
 if "PASSPHRASE_HASH" not in os.environ:
@@ -27,18 +30,23 @@ if "PASSPHRASE_HASH" not in os.environ:
         b"charioteer", _bcrypt.gensalt()
     ).decode()
 
-from database import Base, get_db  # noqa: E402
+from database import Base, get_async_db, get_db  # noqa: E402
 from main import app, create_token  # noqa: E402
 
-# In-memory SQLite using StaticPool so all connections share the same DB
+# Named shared-cache in-memory SQLite, so the async endpoints' aiosqlite
+# connections see the same DB. The StaticPool connection keeps it alive.
+TEST_DB = "file:outreach_test?mode=memory&cache=shared&uri=true"
 test_engine = create_engine(
-    "sqlite://",
+    f"sqlite:///{TEST_DB}",
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
 TestSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=test_engine
 )
+# NullPool: each TestClient runs its own event loop, so nothing is reused across tests
+test_async_engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DB}", poolclass=NullPool)
+TestAsyncSessionLocal = async_sessionmaker(test_async_engine, expire_on_commit=False)
 
 
 def override_get_db():
@@ -49,7 +57,13 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with TestAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 
 @pytest.fixture(autouse=True)
@@ -65,11 +79,23 @@ def client(setup_database):
     """FastAPI test client with patched lifespan to use test engine."""
     import database as db_mod
     import main as main_mod
-    with patch.object(main_mod, "engine", test_engine),          patch.object(db_mod, "engine", test_engine):
+    with patch.object(main_mod, "engine", test_engine), \
+            patch.object(db_mod, "engine", test_engine), \
+            patch.object(main_mod, "async_engine", test_async_engine):
         with TestClient(app) as c:
             yield c
 
 
+@pytest.fixture
+def db_session(setup_database):
+    """Direct session on the test database, for seeding and inspecting rows."""
+    db = TestSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 @pytest.fixture
 def auth_headers():
     """Return a valid Bearer token header for authenticated requests."""
@@ -16,3 +16,9 @@ def create_test_event(client, auth_headers, business_id, event_type="call", deta
         json={"event_type": event_type, "details": details},
         headers=auth_headers,
     ).json()
+
+
+def assert_no_metric_drift(client, auth_headers):
+    """The rollup tables agree with a recount of the base tables."""
+    drift = client.get("/admin/metrics/drift", headers=auth_headers).json()
+    assert drift == {"drifted": False, "differences": {}}
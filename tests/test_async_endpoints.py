@@ -0,0 +1,151 @@
+"""Tests for the async read endpoints and the async database session."""
+
+import asyncio
+import inspect
+from unittest.mock import patch
+
+import anyio.to_thread
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+
+import database
+import main
+
+ASYNC_ENDPOINTS = [
+    main.list_businesses,
+    main.get_business,
+    main.list_business_events,
+    main.get_metrics,
+    main.sync_pull,
+]
+
+
+def _no_threadpool(*args, **kwargs):
+    raise AssertionError("request ran on the threadpool")
+
+
+def test_hot_endpoints_are_async():
+    assert all(asyncio.iscoroutinefunction(endpoint) for endpoint in ASYNC_ENDPOINTS)
+
+
+def test_async_sessions_end_with_the_endpoint():
+    for endpoint in ASYNC_ENDPOINTS:
+        db = inspect.signature(endpoint).parameters["db"].default
+        assert (db.dependency, db.scope) == (database.get_async_db, "function"), endpoint.__name__
+
+
+def test_session_gate_released_before_response_is_sent(client, auth_headers):
+    biz = _create_business(client, auth_headers)
+    free_at_start = []
+
+    async def probe(scope, receive, send):
+        async def watched(message):
+            if message["type"] == "http.response.start":
+                free_at_start.append(database._async_session_gate._value)
+            await send(message)
+        await main.app(scope, receive, watched)
+
+    async def run():
+        database.open_async_session_gate()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=probe), base_url="http://test") as http:
+            return await http.get(f"/businesses/{biz['id']}", headers=auth_headers)
+
+    # The real dependency, on the test database
+    with patch.dict(main.app.dependency_overrides), \
+            patch.dict(database.AsyncSessionLocal.kw, {"bind": main.async_engine}):
+        del main.app.dependency_overrides[database.get_async_db]
+        response = asyncio.run(run())
+    assert response.status_code == 200
+    assert free_at_start == [database.POOL_SIZE + database.POOL_MAX_OVERFLOW]
+
+
+def test_session_gate_is_made_per_lifespan(client):
+    first = database._async_session_gate
+    with TestClient(main.app):
+        assert database._async_session_gate not in (None, first)
+
+
+def test_hot_endpoints_never_use_threadpool(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Async Biz")
+    _create_event(client, auth_headers, biz["id"])
+    paths = [
+        "/businesses",
+        "/businesses?search=async",
+        f"/businesses/{biz['id']}",
+        f"/businesses/{biz['id']}/events",
+        "/metrics",
+        "/sync/pull",
+    ]
+    with patch.object(anyio.to_thread, "run_sync", _no_threadpool):
+        responses = [client.get(path, headers=auth_headers) for path in paths]
+    assert [r.status_code for r in responses] == [200] * len(paths)
+    assert responses[1].json()["items"][0]["name"] == "Async Biz"
+    assert responses[2].json()["event_count"] == 1
+
+
+def test_hot_endpoints_run_on_the_threadpool_without_async_reads(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Threaded Biz")
+    _create_event(client, auth_headers, biz["id"])
+    threaded = FastAPI()
+    with patch.object(main, "ASYNC_READS", False):
+        for route in main.app.routes:
+            if getattr(route, "endpoint", None) in ASYNC_ENDPOINTS:
+                endpoint = main._async_read(route.endpoint)
+                assert not asyncio.iscoroutinefunction(endpoint)
+                threaded.add_api_route(route.path, endpoint, methods=["GET"])
+    paths = [
+        "/businesses?search=threaded",
+        f"/businesses/{biz['id']}",
+        f"/businesses/{biz['id']}/events",
+        "/metrics",
+        "/sync/pull",
+    ]
+    # The sync sessionmaker, on the test database
+    with patch.dict(database.SessionLocal.kw, {"bind": main.engine}), TestClient(threaded) as http:
+        responses = [http.get(path, headers=auth_headers) for path in paths]
+    assert [r.status_code for r in responses] == [200] * len(paths)
+    assert responses[0].json()["items"][0]["name"] == "Threaded Biz"
+    assert responses[1].json()["event_count"] == 1
+    assert len(responses[2].json()["items"]) == 1
+    assert responses[3].json() == client.get("/metrics", headers=auth_headers).json()
+
+
+def test_async_reads_see_sync_writes(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Before")
+    client.put(f"/businesses/{biz['id']}", json={"name": "After"}, headers=auth_headers)
+    assert client.get(f"/businesses/{biz['id']}", headers=auth_headers).json()["name"] == "After"
+    assert client.get("/businesses?fields=name", headers=auth_headers).json()["items"] == [{"name": "After"}]
+
+
+def test_concurrent_reads_with_exhausted_threadpool(client, auth_headers):
+    """Reads keep completing while every worker thread is taken."""
+    biz = _create_business(client, auth_headers, name="Busy")
+
+    async def run():
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = 1
+        blocked = anyio.Event()
+
+        def hold_thread():
+            anyio.from_thread.run(blocked.wait)
+
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(anyio.to_thread.run_sync, hold_thread)
+                await anyio.sleep(0)
+                try:
+                    with anyio.fail_after(10):
+                        responses = await asyncio.gather(*[
+                            http.get(f"/businesses/{biz['id']}", headers=auth_headers)
+                            for _ in range(100)
+                        ])
+                finally:
+                    blocked.set()
+        return responses
+
+    responses = asyncio.run(run())
+    assert all(r.status_code == 200 for r in responses)
@@ -0,0 +1,97 @@
+"""Tests for DELETE /businesses and the ON DELETE CASCADE behind single deletes."""
+
+from helpers import assert_no_metric_drift as _assert_no_drift
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+from sqlalchemy import event
+
+import main
+
+
+def _delete(client, auth_headers, params):
+    return client.delete("/businesses", params=params, headers=auth_headers)
+
+
+def _names(client, auth_headers):
+    return {b["name"] for b in client.get("/businesses?fields=name", headers=auth_headers).json()["items"]}
+
+
+def _seed(client, auth_headers):
+    businesses = [
+        _create_business(client, auth_headers, name="Alpha Dental", category="dental"),
+        _create_business(client, auth_headers, name="Beta Dental", category="dental", status="lost"),
+        _create_business(client, auth_headers, name="Gamma Bakery", category="bakery"),
+    ]
+    for biz in businesses:
+        _create_event(client, auth_headers, biz["id"], event_type="call")
+        _create_event(client, auth_headers, biz["id"], event_type="email_sent")
+    return businesses
+
+
+def _capture_statements(db_session, fn):
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, sql, *args: statements.append(sql)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return statements
+
+
+def test_delete_business_cascades_in_one_statement(client, auth_headers, db_session):
+    alpha, beta, gamma = _seed(client, auth_headers)
+    statements = _capture_statements(
+        db_session, lambda: client.delete(f"/businesses/{alpha['id']}", headers=auth_headers)
+    )
+    assert sum(s.startswith("DELETE FROM businesses") for s in statements) == 1
+    assert not any(s.startswith("DELETE FROM outreach_events") for s in statements)
+    assert not any(s.startswith("SELECT outreach_events.id") for s in statements)
+
+    remaining = db_session.query(main.OutreachEventDB.business_id).distinct().all()
+    assert {b for (b,) in remaining} == {beta["id"], gamma["id"]}
+    _assert_no_drift(client, auth_headers)
+
+
+def test_bulk_delete_by_ids(client, auth_headers, db_session):
+    alpha, beta, gamma = _seed(client, auth_headers)
+    response = _delete(client, auth_headers, {"ids": [alpha["id"], gamma["id"]]})
+    assert response.json() == {"deleted": 2}
+    assert _names(client, auth_headers) == {"Beta Dental"}
+    assert db_session.query(main.OutreachEventDB).count() == 2
+    _assert_no_drift(client, auth_headers)
+
+
+def test_bulk_delete_by_filter(client, auth_headers):
+    _seed(client, auth_headers)
+    assert _delete(client, auth_headers, {"category": "dental", "status": "lost"}).json() == {"deleted": 1}
+    assert _names(client, auth_headers) == {"Alpha Dental", "Gamma Bakery"}
+    assert _delete(client, auth_headers, {"search": "bakery"}).json() == {"deleted": 1}
+    assert _names(client, auth_headers) == {"Alpha Dental"}
+    _assert_no_drift(client, auth_headers)
+
+
+def test_bulk_delete_refuses_unscoped(client, auth_headers):
+    _seed(client, auth_headers)
+    assert _delete(client, auth_headers, {}).status_code == 422
+    assert _delete(client, auth_headers, {"category": "nothing"}).json() == {"deleted": 0}
+    assert len(_names(client, auth_headers)) == 3
+
+
+def test_bulk_delete_leaves_tombstones_and_changes(client, auth_headers):
+    alpha, beta, gamma = _seed(client, auth_headers)
+    version = client.get("/sync/pull", headers=auth_headers).json()["version"]
+    start = main._change_broker.last_id
+
+    _delete(client, auth_headers, {"category": "dental"})
+
+    pulled = client.get(f"/sync/pull?since={version}", headers=auth_headers).json()
+    assert sorted(t["entity_id"] for t in pulled["tombstones"]) == sorted([alpha["id"], beta["id"]])
+    messages = main._change_broker.since(start)
+    assert len(messages) == 2
+    assert all('"op":"delete"' in m for m in messages)
+
+
+def test_bulk_delete_requires_auth(client):
+    assert client.delete("/businesses", params={"ids": [1]}).status_code == 401
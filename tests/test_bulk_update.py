@@ -0,0 +1,100 @@
+"""Tests for PATCH /businesses set-based bulk updates."""
+
+from helpers import assert_no_metric_drift as _assert_no_drift
+from helpers import create_test_business as _create_business
+from sqlalchemy import event
+
+import main
+
+
+def _patch(client, auth_headers, body):
+    return client.patch("/businesses", json=body, headers=auth_headers)
+
+
+def _by_name(client, auth_headers):
+    rows = client.get("/businesses?fields=name,status,priority", headers=auth_headers).json()["items"]
+    return {r["name"]: r for r in rows}
+
+
+def _seed(client, auth_headers):
+    return [
+        _create_business(client, auth_headers, name="Alpha Dental", category="dental"),
+        _create_business(client, auth_headers, name="Beta Dental", category="dental", status="contacted"),
+        _create_business(client, auth_headers, name="Gamma Bakery", category="bakery"),
+    ]
+
+
+def test_bulk_update_by_ids(client, auth_headers):
+    alpha, beta, gamma = _seed(client, auth_headers)
+    response = _patch(client, auth_headers, {"ids": [alpha["id"], gamma["id"]], "update": {"status": "contacted"}})
+    assert response.json() == {"updated": 2}
+
+    rows = _by_name(client, auth_headers)
+    assert {n: r["status"] for n, r in rows.items()} == {
+        "Alpha Dental": "contacted", "Beta Dental": "contacted", "Gamma Bakery": "contacted",
+    }
+    _assert_no_drift(client, auth_headers)
+
+
+def test_bulk_update_by_filter(client, auth_headers):
+    _seed(client, auth_headers)
+    response = _patch(client, auth_headers, {"filter": {"category": "dental"}, "update": {"priority": "hot"}})
+    assert response.json() == {"updated": 2}
+    rows = _by_name(client, auth_headers)
+    assert rows["Alpha Dental"]["priority"] == "hot"
+    assert rows["Gamma Bakery"]["priority"] == "cold"
+
+    response = _patch(
+        client, auth_headers,
+        {"filter": {"search": "bakery", "status": "prospect"}, "update": {"status": "lost"}},
+    )
+    assert response.json() == {"updated": 1}
+    assert _by_name(client, auth_headers)["Gamma Bakery"]["status"] == "lost"
+    _assert_no_drift(client, auth_headers)
+
+
+def test_bulk_update_ids_and_filter_intersect(client, auth_headers):
+    alpha, beta, gamma = _seed(client, auth_headers)
+    body = {"ids": [alpha["id"], beta["id"], gamma["id"]], "filter": {"status": "prospect"}, "update": {"notes": "x"}}
+    assert _patch(client, auth_headers, body).json() == {"updated": 2}
+
+
+def test_bulk_update_refuses_unscoped_or_empty(client, auth_headers):
+    _seed(client, auth_headers)
+    assert _patch(client, auth_headers, {"update": {"status": "lost"}}).status_code == 422
+    assert _patch(client, auth_headers, {"filter": {}, "update": {"status": "lost"}}).status_code == 422
+    assert _patch(client, auth_headers, {"ids": [1], "update": {}}).status_code == 422
+    assert _patch(client, auth_headers, {"ids": [], "update": {"status": "lost"}}).json() == {"updated": 0}
+    assert all(r["status"] != "lost" for r in _by_name(client, auth_headers).values())
+
+
+def test_bulk_update_is_one_statement(client, auth_headers, db_session):
+    _seed(client, auth_headers)
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, sql, *args: statements.append(sql)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        _patch(client, auth_headers, {"filter": {"category": "dental"}, "update": {"status": "meeting"}})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert sum(s.startswith("UPDATE businesses") for s in statements) == 1
+    assert not any(s.startswith("SELECT businesses.id, businesses.name") for s in statements)
+
+
+def test_bulk_update_feeds_changes_and_pull(client, auth_headers):
+    alpha, beta, _ = _seed(client, auth_headers)
+    version = client.get("/sync/pull", headers=auth_headers).json()["version"]
+    start = main._change_broker.last_id
+
+    _patch(client, auth_headers, {"filter": {"category": "dental"}, "update": {"priority": "warm"}})
+
+    pulled = client.get(f"/sync/pull?since={version}", headers=auth_headers).json()
+    assert sorted(b["id"] for b in pulled["businesses"]) == sorted([alpha["id"], beta["id"]])
+    messages = main._change_broker.since(start)
+    assert len(messages) == 2
+    assert '"fields":["priority","updated_at"]' in messages[0]
+
+
+def test_bulk_update_requires_auth(client):
+    assert client.patch("/businesses", json={"ids": [1], "update": {"status": "x"}}).status_code == 401
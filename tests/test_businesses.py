@@ -13,7 +13,7 @@ def create_business(client, auth_headers, name="Test Biz", **overrides):
 def test_list_businesses_empty(client, auth_headers):
     response = client.get("/businesses", headers=auth_headers)
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {"items": [], "next_cursor": None}
 
 
 def test_list_businesses_requires_auth(client):
@@ -185,7 +185,7 @@ def test_filter_by_status(client, auth_headers):
     create_business(client, auth_headers, name="B", status="prospect")
     response = client.get("/businesses?status=contacted", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["name"] == "A"
 
@@ -195,7 +195,7 @@ def test_filter_by_priority(client, auth_headers):
     create_business(client, auth_headers, name="Cold", priority="cold")
     response = client.get("/businesses?priority=hot", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["name"] == "Hot"
 
@@ -205,6 +205,6 @@ def test_search_by_name(client, auth_headers):
     create_business(client, auth_headers, name="Beta Corp")
     response = client.get("/businesses?search=Alpha", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["name"] == "Alpha Industries"
@@ -17,7 +17,7 @@ def test_filter_by_category(client, auth_headers):
 
     response = client.get("/businesses?category=restaurant", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 2
     for biz in data:
         assert "restaurant" in biz["category"].lower()
@@ -30,7 +30,7 @@ def test_filter_by_category_partial_match(client, auth_headers):
 
     response = client.get("/businesses?category=dining", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["name"] == "A"
 
@@ -44,7 +44,7 @@ def test_search_by_notes(client, auth_headers):
 
     response = client.get("/businesses?search=redesign", headers=auth_headers)
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["name"] == "Alpha Corp"
 
@@ -60,7 +60,7 @@ def test_combined_status_and_priority_filter(client, auth_headers):
         "/businesses?status=contacted&priority=hot", headers=auth_headers
     )
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 1
     assert data[0]["name"] == "A"
 
@@ -174,7 +174,7 @@ def test_list_businesses_ordered_by_updated_at_desc(client, auth_headers):
         headers=auth_headers,
     )
 
-    listing = client.get("/businesses", headers=auth_headers).json()
+    listing = client.get("/businesses", headers=auth_headers).json()["items"]
     assert listing[0]["name"] == "AAA First"  # Most recently updated
     assert listing[1]["name"] == "BBB Second"
 
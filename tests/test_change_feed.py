@@ -0,0 +1,129 @@
+"""Tests for the change broker and GET /changes/stream."""
+
+import asyncio
+import json
+
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+
+import main
+from main import ChangeBroker
+
+
+def _records(since: int) -> list[dict]:
+    messages = main._change_broker.since(since)
+    return [json.loads(m.split("data: ", 1)[1]) for m in messages]
+
+
+def test_broker_fans_out_and_replays():
+    async def scenario():
+        broker = ChangeBroker(replay_size=10, queue_size=10)
+        first, _ = broker.subscribe()
+        broker.publish([{"entity": "business", "id": 1, "op": "create"}])
+        second, backlog = broker.subscribe(f"{broker.epoch}-0")
+        broker.publish([{"entity": "business", "id": 1, "op": "delete"}])
+        await asyncio.sleep(0)
+        return broker, first, second, backlog
+
+    broker, first, second, backlog = asyncio.run(scenario())
+    assert first.queue.qsize() == 2
+    assert second.queue.qsize() == 1
+    assert backlog[0].startswith(f"id: {broker.epoch}-1\nevent: change\n")
+    assert '"op":"create"' in backlog[0]
+
+
+def test_broker_resets_when_replay_window_is_exceeded():
+    async def scenario():
+        broker = ChangeBroker(replay_size=2)
+        broker.publish([{"id": n} for n in range(5)])
+        return broker, [broker.subscribe(f"{broker.epoch}-{seq}")[1] for seq in (3, 2, 9)]
+
+    broker, (in_window, too_old, from_future) = asyncio.run(scenario())
+    assert [m.split("\n")[0] for m in in_window] == [f"id: {broker.epoch}-4", f"id: {broker.epoch}-5"]
+    assert too_old == [f"id: {broker.epoch}-5\nevent: reset\ndata: {{}}\n\n"]
+    assert from_future == too_old
+
+
+def test_broker_resets_ids_from_another_epoch():
+    async def scenario():
+        previous = ChangeBroker()
+        previous.publish([{"id": n} for n in range(5)])
+        broker = ChangeBroker()  # a restart: the sequence starts over
+        broker.publish([{"id": n} for n in range(5)])
+        return broker, [broker.subscribe(last_id)[1] for last_id in (f"{previous.epoch}-3", "3", "junk")]
+
+    broker, backlogs = asyncio.run(scenario())
+    reset = [f"id: {broker.epoch}-5\nevent: reset\ndata: {{}}\n\n"]
+    assert backlogs == [reset, reset, reset]
+
+
+def test_broker_marks_slow_subscriber_overflowed():
+    async def scenario():
+        broker = ChangeBroker(queue_size=2)
+        sub, _ = broker.subscribe()
+        broker.publish([{"id": n} for n in range(3)])
+        await asyncio.sleep(0)
+        return sub
+
+    sub = asyncio.run(scenario())
+    assert sub.overflowed
+    assert sub.queue.qsize() == 2
+
+
+def test_writes_publish_change_records(client, auth_headers):
+    start = main._change_broker.last_id
+    biz = _create_business(client, auth_headers, name="Feed Biz")
+    client.put(f"/businesses/{biz['id']}", json={"status": "contacted", "notes": ""}, headers=auth_headers)
+    event = _create_event(client, auth_headers, biz["id"])
+    client.delete(f"/businesses/{biz['id']}", headers=auth_headers)
+
+    records = _records(start)
+    assert [(r["entity"], r["op"]) for r in records] == [
+        ("business", "create"),
+        ("business", "update"),
+        ("event", "create"),
+        ("business", "update"),
+        ("business", "delete"),
+    ]
+    assert records[1]["fields"] == ["status", "updated_at"]
+    assert records[2]["id"] == event["id"]
+    assert records[2]["version"] == records[3]["version"]
+    assert records[3]["version"] < records[4]["version"]
+
+
+def test_sync_publishes_created_and_updated(client, auth_headers):
+    existing = _create_business(client, auth_headers, name="Synced")
+    start = main._change_broker.last_id
+    client.post("/sync", json=[{"name": "Synced", "priority": "hot"}, {"name": "Fresh"}], headers=auth_headers)
+
+    records = _records(start)
+    assert {(r["id"] == existing["id"], r["op"]) for r in records} == {(True, "update"), (False, "create")}
+    update = next(r for r in records if r["op"] == "update")
+    assert update["fields"] == ["priority", "updated_at"]
+
+
+def test_change_events_sends_backlog_then_live_changes():
+    class FakeRequest:
+        async def is_disconnected(self):
+            return True
+
+    async def scenario():
+        broker = ChangeBroker()
+        broker.publish([{"id": 1}])
+        sub, backlog = broker.subscribe(f"{broker.epoch}-0")
+        stream = main._change_events(FakeRequest(), sub, backlog)
+        out = [await anext(stream), await anext(stream)]
+        broker.publish([{"id": 2}])
+        out.append(await anext(stream))
+        await stream.aclose()
+        return broker, out
+
+    broker, (retry, replayed, live) = asyncio.run(scenario())
+    assert retry.startswith("retry: ")
+    assert replayed.startswith(f"id: {broker.epoch}-1\n")
+    assert live.startswith(f"id: {broker.epoch}-2\n")
+
+
+def test_change_stream_requires_auth(client):
+    assert client.get("/changes/stream").status_code == 401
+    assert client.get("/changes/stream?token=garbage").status_code == 401
@@ -0,0 +1,98 @@
+"""Tests for negotiated response compression and orjson rendering."""
+
+import gzip
+
+import pytest
+from helpers import create_test_business as _create_business
+
+import main
+
+
+def _seed_large(client, auth_headers):
+    _create_business(client, auth_headers, name="Verbose", notes="lorem ipsum " * 400)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", "gzip"),
+        ("gzip, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("identity", None),
+        ("", None),
+        ("GZIP;q=0.8", "gzip"),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    assert main._negotiate_encoding(header) == expected
+
+
+def test_negotiate_encoding_without_brotli(monkeypatch):
+    monkeypatch.setattr(main, "brotli", None)
+    assert main._negotiate_encoding("br, gzip;q=0.1") == "gzip"
+    assert main._negotiate_encoding("br") is None
+
+
+def test_compressible_types():
+    assert main._compressible("application/json")
+    assert main._compressible("text/csv; charset=utf-8")
+    assert main._compressible("application/problem+json")
+    assert not main._compressible("text/event-stream")
+    assert not main._compressible("application/gzip")
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_large_json_is_compressed(client, auth_headers, encoding):
+    _seed_large(client, auth_headers)
+    response = client.get("/businesses?fields=*", headers={**auth_headers, "Accept-Encoding": encoding})
+    assert response.headers["content-encoding"] == encoding
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert response.json()["items"][0]["notes"].startswith("lorem ipsum")
+
+
+def test_compressed_responses_weaken_strong_etags(client, auth_headers):
+    client.post("/sync", json=[{"name": f"Cat {i}", "category": f"category {i}"} for i in range(100)],
+                headers=auth_headers)
+    plain = client.get("/metrics", headers={**auth_headers, "Accept-Encoding": "identity"})
+    packed = client.get("/metrics", headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert "content-encoding" not in plain.headers
+    assert not plain.headers["etag"].startswith("W/")
+    assert packed.headers["content-encoding"] == "gzip"
+    assert packed.headers["etag"] == f"W/{plain.headers['etag']}"
+
+    revalidated = client.get(
+        "/metrics",
+        headers={**auth_headers, "Accept-Encoding": "gzip", "If-None-Match": packed.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+
+def test_small_and_unnegotiated_responses_pass_through(client, auth_headers):
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    _seed_large(client, auth_headers)
+    plain = client.get("/businesses?fields=*", headers={**auth_headers, "Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert int(plain.headers["content-length"]) == len(plain.content)
+
+
+def test_streamed_export_is_compressed(client, auth_headers):
+    _seed_large(client, auth_headers)
+    response = client.get("/export?format=ndjson", headers={**auth_headers, "Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert b'"name":"Verbose"' in response.content
+
+
+def test_gzip_attachment_is_not_encoded_twice(client, auth_headers):
+    _seed_large(client, auth_headers)
+    response = client.get("/export?gzip=true", headers={**auth_headers, "Accept-Encoding": "gzip, br"})
+    assert "content-encoding" not in response.headers
+    assert gzip.decompress(response.content).startswith(b"Name,Slug")
+
+
+def test_orjson_response_renders_non_str_keys():
+    response = main.ORJSONResponse({1: "a", "b": [1.5, None]})
+    assert response.body == b'{"1":"a","b":[1.5,null]}'
@@ -0,0 +1,140 @@
+"""Tests for ETag / Last-Modified handling on business reads."""
+
+from datetime import datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import main
+
+
+def test_detail_returns_validators(client, auth_headers):
+    biz = _create_business(client, auth_headers)
+    response = client.get(f"/businesses/{biz['id']}", headers=auth_headers)
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "private, no-cache"
+    parsedate_to_datetime(response.headers["last-modified"])
+
+
+def test_detail_if_none_match_returns_304(client, auth_headers):
+    biz = _create_business(client, auth_headers)
+    etag = client.get(f"/businesses/{biz['id']}", headers=auth_headers).headers["etag"]
+
+    response = client.get(f"/businesses/{biz['id']}", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_detail_etag_changes_on_update_and_new_event(client, auth_headers):
+    biz = _create_business(client, auth_headers)
+    first = client.get(f"/businesses/{biz['id']}", headers=auth_headers).headers["etag"]
+    client.put(f"/businesses/{biz['id']}", json={"notes": "n"}, headers=auth_headers)
+    second = client.get(f"/businesses/{biz['id']}", headers=auth_headers).headers["etag"]
+    _create_event(client, auth_headers, biz["id"])
+    third = client.get(f"/businesses/{biz['id']}", headers=auth_headers).headers["etag"]
+    assert len({first, second, third}) == 3
+
+    response = client.get(f"/businesses/{biz['id']}", headers={**auth_headers, "If-None-Match": first})
+    assert response.status_code == 200
+    assert len(response.json()["events"]) == 1
+
+
+def test_detail_if_modified_since(client, auth_headers):
+    biz = _create_business(client, auth_headers)
+    last_modified = client.get(f"/businesses/{biz['id']}", headers=auth_headers).headers["last-modified"]
+    earlier = format_datetime(parsedate_to_datetime(last_modified) - timedelta(seconds=1), usegmt=True)
+    url = f"/businesses/{biz['id']}"
+
+    assert client.get(url, headers={**auth_headers, "If-Modified-Since": last_modified}).status_code == 304
+    assert client.get(url, headers={**auth_headers, "If-Modified-Since": earlier}).status_code == 200
+    assert client.get(url, headers={**auth_headers, "If-Modified-Since": "garbage"}).status_code == 200
+    # If-None-Match takes precedence over If-Modified-Since
+    response = client.get(
+        url, headers={**auth_headers, "If-None-Match": 'W/"stale"', "If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 200
+
+
+def test_detail_304_does_not_load_rows(client, auth_headers):
+    biz = _create_business(client, auth_headers)
+    _create_event(client, auth_headers, biz["id"])
+    etag = client.get(f"/businesses/{biz['id']}", headers=auth_headers).headers["etag"]
+
+    statements = []
+    engine = Engine  # every engine: these endpoints run on the async one
+    listener = lambda conn, cursor, sql, *args: statements.append(sql)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(f"/businesses/{biz['id']}", headers={**auth_headers, "If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert "outreach_events" not in statements[0]
+
+
+def test_detail_missing_business_is_404(client, auth_headers):
+    response = client.get("/businesses/9999", headers={**auth_headers, "If-None-Match": "*"})
+    assert response.status_code == 404
+
+
+def test_list_if_none_match_returns_304_until_a_write(client, auth_headers):
+    _create_business(client, auth_headers, name="Alpha")
+    etag = client.get("/businesses", headers=auth_headers).headers["etag"]
+
+    cached = client.get("/businesses", headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+
+    _create_business(client, auth_headers, name="Beta")
+    fresh = client.get("/businesses", headers={**auth_headers, "If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert len(fresh.json()["items"]) == 2
+    assert fresh.headers["etag"] != etag
+
+
+def test_list_etag_depends_on_normalized_params(client, auth_headers):
+    _create_business(client, auth_headers, name="Alpha")
+
+    def etag(params):
+        return client.get("/businesses", params=params, headers=auth_headers).headers["etag"]
+
+    assert etag({}) != etag({"status": "prospect"})
+    assert etag({"limit": 10}) != etag({"limit": 20})
+    assert etag({"updated_since": "2025-01-01T00:00:00Z"}) == etag(
+        {"updated_since": "2025-01-01T01:00:00+01:00"}
+    )
+
+
+def test_list_last_modified_and_if_modified_since(client, auth_headers):
+    _create_business(client, auth_headers, name="Alpha")
+    response = client.get("/businesses", headers=auth_headers)
+    last_modified = response.headers["last-modified"]
+    assert parsedate_to_datetime(last_modified).replace(microsecond=0) == parsedate_to_datetime(
+        last_modified
+    )
+
+    cached = client.get("/businesses", headers={**auth_headers, "If-Modified-Since": last_modified})
+    assert cached.status_code == 304
+    assert cached.headers["last-modified"] == last_modified
+
+    older = format_datetime(parsedate_to_datetime(last_modified) - timedelta(seconds=1), usegmt=True)
+    assert client.get("/businesses", headers={**auth_headers, "If-Modified-Since": older}).status_code == 200
+
+
+def test_list_last_modified_moves_on_delete(client, auth_headers, db_session):
+    _create_business(client, auth_headers, name="Alpha")
+    beta = _create_business(client, auth_headers, name="Beta")
+    # Backdate the rows so the delete lands in a later second
+    db_session.query(main.BusinessDB).update({"updated_at": datetime(2020, 1, 1)})
+    db_session.commit()
+    before = client.get("/businesses", headers=auth_headers).headers["last-modified"]
+
+    client.delete(f"/businesses/{beta['id']}", headers=auth_headers)
+    response = client.get("/businesses", headers={**auth_headers, "If-Modified-Since": before})
+    assert response.status_code == 200
+    assert [b["name"] for b in response.json()["items"]] == ["Alpha"]
+    assert parsedate_to_datetime(response.headers["last-modified"]) > parsedate_to_datetime(before)
@@ -0,0 +1,117 @@
+"""Tests for GET /businesses/{id}/events and the bounded detail timeline."""
+
+from datetime import datetime
+
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import main
+
+
+def _seed_events(client, auth_headers, n, **kwargs):
+    biz = _create_business(client, auth_headers, **kwargs)
+    events = [
+        _create_event(client, auth_headers, biz["id"], "email_sent" if i % 2 else "call", f"#{i}")
+        for i in range(n)
+    ]
+    return biz, events
+
+
+def test_detail_embeds_latest_events_and_count(client, auth_headers):
+    biz, events = _seed_events(client, auth_headers, 25)
+    data = client.get(f"/businesses/{biz['id']}", headers=auth_headers).json()
+    assert data["event_count"] == 25
+    assert len(data["events"]) == main.DETAIL_EVENTS
+    assert data["events"][0]["id"] == events[-1]["id"]
+
+    data = client.get(f"/businesses/{biz['id']}?events=2", headers=auth_headers).json()
+    assert [e["details"] for e in data["events"]] == ["#24", "#23"]
+
+    data = client.get(f"/businesses/{biz['id']}?events=0", headers=auth_headers).json()
+    assert data["events"] == []
+    assert data["event_count"] == 25
+
+
+def test_detail_without_events(client, auth_headers):
+    biz = _create_business(client, auth_headers)
+    data = client.get(f"/businesses/{biz['id']}", headers=auth_headers).json()
+    assert data["events"] == []
+    assert data["event_count"] == 0
+    assert data["name"] == biz["name"]
+
+
+def test_detail_is_one_round_trip(client, auth_headers):
+    biz, _ = _seed_events(client, auth_headers, 3)
+    statements = []
+    engine = Engine  # every engine: these endpoints run on the async one
+    listener = lambda conn, cursor, sql, *args: statements.append(sql)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(f"/businesses/{biz['id']}", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert response.status_code == 200
+    assert len(response.json()["events"]) == 3
+    assert len(statements) == 1
+
+
+def test_timeline_pages_newest_first(client, auth_headers, db_session):
+    biz, events = _seed_events(client, auth_headers, 7)
+    # Ties on created_at fall back to id
+    for e in events[2:5]:
+        db_session.get(main.OutreachEventDB, e["id"]).created_at = datetime(2030, 1, 1)
+    db_session.commit()
+
+    seen = []
+    params = {"limit": 3}
+    while True:
+        response = client.get(f"/businesses/{biz['id']}/events", params=params, headers=auth_headers)
+        page = response.json()
+        assert len(page["items"]) <= 3
+        seen += [e["id"] for e in page["items"]]
+        if not page["next_cursor"]:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    tied = [e["id"] for e in events[2:5]][::-1]
+    rest = [e["id"] for e in events if e["id"] not in tied][::-1]
+    assert seen == tied + rest
+
+
+def test_timeline_pages_through_undated_events(client, auth_headers, db_session):
+    biz, events = _seed_events(client, auth_headers, 7)
+    for e in events[1::2]:
+        db_session.get(main.OutreachEventDB, e["id"]).created_at = None
+    db_session.commit()
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get(f"/businesses/{biz['id']}/events", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        page = response.json()
+        seen += [e["details"] for e in page["items"]]
+        if not page["next_cursor"]:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert seen == ["#6", "#4", "#2", "#0", "#5", "#3", "#1"]
+    detail = client.get(f"/businesses/{biz['id']}", headers=auth_headers).json()
+    assert [e["details"] for e in detail["events"]] == seen
+
+
+def test_timeline_filters_by_event_type(client, auth_headers):
+    biz, _ = _seed_events(client, auth_headers, 5)
+    rows = client.get(f"/businesses/{biz['id']}/events?event_type=email_sent", headers=auth_headers).json()["items"]
+    assert [e["details"] for e in rows] == ["#3", "#1"]
+
+
+def test_timeline_errors(client, auth_headers):
+    biz = _create_business(client, auth_headers)
+    assert client.get(f"/businesses/{biz['id']}/events", headers=auth_headers).json() == {"items": [], "next_cursor": None}
+    assert client.get("/businesses/9999/events", headers=auth_headers).status_code == 404
+    bad = client.get(f"/businesses/{biz['id']}/events?cursor=e30", headers=auth_headers)
+    assert bad.status_code == 400
+    assert client.get(f"/businesses/{biz['id']}/events").status_code == 401
@@ -0,0 +1,94 @@
+"""Tests for POST /events/batch."""
+
+from unittest.mock import patch
+
+from helpers import assert_no_metric_drift as _assert_no_drift
+from helpers import create_test_business as _create_business
+from sqlalchemy import event
+
+import main
+
+
+def _post(client, auth_headers, items):
+    return client.post("/events/batch", json=items, headers=auth_headers)
+
+
+def test_batch_by_id_and_slug(client, auth_headers):
+    alpha = _create_business(client, auth_headers, name="Alpha")
+    beta = _create_business(client, auth_headers, name="Beta")
+    items = [
+        {"business_id": alpha["id"], "event_type": "call", "details": "one"},
+        {"slug": beta["slug"], "event_type": "email_sent", "created_at": "2024-03-05T10:00:00Z"},
+        {"slug": alpha["slug"], "event_type": "note"},
+    ]
+    response = _post(client, auth_headers, items)
+    assert response.status_code == 200
+    assert response.json() == {"created": 3, "businesses": 2}
+
+    alpha_detail = client.get(f"/businesses/{alpha['id']}", headers=auth_headers).json()
+    assert alpha_detail["event_count"] == 2
+    assert alpha_detail["updated_at"] > alpha["updated_at"]
+    beta_events = client.get(f"/businesses/{beta['id']}/events", headers=auth_headers).json()["items"]
+    assert beta_events[0]["created_at"] == "2024-03-05T10:00:00"
+    _assert_no_drift(client, auth_headers)
+
+
+def test_batch_is_all_or_nothing(client, auth_headers):
+    alpha = _create_business(client, auth_headers, name="Alpha")
+    items = [
+        {"business_id": alpha["id"], "event_type": "call"},
+        {"business_id": 9999, "event_type": "call"},
+        {"slug": "nope", "event_type": "call"},
+    ]
+    response = _post(client, auth_headers, items)
+    assert response.status_code == 422
+    assert [e["index"] for e in response.json()["detail"]] == [1, 2]
+    detail = client.get(f"/businesses/{alpha['id']}", headers=auth_headers).json()
+    assert detail["event_count"] == 0
+
+
+def test_batch_requires_exactly_one_reference(client, auth_headers):
+    alpha = _create_business(client, auth_headers, name="Alpha")
+    both = {"business_id": alpha["id"], "slug": alpha["slug"], "event_type": "call"}
+    neither = {"event_type": "call"}
+    assert _post(client, auth_headers, [both]).status_code == 422
+    assert _post(client, auth_headers, [neither]).status_code == 422
+
+
+def test_batch_uses_set_based_statements(client, auth_headers, db_session):
+    bizs = [_create_business(client, auth_headers, name=f"Biz {n}") for n in range(3)]
+    items = [{"business_id": b["id"], "event_type": "call"} for b in bizs for _ in range(4)]
+
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda conn, cursor, sql, *args: statements.append(sql)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        with patch.object(main, "EVENT_BATCH_CHUNK", 5):
+            response = _post(client, auth_headers, items)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.json() == {"created": 12, "businesses": 3}
+    assert sum(s.startswith("INSERT INTO outreach_events") for s in statements) == 3
+    assert sum(s.startswith("UPDATE businesses") for s in statements) == 1
+    assert sum(s.startswith("SELECT businesses.id, businesses.slug") for s in statements) == 1
+    _assert_no_drift(client, auth_headers)
+
+
+def test_batch_feeds_change_stream_and_pull(client, auth_headers):
+    alpha = _create_business(client, auth_headers, name="Alpha")
+    version = client.get("/sync/pull", headers=auth_headers).json()["version"]
+    start = main._change_broker.last_id
+    _post(client, auth_headers, [{"business_id": alpha["id"], "event_type": "call"}] * 2)
+
+    ops = [m.split("data: ", 1)[1] for m in main._change_broker.since(start)]
+    assert sum('"entity":"event"' in op for op in ops) == 2
+    pulled = client.get(f"/sync/pull?since={version}", headers=auth_headers).json()
+    assert len(pulled["events"]) == 2
+    assert [b["id"] for b in pulled["businesses"]] == [alpha["id"]]
+
+
+def test_batch_empty_and_auth(client, auth_headers):
+    assert _post(client, auth_headers, []).json() == {"created": 0, "businesses": 0}
+    assert client.post("/events/batch", json=[]).status_code == 401
@@ -0,0 +1,75 @@
+"""Tests for GET /export/events."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+
+import main
+
+
+def _seed(client, auth_headers):
+    alpha = _create_business(client, auth_headers, name="Alpha Dental", category="dental")
+    beta = _create_business(client, auth_headers, name="Beta Bakery", category="bakery", status="contacted")
+    first = _create_event(client, auth_headers, alpha["id"], "call", "left voicemail")
+    second = _create_event(client, auth_headers, beta["id"], "email_sent", "pitch")
+    third = _create_event(client, auth_headers, alpha["id"], "email_sent", "follow-up")
+    return alpha, beta, [first, second, third]
+
+
+def test_export_events_joins_business_fields(client, auth_headers):
+    alpha, beta, events = _seed(client, auth_headers)
+    response = client.get("/export/events", headers=auth_headers)
+    assert response.status_code == 200
+    assert "outreach_events.csv" in response.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(r["Event ID"]) for r in rows] == [e["id"] for e in events]
+    assert rows[1]["Business Slug"] == beta["slug"]
+    assert rows[1]["Business Name"] == "Beta Bakery"
+    assert rows[1]["Business Status"] == "contacted"
+    assert rows[1]["Business Category"] == "bakery"
+    assert rows[0]["Details"] == "left voicemail"
+
+
+def test_export_events_filters_by_type(client, auth_headers):
+    _seed(client, auth_headers)
+    response = client.get("/export/events?event_type=email_sent&format=ndjson", headers=auth_headers)
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["business_name"] for r in records] == ["Beta Bakery", "Alpha Dental"]
+    assert {r["event_type"] for r in records} == {"email_sent"}
+
+
+def test_export_events_filters_by_date_range(client, auth_headers, db_session):
+    _, _, events = _seed(client, auth_headers)
+    stamps = [datetime(2025, 1, 1), datetime(2025, 2, 1), datetime(2025, 3, 1)]
+    for event, stamp in zip(events, stamps):
+        db_session.get(main.OutreachEventDB, event["id"]).created_at = stamp
+    db_session.commit()
+
+    response = client.get(
+        "/export/events",
+        params={"since": "2025-02-01T00:00:00Z", "until": "2025-03-01T00:00:00Z", "format": "ndjson"},
+        headers=auth_headers,
+    )
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["id"] for r in records] == [events[1]["id"]]
+
+
+def test_export_events_tsv_gzip(client, auth_headers):
+    _seed(client, auth_headers)
+    response = client.get("/export/events?format=tsv&gzip=true", headers=auth_headers)
+    assert response.headers["content-type"] == "application/gzip"
+    assert "outreach_events.tsv.gz" in response.headers["content-disposition"]
+
+    rows = list(csv.reader(io.StringIO(gzip.decompress(response.content).decode()), delimiter="\t"))
+    assert rows[0][0] == "Event ID"
+    assert len(rows) == 4
+
+
+def test_export_events_requires_auth(client):
+    assert client.get("/export/events").status_code == 401
@@ -5,9 +5,12 @@ Covers: all CSV columns present, field content verification, and special charact
 
 import csv
 import io
+from unittest.mock import patch
 
 from helpers import create_test_business as _create_business
 
+import main as main_mod
+
 
 def test_export_csv_contains_all_columns(client, auth_headers):
     """Header row should have all 19 expected columns."""
@@ -85,3 +88,40 @@ def test_export_csv_multiple_businesses_sorted(client, auth_headers):
     assert rows[1][0] == "Alpha Corp"
     assert rows[2][0] == "Mu Corp"
     assert rows[3][0] == "Zeta Corp"
+
+
+def test_export_csv_large_table_roundtrip(client, auth_headers):
+    client.post(
+        "/sync",
+        json=[{"name": f"Stream Biz {i:03d}", "notes": "x" * 200} for i in range(60)],
+        headers=auth_headers,
+    )
+    with patch.object(main_mod, "EXPORT_FLUSH_BYTES", 2048), \
+            patch.object(main_mod, "EXPORT_BATCH_ROWS", 7):
+        response = client.get("/export/csv", headers=auth_headers)
+
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert len(rows) == 61
+    assert rows[1][0] == "Stream Biz 000"
+    assert rows[-1][0] == "Stream Biz 059"
+
+
+def test_csv_chunks_flush_header_first_and_bound_chunk_size():
+    """The CSV writer emits the header before touching rows, then fixed-size chunks."""
+    pulled = []
+
+    def rows():
+        for i in range(200):
+            pulled.append(i)
+            yield (f"Biz {i}", "y" * 100)
+
+    with patch.object(main_mod, "EXPORT_FLUSH_BYTES", 1024):
+        chunks = main_mod._csv_chunks(["Name", "Notes"], rows())
+        first = next(chunks)
+        assert first == "Name,Notes\r\n"
+        assert pulled == []
+        rest = list(chunks)
+
+    assert len(rest) > 10
+    assert all(len(c) < 1024 + 200 for c in rest)
+    assert "".join(rest).count("\r\n") == 200
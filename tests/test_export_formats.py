@@ -0,0 +1,92 @@
+"""Tests for GET /export filters, formats and gzip compression."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+from helpers import create_test_business as _create_business
+
+
+def _seed(client, auth_headers):
+    _create_business(client, auth_headers, name="Alpha Dental", status="contacted", category="dental", priority="hot")
+    _create_business(client, auth_headers, name="Beta Bakery", status="prospect", category="bakery")
+    _create_business(client, auth_headers, name="Gamma Dental", status="prospect", category="dental", notes="Tab\there")
+
+
+def test_export_filters_match_list_filters(client, auth_headers):
+    _seed(client, auth_headers)
+    response = client.get("/export?category=dental&status=prospect", headers=auth_headers)
+    assert response.status_code == 200
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert [r[0] for r in rows[1:]] == ["Gamma Dental"]
+
+
+def test_export_search_filter(client, auth_headers):
+    _seed(client, auth_headers)
+    response = client.get("/export?search=dental", headers=auth_headers)
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert [r[0] for r in rows[1:]] == ["Alpha Dental", "Gamma Dental"]
+
+
+def test_export_updated_since(client, auth_headers):
+    _seed(client, auth_headers)
+    future = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+    past = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+
+    assert len(client.get("/export", params={"updated_since": future}, headers=auth_headers).text.splitlines()) == 1
+    assert len(client.get("/export", params={"updated_since": past}, headers=auth_headers).text.splitlines()) == 4
+    listing = client.get("/businesses", params={"updated_since": future}, headers=auth_headers).json()["items"]
+    assert listing == []
+
+
+def test_export_tsv(client, auth_headers):
+    _seed(client, auth_headers)
+    response = client.get("/export?format=tsv", headers=auth_headers)
+    assert response.headers["content-type"].startswith("text/tab-separated-values")
+    assert "outreach_export.tsv" in response.headers["content-disposition"]
+
+    rows = list(csv.reader(io.StringIO(response.text), delimiter="\t"))
+    assert rows[0][:2] == ["Name", "Slug"]
+    gamma = next(r for r in rows if r[0] == "Gamma Dental")
+    assert gamma[16] == "Tab\there"
+
+
+def test_export_ndjson(client, auth_headers):
+    _seed(client, auth_headers)
+    response = client.get("/export?format=ndjson&priority=hot", headers=auth_headers)
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert len(records) == 1
+    assert records[0]["name"] == "Alpha Dental"
+    assert records[0]["status"] == "contacted"
+    assert isinstance(records[0]["id"], int)
+    datetime.fromisoformat(records[0]["updated_at"])
+
+
+def test_export_gzip(client, auth_headers):
+    _seed(client, auth_headers)
+    plain = client.get("/export?format=ndjson", headers=auth_headers)
+    compressed = client.get("/export?format=ndjson&gzip=true", headers=auth_headers)
+
+    assert compressed.headers["content-type"] == "application/gzip"
+    assert "outreach_export.ndjson.gz" in compressed.headers["content-disposition"]
+    assert gzip.decompress(compressed.content) == plain.content
+
+
+def test_export_csv_path_accepts_filters_and_gzip(client, auth_headers):
+    _seed(client, auth_headers)
+    response = client.get("/export/csv?category=bakery&gzip=true", headers=auth_headers)
+    rows = list(csv.reader(io.StringIO(gzip.decompress(response.content).decode())))
+    assert [r[0] for r in rows[1:]] == ["Beta Bakery"]
+
+
+def test_export_rejects_unknown_format(client, auth_headers):
+    response = client.get("/export?format=xlsx", headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_export_requires_auth(client):
+    assert client.get("/export").status_code == 401
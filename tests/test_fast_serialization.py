@@ -0,0 +1,65 @@
+"""Tests for the tuple-to-JSON fast path on list, detail and pull responses."""
+
+import json
+from unittest.mock import patch
+
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+from pydantic import TypeAdapter
+
+import main
+
+
+def _seed(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Fast Co", notes="n", website_quality=7)
+    _create_event(client, auth_headers, biz["id"], "call", "first")
+    _create_event(client, auth_headers, biz["id"], "email_sent", "second")
+    return biz
+
+
+def _matches_model(model, content: bytes, **dump_options):
+    """Fast-path bytes must equal what response_model serialization would produce."""
+    adapter = TypeAdapter(model)
+    expected = json.loads(adapter.dump_json(adapter.validate_json(content), **dump_options))
+    return json.loads(content) == expected
+
+
+def test_fast_paths_skip_response_model_serialization(client, auth_headers):
+    biz = _seed(client, auth_headers)
+    with patch("fastapi.routing.serialize_response", side_effect=AssertionError("validated")):
+        assert client.get("/businesses", headers=auth_headers).status_code == 200
+        assert client.get(f"/businesses/{biz['id']}", headers=auth_headers).status_code == 200
+        assert client.get("/sync/pull", headers=auth_headers).status_code == 200
+
+
+def test_list_output_matches_schema(client, auth_headers):
+    _seed(client, auth_headers)
+    for params in ({}, {"fields": "*"}, {"fields": "id,created_at"}):
+        response = client.get("/businesses", params=params, headers=auth_headers)
+        assert _matches_model(main.BusinessPage, response.content, exclude_unset=True)
+
+
+def test_detail_output_matches_schema(client, auth_headers):
+    biz = _seed(client, auth_headers)
+    response = client.get(f"/businesses/{biz['id']}", headers=auth_headers)
+    assert _matches_model(main.BusinessDetail, response.content)
+    data = response.json()
+    assert data["website_quality"] == 7
+    assert [e["details"] for e in data["events"]] == ["second", "first"]
+
+
+def test_pull_output_matches_schema(client, auth_headers):
+    _seed(client, auth_headers)
+    response = client.get("/sync/pull", headers=auth_headers)
+    assert _matches_model(main.SyncPullOut, response.content)
+
+
+def test_openapi_still_documents_response_models(client):
+    paths = client.get("/openapi.json").json()["paths"]
+
+    def schema(path):
+        return json.dumps(paths[path]["get"]["responses"]["200"]["content"]["application/json"]["schema"])
+
+    assert "BusinessPage" in schema("/businesses")
+    assert "BusinessDetail" in schema("/businesses/{business_id}")
+    assert "SyncPullOut" in schema("/sync/pull")
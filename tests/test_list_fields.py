@@ -0,0 +1,81 @@
+"""Tests for ?fields= sparse fieldsets on GET /businesses."""
+
+from helpers import create_test_business as _create_business
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def _seed(client, auth_headers):
+    for n in range(3):
+        _create_business(
+            client, auth_headers, name=f"Dental {n}", status="contacted",
+            notes="long notes " * 50, demo_value_prop="pitch " * 50,
+        )
+
+
+def test_default_list_omits_large_text_columns(client, auth_headers):
+    _seed(client, auth_headers)
+    row = client.get("/businesses", headers=auth_headers).json()["items"][0]
+    assert "notes" not in row
+    assert "demo_value_prop" not in row
+    assert {"id", "name", "slug", "status", "priority", "updated_at"} <= row.keys()
+
+
+def test_fields_selects_only_requested_columns(client, auth_headers):
+    _seed(client, auth_headers)
+    rows = client.get("/businesses?fields=status, name,id,name", headers=auth_headers).json()["items"]
+    assert len(rows) == 3
+    assert all(list(row) == ["id", "name", "status"] for row in rows)
+
+
+def test_fields_star_returns_everything(client, auth_headers):
+    _seed(client, auth_headers)
+    row = client.get("/businesses?fields=*", headers=auth_headers).json()["items"][0]
+    assert row["notes"].startswith("long notes")
+    assert row["demo_value_prop"].startswith("pitch")
+
+
+def test_fields_rejects_unknown_names(client, auth_headers):
+    response = client.get("/businesses?fields=name,password", headers=auth_headers)
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+    assert client.get("/businesses?fields=,", headers=auth_headers).status_code == 400
+
+
+def test_fields_with_keyset_pagination_and_search(client, auth_headers):
+    _seed(client, auth_headers)
+    first = client.get("/businesses?fields=name&limit=2", headers=auth_headers).json()
+    second = client.get(
+        "/businesses", params={"fields": "name", "limit": 2, "cursor": first["next_cursor"]},
+        headers=auth_headers,
+    ).json()
+    names = [r["name"] for r in first["items"] + second["items"]]
+    assert sorted(names) == ["Dental 0", "Dental 1", "Dental 2"]
+
+    ranked = client.get("/businesses?fields=name&search=dental", headers=auth_headers).json()["items"]
+    assert len(ranked) == 3
+    assert all(list(r) == ["name"] for r in ranked)
+
+
+def test_default_list_does_not_select_text_columns(client, auth_headers):
+    _seed(client, auth_headers)
+    statements = []
+    engine = Engine  # every engine: these endpoints run on the async one
+    listener = lambda conn, cursor, sql, *args: statements.append(sql)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        client.get("/businesses", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    select_sql = next(s for s in statements if "FROM businesses" in s and "LIMIT" in s)
+    assert "businesses.notes" not in select_sql
+    assert "businesses.demo_value_prop" not in select_sql
+
+
+def test_fields_change_the_list_etag(client, auth_headers):
+    _seed(client, auth_headers)
+    default = client.get("/businesses", headers=auth_headers).headers["etag"]
+    sparse = client.get("/businesses?fields=id,name", headers=auth_headers).headers["etag"]
+    reordered = client.get("/businesses?fields=name,id", headers=auth_headers).headers["etag"]
+    assert default != sparse
+    assert sparse == reordered
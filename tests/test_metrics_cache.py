@@ -0,0 +1,73 @@
+"""Tests for the /metrics response cache and ETag handling."""
+
+from unittest.mock import patch
+
+from helpers import create_test_business as _create_business
+
+import main as main_mod
+
+
+def _counting_rollups():
+    calls = []
+    original = main_mod._metrics_from_rollups
+
+    def wrapper(db):
+        calls.append(1)
+        return original(db)
+
+    return calls, patch.object(main_mod, "_metrics_from_rollups", wrapper)
+
+
+def test_repeat_polls_are_served_from_cache(client, auth_headers):
+    _create_business(client, auth_headers, name="A")
+    calls, patcher = _counting_rollups()
+    with patcher:
+        first = client.get("/metrics", headers=auth_headers)
+        second = client.get("/metrics", headers=auth_headers)
+    assert first.json() == second.json()
+    assert first.json()["total"] == 1
+    assert len(calls) == 1
+
+
+def test_writes_invalidate_cache(client, auth_headers):
+    _create_business(client, auth_headers, name="A")
+    assert client.get("/metrics", headers=auth_headers).json()["total"] == 1
+
+    _create_business(client, auth_headers, name="B")
+    assert client.get("/metrics", headers=auth_headers).json()["total"] == 2
+
+
+def test_ttl_expiry_recomputes(client, auth_headers):
+    calls, patcher = _counting_rollups()
+    with patcher, patch.object(main_mod, "METRICS_CACHE_TTL", 0):
+        client.get("/metrics", headers=auth_headers)
+        client.get("/metrics", headers=auth_headers)
+    assert len(calls) == 2
+
+
+def test_if_none_match_returns_304(client, auth_headers):
+    first = client.get("/metrics", headers=auth_headers)
+    etag = first.headers["ETag"]
+
+    cached = client.get("/metrics", headers={**auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    weak = client.get("/metrics", headers={**auth_headers, "If-None-Match": f"W/{etag}"})
+    assert weak.status_code == 304
+
+
+def test_etag_changes_after_write(client, auth_headers):
+    etag = client.get("/metrics", headers=auth_headers).headers["ETag"]
+    _create_business(client, auth_headers, name="Changes Things")
+
+    response = client.get("/metrics", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["total"] == 1
+
+
+def test_cached_metrics_still_require_auth(client, auth_headers):
+    client.get("/metrics", headers=auth_headers)
+    assert client.get("/metrics").status_code == 401
@@ -112,3 +112,42 @@ def test_metrics_weekly_activity(client, auth_headers):
     assert isinstance(data["weekly_activity"], dict)
     total_weekly = sum(data["weekly_activity"].values())
     assert total_weekly >= 1
+
+
+# --- SQL aggregation ---
+
+def test_metrics_weekly_buckets_match_strftime(client, auth_headers, db_session):
+    """Live SQL week buckets and the daily rollups agree on '%Y-W%W' labels."""
+    from datetime import datetime, timedelta, timezone
+
+    from main import OutreachEventDB
+
+    biz = _create_business(client, auth_headers, name="Bucket Biz")
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    stamps = [now - timedelta(days=d) for d in (0, 1, 9, 20, 40)]
+    stamps.append(now - timedelta(weeks=10))  # outside the 8-week window
+    for ts in stamps:
+        db_session.add(OutreachEventDB(business_id=biz["id"], event_type="call", created_at=ts))
+    db_session.commit()
+    client.post("/admin/metrics/rebuild", headers=auth_headers)
+
+    expected = {}
+    for ts in stamps[:-1]:
+        label = ts.strftime("%Y-W%W")
+        expected[label] = expected.get(label, 0) + 1
+
+    data = client.get("/metrics", headers=auth_headers).json()
+    assert data["weekly_activity"] == expected
+    assert data["total_events"] == len(stamps)
+    assert client.get("/admin/metrics/drift", headers=auth_headers).json()["drifted"] is False
+
+
+def test_metrics_unknown_values_excluded_from_breakdowns(client, auth_headers):
+    _create_business(client, auth_headers, name="A", status="archived", priority="urgent")
+    _create_business(client, auth_headers, name="B", status="prospect", priority="hot")
+
+    data = client.get("/metrics", headers=auth_headers).json()
+    assert data["total"] == 2
+    assert set(data["by_status"]) == {"prospect", "contacted", "responded", "meeting", "closed", "lost"}
+    assert sum(data["by_status"].values()) == 1
+    assert data["by_priority"] == {"hot": 1, "warm": 0, "cold": 0}
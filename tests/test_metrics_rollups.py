@@ -0,0 +1,127 @@
+"""Tests for the incrementally maintained metric rollup tables."""
+
+from unittest.mock import patch
+
+from helpers import assert_no_metric_drift as _assert_no_drift
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+
+import main as main_mod
+
+
+def _metrics(client, auth_headers):
+    return client.get("/metrics", headers=auth_headers).json()
+
+
+def test_rollups_follow_status_and_category_updates(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Mover", category="retail", priority="warm")
+    client.put(
+        f"/businesses/{biz['id']}",
+        json={"status": "meeting", "category": "dining", "priority": "hot"},
+        headers=auth_headers,
+    )
+
+    data = _metrics(client, auth_headers)
+    assert data["by_status"]["prospect"] == 0
+    assert data["by_status"]["meeting"] == 1
+    assert data["by_priority"] == {"hot": 1, "warm": 0, "cold": 0}
+    assert data["by_category"] == {"dining": 1}
+    _assert_no_drift(client, auth_headers)
+
+
+def test_rollups_follow_delete_including_events(client, auth_headers):
+    keep = _create_business(client, auth_headers, name="Keep")
+    gone = _create_business(client, auth_headers, name="Gone", category="retail")
+    _create_event(client, auth_headers, keep["id"], "call")
+    _create_event(client, auth_headers, gone["id"], "call")
+    _create_event(client, auth_headers, gone["id"], "visit")
+
+    client.delete(f"/businesses/{gone['id']}", headers=auth_headers)
+
+    data = _metrics(client, auth_headers)
+    assert data["total"] == 1
+    assert data["total_events"] == 1
+    assert "retail" not in data["by_category"]
+    _assert_no_drift(client, auth_headers)
+
+
+def test_rollups_follow_sync_and_send_email(client, auth_headers):
+    client.post("/sync", json=[{"name": "S1", "priority": "hot"}, {"name": "S2"}], headers=auth_headers)
+    client.post("/sync", json=[{"name": "S1", "status": "responded"}], headers=auth_headers)
+    s2 = client.get("/businesses?search=S2", headers=auth_headers).json()["items"][0]
+    with patch("main._send_smtp_email"):
+        client.post(
+            f"/businesses/{s2['id']}/send-email",
+            json={"to_email": "a@example.com", "subject": "Hi", "body": "Body"},
+            headers=auth_headers,
+        )
+
+    data = _metrics(client, auth_headers)
+    assert data["by_status"]["responded"] == 1
+    assert data["by_status"]["contacted"] == 1
+    assert data["by_status"]["prospect"] == 0
+    assert data["total_events"] == 1
+    _assert_no_drift(client, auth_headers)
+
+
+def test_rollups_survive_concurrent_status_changes(client, auth_headers):
+    """Two PUTs from the same old status: the one that waits for the lock sees the first."""
+    biz = _create_business(client, auth_headers, name="Contested")
+    original = main_mod._next_version
+    raced = []
+
+    def next_version_after_concurrent_put(db):
+        if not raced:
+            raced.append(True)
+            client.put(f"/businesses/{biz['id']}", json={"status": "lost"}, headers=auth_headers)
+        return original(db)
+
+    with patch.object(main_mod, "_next_version", next_version_after_concurrent_put):
+        client.put(f"/businesses/{biz['id']}", json={"status": "contacted"}, headers=auth_headers)
+
+    by_status = _metrics(client, auth_headers)["by_status"]
+    assert (by_status["prospect"], by_status["lost"], by_status["contacted"]) == (0, 0, 1)
+    _assert_no_drift(client, auth_headers)
+
+
+def test_send_email_keeps_status_changed_during_the_send(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Busy Inbox")
+
+    def slow_send(*args):
+        client.put(f"/businesses/{biz['id']}", json={"status": "meeting"}, headers=auth_headers)
+
+    with patch("main._send_smtp_email", side_effect=slow_send):
+        client.post(
+            f"/businesses/{biz['id']}/send-email",
+            json={"to_email": "a@example.com", "subject": "Hi", "body": "Body"},
+            headers=auth_headers,
+        )
+
+    assert client.get(f"/businesses/{biz['id']}", headers=auth_headers).json()["status"] == "meeting"
+    assert _metrics(client, auth_headers)["by_status"]["contacted"] == 0
+    _assert_no_drift(client, auth_headers)
+
+
+def test_rebuild_repairs_drifted_rollups(client, auth_headers, db_session):
+    from main import MetricCounterDB
+
+    _create_business(client, auth_headers, name="A", status="contacted")
+    db_session.query(MetricCounterDB).filter(
+        MetricCounterDB.dimension == "status", MetricCounterDB.value == "contacted"
+    ).update({"count": 42})
+    db_session.commit()
+
+    drift = client.get("/admin/metrics/drift", headers=auth_headers).json()
+    assert drift["drifted"] is True
+    assert drift["differences"]["by_status"]["rollup"]["contacted"] == 42
+
+    response = client.post("/admin/metrics/rebuild", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "rebuilt"
+    assert _metrics(client, auth_headers)["by_status"]["contacted"] == 1
+    _assert_no_drift(client, auth_headers)
+
+
+def test_admin_metrics_endpoints_require_auth(client):
+    assert client.get("/admin/metrics/drift").status_code == 401
+    assert client.post("/admin/metrics/rebuild").status_code == 401
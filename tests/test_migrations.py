@@ -0,0 +1,117 @@
+"""Tests for the versioned schema migration runner."""
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+import main as main_mod
+
+LEGACY_SCHEMA = [
+    """CREATE TABLE businesses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name VARCHAR(200) NOT NULL,
+        slug VARCHAR(200) NOT NULL UNIQUE,
+        category VARCHAR(100), demo_url VARCHAR(500),
+        existing_website VARCHAR(500), website_quality INTEGER,
+        priority VARCHAR(20), status VARCHAR(30),
+        contact_name VARCHAR(200), contact_email VARCHAR(200),
+        contact_phone VARCHAR(50), contact_role VARCHAR(100),
+        demo_value_prop TEXT, notes TEXT, portfolio_card_id VARCHAR(100),
+        created_at DATETIME, updated_at DATETIME
+    )""",
+    """CREATE TABLE outreach_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        business_id INTEGER NOT NULL REFERENCES businesses(id),
+        event_type VARCHAR(50) NOT NULL,
+        details TEXT, created_at DATETIME
+    )""",
+]
+
+
+def _legacy_engine():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    with engine.begin() as conn:
+        for ddl in LEGACY_SCHEMA:
+            conn.execute(text(ddl))
+    return engine
+
+
+def test_migrations_upgrade_legacy_schema():
+    engine = _legacy_engine()
+    with patch.object(main_mod, "engine", engine):
+        main_mod._run_migrations()
+
+    inspector = inspect(engine)
+    columns = {c["name"] for c in inspector.get_columns("businesses")}
+    assert {"contact_linkedin", "address", "platform"} <= columns
+
+    biz_indexes = {i["name"] for i in inspector.get_indexes("businesses")}
+    assert {
+        "ix_businesses_status_updated_at",
+        "ix_businesses_priority",
+        "ix_businesses_category",
+    } <= biz_indexes
+    event_indexes = {i["name"] for i in inspector.get_indexes("outreach_events")}
+    assert {
+        "ix_outreach_events_business_id_created_at",
+        "ix_outreach_events_created_at",
+    } <= event_indexes
+
+
+def test_migrations_backfill_row_versions():
+    engine = _legacy_engine()
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO businesses (name, slug) VALUES ('Old', 'old')"))
+    with patch.object(main_mod, "engine", engine):
+        main_mod._run_migrations()
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT row_version FROM businesses")).scalar() == 1
+        assert conn.execute(text("SELECT value FROM row_version_counter")).scalar() == 1
+    indexes = {i["name"] for i in inspect(engine).get_indexes("businesses")}
+    assert "ix_businesses_row_version_id" in indexes
+
+
+def test_migrations_rebuild_events_with_cascade():
+    engine = _legacy_engine()
+    raw = engine.raw_connection()
+    raw.execute("PRAGMA foreign_keys=OFF")  # legacy databases never enforced them
+    raw.execute("INSERT INTO businesses (id, name, slug) VALUES (1, 'Old', 'old')")
+    raw.execute(
+        "INSERT INTO outreach_events (business_id, event_type, created_at) "
+        "VALUES (1, 'call', '2024-01-01'), (99, 'call', '2024-01-01')"
+    )
+    raw.commit()
+    raw.execute("PRAGMA foreign_keys=ON")
+    raw.close()
+    with patch.object(main_mod, "engine", engine):
+        main_mod._run_migrations()
+
+    with engine.begin() as conn:
+        assert conn.execute(text("SELECT business_id FROM outreach_events")).scalars().all() == [1]
+        assert conn.execute(text("SELECT count FROM event_daily_counts")).scalar() == 1
+        conn.execute(text("DELETE FROM businesses WHERE id = 1"))
+        assert conn.execute(text("SELECT count(*) FROM outreach_events")).scalar() == 0
+    event_indexes = {i["name"] for i in inspect(engine).get_indexes("outreach_events")}
+    assert "ix_outreach_events_business_id_created_at" in event_indexes
+
+
+def test_migrations_record_schema_version_once():
+    engine = _legacy_engine()
+    with patch.object(main_mod, "engine", engine):
+        main_mod._run_migrations()
+        main_mod._run_migrations()
+
+    with engine.connect() as conn:
+        versions = conn.execute(
+            text("SELECT version FROM schema_version ORDER BY version")
+        ).scalars().all()
+    assert versions == [v for v, _, _ in main_mod.MIGRATIONS]
+
+
+def test_migrations_noop_on_fresh_schema(client):
+    """The lifespan runs migrations after create_all() without errors."""
+    response = client.get("/health")
+    assert response.status_code == 200
@@ -0,0 +1,82 @@
+"""Tests for keyset (cursor) pagination on GET /businesses."""
+
+from helpers import create_test_business as _create_business
+
+
+def _collect_pages(client, auth_headers, limit, **params):
+    pages = []
+    cursor = None
+    while True:
+        query = {"limit": limit, **params}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/businesses", params=query, headers=auth_headers)
+        assert response.status_code == 200
+        page = response.json()
+        pages.append(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return pages
+
+
+def test_single_page_has_no_next_cursor(client, auth_headers):
+    _create_business(client, auth_headers, name="Only One")
+    response = client.get("/businesses?limit=5", headers=auth_headers)
+    assert response.status_code == 200
+    page = response.json()
+    assert len(page["items"]) == 1
+    assert page["next_cursor"] is None
+
+
+def test_pages_cover_all_rows_without_duplicates(client, auth_headers):
+    for i in range(7):
+        _create_business(client, auth_headers, name=f"Biz {i}")
+
+    pages = _collect_pages(client, auth_headers, limit=3)
+    assert [len(p) for p in pages] == [3, 3, 1]
+
+    ids = [b["id"] for page in pages for b in page]
+    assert len(ids) == len(set(ids)) == 7
+
+
+def test_pagination_keeps_updated_at_desc_order(client, auth_headers):
+    first = _create_business(client, auth_headers, name="First")
+    for i in range(4):
+        _create_business(client, auth_headers, name=f"Middle {i}")
+    client.put(f"/businesses/{first['id']}", json={"notes": "bumped"}, headers=auth_headers)
+
+    pages = _collect_pages(client, auth_headers, limit=2)
+    names = [b["name"] for page in pages for b in page]
+    assert names[0] == "First"
+    assert len(names) == 5
+
+
+def test_pagination_respects_filters(client, auth_headers):
+    for i in range(5):
+        _create_business(client, auth_headers, name=f"Hot {i}", priority="hot")
+    _create_business(client, auth_headers, name="Cold", priority="cold")
+
+    pages = _collect_pages(client, auth_headers, limit=2, priority="hot")
+    names = [b["name"] for page in pages for b in page]
+    assert len(names) == 5
+    assert "Cold" not in names
+
+
+def test_invalid_cursor_rejected(client, auth_headers):
+    response = client.get("/businesses?cursor=not-a-cursor", headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_limit_bounds_validated(client, auth_headers):
+    assert client.get("/businesses?limit=0", headers=auth_headers).status_code == 422
+    assert client.get("/businesses?limit=100000", headers=auth_headers).status_code == 422
+
+
+def test_bare_list_etags_no_longer_match(client, auth_headers):
+    _create_business(client, auth_headers, name="Only One")
+    etag = client.get("/businesses", headers=auth_headers).headers["etag"]
+    bare_list_etag = etag.replace('W/"p', 'W/"l', 1)
+    response = client.get("/businesses", headers={**auth_headers, "If-None-Match": bare_list_etag})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["name"] == "Only One"
@@ -0,0 +1,110 @@
+"""Tests for the instrumented connection pool, warm-up and GET /admin/pool."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import database
+import main
+
+
+def _engine(tmp_path, **overrides):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        connect_args={"check_same_thread": False},
+        **{**database.POOL_OPTIONS, **overrides},
+    )
+
+
+def test_pool_settings_applied_to_both_engines():
+    for engine in (database.engine, database.async_engine):
+        pool = engine.pool
+        assert isinstance(pool, (database.InstrumentedQueuePool, database.InstrumentedAsyncQueuePool))
+        assert pool.size() == database.POOL_SIZE
+        assert pool.timeout() == database.POOL_TIMEOUT
+        assert pool._recycle == database.POOL_RECYCLE
+        assert pool._pre_ping == database.POOL_PRE_PING
+    assert database.ASYNC_POOL_OPTIONS["pool_use_lifo"] is database.POOL_USE_LIFO
+
+
+def test_status_counts_in_use_and_overflow(tmp_path):
+    engine = _engine(tmp_path, pool_size=1, max_overflow=1)
+    first, second = engine.connect(), engine.connect()
+    status = database.pool_status(engine)
+    assert status["pool"] == "InstrumentedQueuePool"
+    assert (status["open"], status["in_use"], status["idle"], status["overflow"]) == (2, 2, 0, 1)
+    first.close()
+    second.close()
+    status = database.pool_status(engine)
+    assert (status["open"], status["in_use"], status["idle"], status["overflow"]) == (1, 0, 1, 0)
+    assert status["checkout_wait"]["count"] == 2
+    engine.dispose()
+
+
+def test_checkout_timeouts_are_recorded(tmp_path):
+    engine = _engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+    held = engine.connect()
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    held.close()
+    waits = database.pool_status(engine)["checkout_wait"]
+    assert waits["count"] == 2
+    assert waits["timeouts"] == 1
+    assert waits["max_ms"] >= 50
+    engine.dispose()
+
+
+def test_warm_pool_leaves_connections_idle(tmp_path):
+    engine = _engine(tmp_path, pool_size=3)
+    database.warm_pool(engine, 3)
+    status = database.pool_status(engine)
+    assert (status["open"], status["idle"], status["in_use"]) == (3, 3, 0)
+    engine.dispose()
+
+
+def test_warm_pool_is_capped_at_pool_size(tmp_path):
+    # Warming past size + overflow used to time out and abort startup
+    engine = _engine(tmp_path, pool_size=1, max_overflow=0, pool_timeout=0.05)
+    database.warm_pool(engine, 2)
+    status = database.pool_status(engine)
+    assert (status["open"], status["idle"]) == (1, 1)
+    assert status["checkout_wait"]["timeouts"] == 0
+    engine.dispose()
+
+
+def test_warm_async_pool(tmp_path):
+    async def run():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            **{**database.ASYNC_POOL_OPTIONS, "pool_size": 2},
+        )
+        await database.warm_async_pool(engine, 2)
+        status = database.pool_status(engine)
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+        await engine.dispose()
+        return status
+
+    status = asyncio.run(run())
+    assert status["pool"] == "InstrumentedAsyncQueuePool"
+    assert (status["open"], status["idle"]) == (2, 2)
+
+
+def test_pool_endpoint(client, auth_headers, tmp_path):
+    engine = _engine(tmp_path)
+    with patch.object(main, "engine", engine):
+        engine.connect().close()
+        data = client.get("/admin/pool", headers=auth_headers).json()
+    assert data["sync"]["size"] == database.POOL_SIZE
+    assert data["sync"]["max_overflow"] == database.POOL_MAX_OVERFLOW
+    assert data["sync"]["checkout_wait"]["count"] == 1
+    assert data["async"] == {"pool": "NullPool"}  # the test suite's async engine
+    engine.dispose()
+
+
+def test_pool_endpoint_requires_auth(client):
+    assert client.get("/admin/pool").status_code == 401
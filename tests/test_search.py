@@ -0,0 +1,93 @@
+"""Tests for the full-text `search` filter on GET /businesses."""
+
+from helpers import create_test_business as _create_business
+
+
+def _search(client, auth_headers, term, **params):
+    response = client.get(
+        "/businesses", params={"search": term, **params}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    return response
+
+
+def test_search_matches_word_prefix(client, auth_headers):
+    _create_business(client, auth_headers, name="Alpha Industries")
+    _create_business(client, auth_headers, name="Beta Corp")
+    names = [b["name"] for b in _search(client, auth_headers, "alph").json()["items"]]
+    assert names == ["Alpha Industries"]
+
+
+def test_search_covers_contact_and_value_prop_fields(client, auth_headers):
+    _create_business(client, auth_headers, name="A", contact_name="Priya Raman")
+    _create_business(client, auth_headers, name="B", category="orthodontics")
+    _create_business(client, auth_headers, name="C", demo_value_prop="Online booking widget")
+    _create_business(client, auth_headers, name="D")
+
+    assert [b["name"] for b in _search(client, auth_headers, "raman").json()["items"]] == ["A"]
+    assert [b["name"] for b in _search(client, auth_headers, "orthodont").json()["items"]] == ["B"]
+    assert [b["name"] for b in _search(client, auth_headers, "booking").json()["items"]] == ["C"]
+
+
+def test_search_requires_all_terms(client, auth_headers):
+    _create_business(client, auth_headers, name="Blue Door Bakery")
+    _create_business(client, auth_headers, name="Blue Ridge Dental")
+    names = [b["name"] for b in _search(client, auth_headers, "blue dental").json()["items"]]
+    assert names == ["Blue Ridge Dental"]
+
+
+def test_search_ranks_name_matches_first(client, auth_headers):
+    _create_business(client, auth_headers, name="Corner Shop", notes="Sells pottery supplies")
+    _create_business(client, auth_headers, name="Pottery Barn Studio")
+    names = [b["name"] for b in _search(client, auth_headers, "pottery").json()["items"]]
+    assert names == ["Pottery Barn Studio", "Corner Shop"]
+
+
+def test_search_index_follows_updates(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Old Name Co")
+    client.put(f"/businesses/{biz['id']}", json={"name": "Fresh Title Co"}, headers=auth_headers)
+
+    assert _search(client, auth_headers, "old").json()["items"] == []
+    assert [b["id"] for b in _search(client, auth_headers, "fresh").json()["items"]] == [biz["id"]]
+
+
+def test_search_index_follows_sync_and_delete(client, auth_headers):
+    client.post("/sync", json=[{"name": "Synced Florist"}], headers=auth_headers)
+    results = _search(client, auth_headers, "florist").json()["items"]
+    assert len(results) == 1
+
+    client.delete(f"/businesses/{results[0]['id']}", headers=auth_headers)
+    assert _search(client, auth_headers, "florist").json()["items"] == []
+
+
+def test_search_results_paginate(client, auth_headers):
+    for i in range(5):
+        _create_business(client, auth_headers, name=f"Plumbing Pro {i}")
+
+    first = _search(client, auth_headers, "plumbing", limit=3).json()
+    second = _search(client, auth_headers, "plumbing", limit=3, cursor=first["next_cursor"]).json()
+    assert second["next_cursor"] is None
+
+    ids = [b["id"] for b in first["items"] + second["items"]]
+    assert len(ids) == len(set(ids)) == 5
+
+
+def test_search_ignores_fts_syntax(client, auth_headers):
+    _create_business(client, auth_headers, name="Quote Test")
+    names = [b["name"] for b in _search(client, auth_headers, '"quote" (test*').json()["items"]]
+    assert names == ["Quote Test"]
+
+
+def test_search_without_word_tokens_matches_nothing(client, auth_headers):
+    _create_business(client, auth_headers, name="Punct A")
+    _create_business(client, auth_headers, name="Punct B")
+    assert _search(client, auth_headers, "!!!").json()["items"] == []
+    assert len(_search(client, auth_headers, "   ").json()["items"]) == 2
+    deleted = client.request("DELETE", "/businesses?search=!!!", headers=auth_headers).json()
+    assert deleted == {"deleted": 0}
+
+
+def test_punctuation_search_gets_its_own_etag(client, auth_headers):
+    _create_business(client, auth_headers, name="Punct C")
+    plain = client.get("/businesses", headers=auth_headers).headers["ETag"]
+    assert _search(client, auth_headers, "!!!").headers["ETag"] != plain
@@ -0,0 +1,71 @@
+"""Tests for GET /businesses/suggest typeahead lookup."""
+
+from helpers import create_test_business as _create_business
+
+import main as main_mod
+
+
+def _suggest(client, auth_headers, q, **params):
+    response = client.get(
+        "/businesses/suggest", params={"q": q, **params}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_suggest_returns_compact_rows(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Acme Plumbing", notes="long notes")
+    results = _suggest(client, auth_headers, "acme")
+    assert results == [
+        {"id": biz["id"], "name": "Acme Plumbing", "slug": "acme-plumbing", "status": "prospect"}
+    ]
+
+
+def test_suggest_matches_partial_and_misspelled_input(client, auth_headers):
+    _create_business(client, auth_headers, name="Riverside Veterinary Clinic")
+    _create_business(client, auth_headers, name="Downtown Bakery")
+
+    assert [r["name"] for r in _suggest(client, auth_headers, "rivers")] == [
+        "Riverside Veterinary Clinic"
+    ]
+    assert [r["name"] for r in _suggest(client, auth_headers, "veterinery")] == [
+        "Riverside Veterinary Clinic"
+    ]
+
+
+def test_suggest_ranks_closer_names_first(client, auth_headers):
+    _create_business(client, auth_headers, name="Smith Dental Group")
+    _create_business(client, auth_headers, name="Smithfield Auto")
+    results = _suggest(client, auth_headers, "smith dental")
+    assert results[0]["name"] == "Smith Dental Group"
+
+
+def test_suggest_respects_limit(client, auth_headers):
+    for i in range(5):
+        _create_business(client, auth_headers, name=f"Cafe Number {i}")
+    assert len(_suggest(client, auth_headers, "cafe", limit=3)) == 3
+
+
+def test_suggest_tracks_renames_and_deletes(client, auth_headers):
+    biz = _create_business(client, auth_headers, name="Harbor Books")
+    assert _suggest(client, auth_headers, "harbor")
+
+    client.put(f"/businesses/{biz['id']}", json={"name": "Lighthouse Books"}, headers=auth_headers)
+    assert _suggest(client, auth_headers, "harbor") == []
+    assert _suggest(client, auth_headers, "lighthouse")[0]["id"] == biz["id"]
+
+    client.delete(f"/businesses/{biz['id']}", headers=auth_headers)
+    assert _suggest(client, auth_headers, "lighthouse") == []
+
+
+def test_suggest_requires_query_and_auth(client, auth_headers):
+    assert client.get("/businesses/suggest", headers=auth_headers).status_code == 422
+    assert client.get("/businesses/suggest?q=x").status_code == 401
+
+
+def test_trigram_index_scores_by_query_coverage():
+    index = main_mod.TrigramIndex()
+    index._add(1, "Maple Street Diner", "maple-street-diner", "prospect")
+    index._add(2, "Oak Diner", "oak-diner", "contacted")
+    results = index.search("maple diner", limit=5)
+    assert [r["id"] for r in results] == [1, 2]
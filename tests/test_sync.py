@@ -14,7 +14,7 @@ def test_sync_creates_new_businesses(client, auth_headers):
     assert data["total"] == 2
 
     # Verify they exist
-    listing = client.get("/businesses", headers=auth_headers).json()
+    listing = client.get("/businesses", headers=auth_headers).json()["items"]
     assert len(listing) == 2
 
 
@@ -52,7 +52,7 @@ def test_sync_custom_slug(client, auth_headers):
     assert response.status_code == 200
     assert response.json()["created"] == 1
 
-    listing = client.get("/businesses", headers=auth_headers).json()
+    listing = client.get("/businesses", headers=auth_headers).json()["items"]
     assert listing[0]["slug"] == "custom-slug-here"
 
 
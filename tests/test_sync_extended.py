@@ -4,9 +4,16 @@ Covers: slug generation with special characters, update only non-empty fields,
 sync preserves existing data, and validation.
 """
 
+from unittest.mock import patch
+
+from helpers import assert_no_metric_drift as _assert_no_drift
+from sqlalchemy import event
+
+import main as main_mod
+
 
 def _list_businesses(client, auth_headers):
-    return client.get("/businesses", headers=auth_headers).json()
+    return client.get("/businesses?fields=*", headers=auth_headers).json()["items"]
 
 
 # --- Slug Generation ---
@@ -107,3 +114,90 @@ def test_sync_idempotent_on_repeated_calls(client, auth_headers):
     # Should still be only 1 business
     listing = _list_businesses(client, auth_headers)
     assert len(listing) == 1
+
+
+# --- Set-based upsert ---
+
+def test_sync_statement_count_independent_of_batch_size(client, auth_headers, db_session):
+    """A sync resolves slugs and writes rows per chunk, not per item."""
+    test_engine = db_session.get_bind()
+    client.post("/sync", json=[{"name": f"Biz {i}"} for i in range(10)], headers=auth_headers)
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith(("SELECT", "INSERT", "UPDATE")):
+            statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", count)
+    try:
+        items = [{"name": f"Biz {i}", "priority": "hot"} for i in range(200)]
+        response = client.post("/sync", json=items, headers=auth_headers)
+    finally:
+        event.remove(test_engine, "before_cursor_execute", count)
+
+    assert response.json() == {"created": 190, "updated": 10, "total": 200}
+    assert len(statements) <= 4
+
+
+def test_sync_across_chunks(client, auth_headers):
+    client.post("/businesses", json={"name": "Chunk 3", "notes": "keep"}, headers=auth_headers)
+    items = [{"name": f"Chunk {i}", "category": "chunked"} for i in range(7)]
+    with patch.object(main_mod, "SYNC_CHUNK_SIZE", 3):
+        response = client.post("/sync", json=items, headers=auth_headers)
+
+    assert response.json() == {"created": 6, "updated": 1, "total": 7}
+    listing = _list_businesses(client, auth_headers)
+    assert len(listing) == 7
+    assert all(b["category"] == "chunked" for b in listing)
+    assert next(b for b in listing if b["name"] == "Chunk 3")["notes"] == "keep"
+
+
+def test_sync_duplicate_slugs_in_one_payload(client, auth_headers):
+    """Later items merge onto earlier ones with the same slug."""
+    items = [
+        {"name": "Dup Co", "category": "first", "notes": "from first"},
+        {"name": "Dup Co", "category": "second"},
+    ]
+    response = client.post("/sync", json=items, headers=auth_headers)
+    assert response.json() == {"created": 1, "updated": 1, "total": 2}
+
+    listing = _list_businesses(client, auth_headers)
+    assert len(listing) == 1
+    assert listing[0]["category"] == "second"
+    assert listing[0]["notes"] == "from first"
+
+
+def test_sync_update_ignores_unset_defaults(client, auth_headers):
+    """Fields left at their defaults (priority="cold") don't overwrite existing values."""
+    client.post("/businesses", json={"name": "Warm Lead", "priority": "warm"}, headers=auth_headers)
+    client.post("/sync", json=[{"name": "Warm Lead", "notes": "synced"}], headers=auth_headers)
+
+    biz = _list_businesses(client, auth_headers)[0]
+    assert biz["priority"] == "warm"
+    assert biz["notes"] == "synced"
+
+
+def test_sync_keeps_write_committed_while_it_waits_for_the_lock(client, auth_headers):
+    """A write that commits just before the sync takes the version lock is not reverted."""
+    biz = client.post("/businesses", json={"name": "Racer"}, headers=auth_headers).json()
+    original = main_mod._next_version
+    raced = []
+
+    def next_version_after_concurrent_put(db):
+        if not raced:
+            raced.append(True)
+            client.put(
+                f"/businesses/{biz['id']}",
+                json={"status": "contacted", "notes": "from put"},
+                headers=auth_headers,
+            )
+        return original(db)
+
+    with patch.object(main_mod, "_next_version", next_version_after_concurrent_put):
+        response = client.post("/sync", json=[{"name": "Racer", "priority": "hot"}], headers=auth_headers)
+
+    assert response.json()["updated"] == 1
+    row = _list_businesses(client, auth_headers)[0]
+    assert (row["status"], row["notes"], row["priority"]) == ("contacted", "from put", "hot")
+    _assert_no_drift(client, auth_headers)
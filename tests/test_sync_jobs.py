@@ -0,0 +1,119 @@
+"""Tests for asynchronous sync jobs (POST /sync?async=true)."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import main as main_mod
+
+
+def _submit(client, auth_headers, items):
+    response = client.post("/sync?async=true", json=items, headers=auth_headers)
+    assert response.status_code == 202
+    return response.json()
+
+
+def _job(client, auth_headers, job_id):
+    response = client.get(f"/sync/jobs/{job_id}", headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_async_sync_returns_job_immediately(client, auth_headers):
+    job = _submit(client, auth_headers, [{"name": "Queued A"}, {"name": "Queued B"}])
+    assert job["status"] == "pending"
+    assert job["total"] == 2
+
+    # Nothing is written until a worker runs the job
+    assert client.get("/businesses", headers=auth_headers).json()["items"] == []
+    status = _job(client, auth_headers, job["job_id"])
+    assert status["status"] == "pending"
+    assert status["processed"] == 0
+
+
+def test_worker_processes_job_in_chunks(client, auth_headers, db_session):
+    client.post("/businesses", json={"name": "Job 0", "notes": "keep"}, headers=auth_headers)
+    items = [{"name": f"Job {i}", "priority": "warm"} for i in range(5)]
+    job = _submit(client, auth_headers, items)
+
+    with patch.object(main_mod, "SYNC_CHUNK_SIZE", 2):
+        assert main_mod.run_sync_jobs(db_session) == 1
+
+    status = _job(client, auth_headers, job["job_id"])
+    assert status["status"] == "done"
+    assert status["processed"] == 5
+    assert status["created"] == 4
+    assert status["updated"] == 1
+    assert status["finished_at"] is not None
+
+    listing = client.get("/businesses?fields=name,notes", headers=auth_headers).json()["items"]
+    assert len(listing) == 5
+    assert next(b for b in listing if b["name"] == "Job 0")["notes"] == "keep"
+
+
+def test_worker_resumes_abandoned_job(client, auth_headers, db_session):
+    """A job left 'running' by a dead worker is reclaimed and resumes at its offset."""
+    job = _submit(client, auth_headers, [{"name": f"Resume {i}"} for i in range(4)])
+    stale = datetime.now(timezone.utc) - timedelta(seconds=main_mod.SYNC_JOB_STALE_SECONDS + 60)
+    db_session.query(main_mod.SyncJobDB).filter_by(id=job["job_id"]).update(
+        {"status": "running", "processed": 2, "created": 2, "updated_at": stale}
+    )
+    db_session.commit()
+
+    assert main_mod.run_sync_jobs(db_session) == 1
+    status = _job(client, auth_headers, job["job_id"])
+    assert status["status"] == "done"
+    assert status["created"] == 4
+    names = {b["name"] for b in client.get("/businesses", headers=auth_headers).json()["items"]}
+    assert names == {"Resume 2", "Resume 3"}
+
+
+def test_worker_skips_jobs_running_elsewhere(client, auth_headers, db_session):
+    job = _submit(client, auth_headers, [{"name": "Busy"}])
+    db_session.query(main_mod.SyncJobDB).filter_by(id=job["job_id"]).update(
+        {"status": "running", "updated_at": datetime.now(timezone.utc)}
+    )
+    db_session.commit()
+    assert main_mod.run_sync_jobs(db_session) == 0
+
+
+def test_failed_job_reports_error(client, auth_headers, db_session):
+    job = _submit(client, auth_headers, [{"name": "Broken"}])
+    with patch.object(main_mod, "_commit_sync_chunk", side_effect=RuntimeError("disk full")):
+        main_mod.run_sync_jobs(db_session)
+
+    status = _job(client, auth_headers, job["job_id"])
+    assert status["status"] == "failed"
+    assert status["errors"] == [{"line": 1, "error": "disk full"}]
+
+
+def test_failed_job_keeps_earlier_row_errors(client, auth_headers, db_session):
+    job = _submit(client, auth_headers, [{"name": f"Partial {i}"} for i in range(4)])
+    calls = []
+
+    def commit_then_fail(db, index, batch, report):
+        calls.append(index)
+        if len(calls) > 1:
+            raise RuntimeError("disk full")
+        report["errors"].append({"line": 2, "error": "value too long"})
+        report["error_count"] += 1
+
+    with patch.object(main_mod, "SYNC_CHUNK_SIZE", 2), \
+            patch.object(main_mod, "_commit_sync_chunk", side_effect=commit_then_fail):
+        main_mod.run_sync_jobs(db_session)
+
+    status = _job(client, auth_headers, job["job_id"])
+    assert status["status"] == "failed"
+    assert status["error_count"] == 1
+    assert status["errors"] == [
+        {"line": 2, "error": "value too long"},
+        {"line": 3, "error": "disk full"},
+    ]
+
+
+def test_unknown_job_404(client, auth_headers):
+    response = client.get("/sync/jobs/999", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_sync_job_requires_auth(client):
+    assert client.get("/sync/jobs/1").status_code == 401
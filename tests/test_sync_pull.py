@@ -0,0 +1,120 @@
+"""Tests for GET /sync/pull delta sync."""
+
+import pytest
+from helpers import create_test_business as _create_business
+from helpers import create_test_event as _create_event
+
+import main
+
+
+def _pull_all(client, auth_headers, since=0, limit=100):
+    """Follow next_cursor to the end; returns (pages, version)."""
+    pages = []
+    params = {"since": since, "limit": limit}
+    while True:
+        page = client.get("/sync/pull", params=params, headers=auth_headers).json()
+        pages.append(page)
+        if not page["next_cursor"]:
+            return pages, page["version"]
+        params = {"cursor": page["next_cursor"], "limit": limit}
+
+
+def _ids(pages, stage):
+    return [row["id"] for page in pages for row in page[stage]]
+
+
+def test_pull_from_zero_returns_everything(client, auth_headers):
+    alpha = _create_business(client, auth_headers, name="Alpha")
+    beta = _create_business(client, auth_headers, name="Beta")
+    event = _create_event(client, auth_headers, alpha["id"])
+
+    pages, version = _pull_all(client, auth_headers)
+    assert len(pages) == 1
+    assert sorted(_ids(pages, "businesses")) == [alpha["id"], beta["id"]]
+    assert _ids(pages, "events") == [event["id"]]
+    assert pages[0]["tombstones"] == []
+    assert version == max(row["row_version"] for row in pages[0]["businesses"])
+
+
+def test_pull_since_returns_only_deltas(client, auth_headers):
+    alpha = _create_business(client, auth_headers, name="Alpha")
+    beta = _create_business(client, auth_headers, name="Beta")
+    _, version = _pull_all(client, auth_headers)
+
+    client.put(f"/businesses/{alpha['id']}", json={"status": "contacted"}, headers=auth_headers)
+    client.delete(f"/businesses/{beta['id']}", headers=auth_headers)
+
+    pages, new_version = _pull_all(client, auth_headers, since=version)
+    assert new_version > version
+    assert [(b["id"], b["status"]) for b in pages[0]["businesses"]] == [(alpha["id"], "contacted")]
+    tombstones = pages[0]["tombstones"]
+    assert [(t["entity"], t["entity_id"]) for t in tombstones] == [("business", beta["id"])]
+
+    pages, _ = _pull_all(client, auth_headers, since=new_version)
+    assert pages[0]["businesses"] == pages[0]["tombstones"] == []
+
+
+def test_pull_pages_across_stages(client, auth_headers):
+    bizs = [_create_business(client, auth_headers, name=f"Biz {n}") for n in range(3)]
+    events = [_create_event(client, auth_headers, b["id"]) for b in bizs[:2]]
+    client.delete(f"/businesses/{bizs[2]['id']}", headers=auth_headers)
+
+    pages, _ = _pull_all(client, auth_headers, limit=2)
+    assert all(
+        len(p["businesses"]) + len(p["events"]) + len(p["tombstones"]) <= 2 for p in pages
+    )
+    assert sorted(_ids(pages, "businesses")) == sorted(b["id"] for b in bizs[:2])
+    assert sorted(_ids(pages, "events")) == sorted(e["id"] for e in events)
+    assert len(_ids(pages, "tombstones")) == 1
+
+
+def test_pull_snapshot_defers_writes_made_while_paging(client, auth_headers):
+    bizs = [_create_business(client, auth_headers, name=f"Biz {n}") for n in range(3)]
+    first = client.get("/sync/pull", params={"limit": 1}, headers=auth_headers).json()
+    assert first["businesses"][0]["id"] == bizs[0]["id"]
+
+    # Touch a row the remaining pages would have returned
+    client.put(f"/businesses/{bizs[2]['id']}", json={"notes": "moved"}, headers=auth_headers)
+    rest = [first]
+    params = {"cursor": first["next_cursor"], "limit": 1}
+    while params:
+        page = client.get("/sync/pull", params=params, headers=auth_headers).json()
+        rest.append(page)
+        params = {"cursor": page["next_cursor"], "limit": 1} if page["next_cursor"] else None
+    assert _ids(rest, "businesses") == [bizs[0]["id"], bizs[1]["id"]]
+
+    pages, _ = _pull_all(client, auth_headers, since=first["version"])
+    assert [(b["id"], b["notes"]) for b in pages[0]["businesses"]] == [(bizs[2]["id"], "moved")]
+
+
+def test_sync_upsert_bumps_row_version(client, auth_headers):
+    _create_business(client, auth_headers, name="Synced")
+    _, version = _pull_all(client, auth_headers)
+    client.post("/sync", json=[{"name": "Synced", "priority": "hot"}], headers=auth_headers)
+
+    pages, _ = _pull_all(client, auth_headers, since=version)
+    assert [b["priority"] for b in pages[0]["businesses"]] == ["hot"]
+
+
+def test_pull_rejects_bad_cursor(client, auth_headers):
+    response = client.get("/sync/pull?cursor=e30", headers=auth_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("state", [
+    {"f": 0, "u": 5, "s": 0, "a": 5},
+    {"f": "x", "u": "y", "s": 0, "a": None},
+    {"f": 0, "u": 5, "s": -1, "a": None},
+    {"f": 0, "u": 5, "s": 3, "a": None},
+    {"f": 0, "u": 5, "s": True, "a": None},
+    {"f": 0, "u": 5, "s": 0, "a": [1, "2"]},
+])
+def test_pull_rejects_malformed_cursor_fields(client, auth_headers, state):
+    cursor = main._encode_cursor(state)
+    response = client.get("/sync/pull", params={"cursor": cursor}, headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_pull_requires_auth(client):
+    assert client.get("/sync/pull").status_code == 401
@@ -0,0 +1,92 @@
+"""Tests for POST /sync/stream NDJSON ingestion."""
+
+import json
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
+
+import main as main_mod
+
+NDJSON = {"Content-Type": "application/x-ndjson"}
+
+
+def _post_ndjson(client, auth_headers, lines, **params):
+    body = "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines)
+    return client.post(
+        "/sync/stream", content=body.encode(), params=params, headers={**auth_headers, **NDJSON}
+    )
+
+
+def test_stream_creates_and_updates_in_chunks(client, auth_headers):
+    client.post("/businesses", json={"name": "Row 1"}, headers=auth_headers)
+    lines = [{"name": f"Row {i}", "category": "streamed"} for i in range(5)]
+
+    response = _post_ndjson(client, auth_headers, lines, chunk_size=2)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 4
+    assert data["updated"] == 1
+    assert data["total"] == 5
+    assert [(c["first_line"], c["last_line"]) for c in data["chunks"]] == [(1, 2), (3, 4), (5, 5)]
+    assert data["error_count"] == 0
+
+    listing = client.get("/businesses?category=streamed", headers=auth_headers).json()["items"]
+    assert len(listing) == 5
+
+
+def test_stream_reports_bad_lines_and_keeps_going(client, auth_headers):
+    lines = [
+        {"name": "Good A"},
+        "{not json",
+        "",
+        {"category": "missing name"},
+        {"name": "Good B"},
+    ]
+    data = _post_ndjson(client, auth_headers, lines).json()
+    assert data["created"] == 2
+    assert data["error_count"] == 2
+    assert [e["line"] for e in data["errors"]] == [2, 4]
+    assert data["errors"][1]["error"].startswith("name:")
+
+
+def test_stream_isolates_rows_rejected_by_database(client, auth_headers):
+    original = main_mod._sync_chunk
+
+    def flaky(db, items):
+        if any(item.name == "Boom" for item in items):
+            raise OperationalError("INSERT", {}, Exception("value too long"))
+        return original(db, items)
+
+    lines = [{"name": "Before"}, {"name": "Boom"}, {"name": "After"}]
+    with patch.object(main_mod, "_sync_chunk", flaky):
+        data = _post_ndjson(client, auth_headers, lines, chunk_size=10).json()
+
+    assert data["created"] == 2
+    assert data["chunks"][0]["failed"] == 1
+    assert data["errors"] == [{"line": 2, "error": "value too long"}]
+    names = {b["name"] for b in client.get("/businesses", headers=auth_headers).json()["items"]}
+    assert names == {"Before", "After"}
+
+
+def test_stream_accepts_trailing_newline_and_crlf(client, auth_headers):
+    body = b'{"name": "Crlf A"}\r\n{"name": "Crlf B"}\r\n'
+    response = client.post("/sync/stream", content=body, headers={**auth_headers, **NDJSON})
+    assert response.json()["created"] == 2
+
+
+def test_stream_rejects_other_content_types(client, auth_headers):
+    response = client.post("/sync/stream", json=[{"name": "X"}], headers=auth_headers)
+    assert response.status_code == 415
+
+
+def test_stream_requires_auth(client):
+    response = client.post("/sync/stream", content=b'{"name": "X"}', headers=NDJSON)
+    assert response.status_code == 401
+
+
+def test_stream_chunk_size_stays_under_bind_parameter_limit(client, auth_headers):
+    assert main_mod.MAX_SYNC_CHUNK_SIZE * len(main_mod._UPSERT_COLUMNS) <= 32767
+    too_big = _post_ndjson(client, auth_headers, [{"name": "X"}], chunk_size=main_mod.MAX_SYNC_CHUNK_SIZE + 1)
+    assert too_big.status_code == 422
+    largest = _post_ndjson(client, auth_headers, [{"name": "X"}], chunk_size=main_mod.MAX_SYNC_CHUNK_SIZE)
+    assert largest.json()["created"] == 1